@@ -1,23 +1,23 @@
-from importlib.metadata import PackageNotFoundError, version
-
-try:
-    __version__ = version("liron_utils")
-except PackageNotFoundError:  # package not installed (e.g., running from a source checkout)
-    __version__ = "0.0.0"
-
-# Import all submodules
-from . import (
-    files,
-    graphics,
-    machine_learning,
-    manim_animations,
-    pure_python,
-    signal_processing,
-    symbolic_math,
-    time,
-    uncertainties_math,
-    web,
-)
+import typing
+
+# `time` stays eager: it is cheap, and its TIME/TIME_STR constants capture the interpreter start time.
+from . import time
+from .pure_python.imports import lazy_import
+
+if typing.TYPE_CHECKING:
+    from . import (
+        files,
+        graphics,
+        machine_learning,
+        manim_animations,
+        pure_python,
+        signal_processing,
+        symbolic_math,
+        uncertainties_math,
+        web,
+    )
+
+    __version__: str
 
 __all__ = [
     "__version__",
@@ -32,3 +32,22 @@ __all__ = [
     "web",
     "manim_animations",
 ]
+
+# Submodules are imported on first attribute access (PEP 562), so e.g. `liron_utils.pure_python.parallel_map`
+# doesn't pay for matplotlib/scipy/sklearn/sympy at startup.
+_getattr_submodule, __dir__ = lazy_import(__name__, submodules=[s for s in __all__ if s != "__version__"])
+
+
+def __getattr__(name: str) -> typing.Any:
+    if name == "__version__":  # importlib.metadata alone costs tens of milliseconds
+        from importlib.metadata import (  # pylint: disable=import-outside-toplevel
+            PackageNotFoundError,
+            version,
+        )
+
+        try:
+            globals()["__version__"] = version("liron_utils")
+        except PackageNotFoundError:  # package not installed (e.g., running from a source checkout)
+            globals()["__version__"] = "0.0.0"
+        return globals()["__version__"]
+    return _getattr_submodule(name)
@@ -2,14 +2,18 @@
 
 import os
 import sys
+import typing
 
-from .csv import *
-from .docx import *
-from .files import *
-from .json import *
-from .pdf import *
+from ..pure_python.imports import lazy_import
 
-__all__ = [s for s in dir() if not s.startswith("_")]
+if typing.TYPE_CHECKING:
+    from .csv import *
+    from .docx import *
+    from .files import *
+    from .json import *
+    from .pdf import *
+
+__getattr__, __dir__ = lazy_import(__name__, star_submodules=["csv", "docx", "files", "json", "pdf"])
 
 try:
     _main_file = sys.modules["__main__"].__file__
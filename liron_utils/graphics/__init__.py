@@ -1,5 +1,16 @@
 # flake8: noqa: F401
 
+import typing
+
+from ..pure_python.imports import lazy_import
 from .common import COLORS, get_pixel_color, get_savefig_file_name, hex2rgb, rgb2hex
+from .export import ExportResult, save_figs
+
+if typing.TYPE_CHECKING:
+    from . import mpl, plotly
+
+__all__ = ["COLORS", "ExportResult", "get_pixel_color", "get_savefig_file_name", "hex2rgb", "rgb2hex", "save_figs"]
 
-__all__ = ["COLORS", "get_pixel_color", "get_savefig_file_name", "hex2rgb", "rgb2hex"]
+# The backends are only imported on first access, so their import-time side effects
+# (`update_rc_params()`, `register_templates()`) don't run for code that never plots.
+__getattr__, __dir__ = lazy_import(__name__, submodules=["mpl", "plotly"])
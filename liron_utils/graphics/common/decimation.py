@@ -0,0 +1,81 @@
+import typing
+
+import numpy as np
+
+_Array1D = np.ndarray[tuple[int], np.dtype[typing.Any]]
+_IndexArray = np.ndarray[tuple[int], np.dtype[np.intp]]
+
+POINTS_PER_PIXEL = 4  # M4: the first, min, max and last sample of every pixel column
+
+
+def can_decimate(x: typing.Any, y: typing.Any) -> bool:
+    """Whether ``(x, y)`` is a line :func:`m4_indices` can decimate: 1D, numeric x sorted ascending.
+
+    Args:
+        x: x-axis data.
+        y: y-axis data.
+
+    Returns:
+        True if both are 1D arrays of the same length, and ``x`` is real and non-decreasing.
+    """
+    if not (isinstance(x, np.ndarray) and isinstance(y, np.ndarray)):
+        return False
+    if x.ndim != 1 or y.shape != x.shape or not np.issubdtype(x.dtype, np.number) or np.iscomplexobj(x):
+        return False
+    return bool(np.all(x[1:] >= x[:-1]))
+
+
+def _bin_extremes(y: _Array1D, num_bins: int) -> _IndexArray:
+    """Sorted, unique indices of the first, min, max and last sample of ``num_bins`` equal-count bins of ``y``."""
+    n = len(y)
+    size = -(-n // num_bins)  # samples per bin
+    num_full = n // size
+    starts = np.arange(num_full) * size
+    bins = y[: num_full * size].reshape(num_full, size)  # a view; argmin/argmax don't copy the data
+    idx = [starts, starts + bins.argmin(axis=1), starts + bins.argmax(axis=1), starts + size - 1]
+    if num_full * size < n:  # shorter last bin
+        tail = y[num_full * size :]
+        tail_idx = num_full * size + np.array([0, tail.argmin(), tail.argmax(), len(tail) - 1])
+        idx = [np.append(i, j) for i, j in zip(idx, tail_idx)]
+    out = np.sort(np.stack(idx, axis=1), axis=1).ravel()
+    return typing.cast(_IndexArray, out[np.r_[True, out[1:] != out[:-1]]])
+
+
+def m4_indices(
+    x: _Array1D,
+    y: _Array1D,
+    num_pixels: int,
+    x_range: tuple[float, float] | None = None,
+) -> _IndexArray:
+    """Indices of the samples to draw for a line ``num_pixels`` pixels wide (M4 decimation).
+
+    The samples within ``x_range`` are split into ``num_pixels`` bins of equal sample
+    count (equal width for uniformly sampled ``x``), and each bin keeps its first, min,
+    max and last sample. At most 4 points per pixel are drawn, and since each pixel column
+    keeps its extremes, the rasterized line shows the same peaks as the full one.
+
+    Args:
+        x: 1D x data, sorted ascending (see :func:`can_decimate`).
+        y: 1D y data, same length as ``x``.
+        num_pixels: Width of the plotting area, in pixels.
+        x_range: Visible ``(x_min, x_max)``; None draws all of ``x``. One sample beyond
+            each edge is kept, so the line reaches the edges of the plotting area.
+
+    Returns:
+        Sorted sample indices, e.g. ``x[idx], y[idx]``.
+
+    Example:
+        >>> t = np.linspace(0, 1, 50_000_000)
+        >>> idx = m4_indices(t, np.sin(2 * np.pi * 440 * t), num_pixels=1000)
+        >>> len(idx)
+        4000
+    """
+    start, stop = 0, len(x)
+    if x_range is not None:
+        x_min, x_max = sorted(x_range)
+        start = max(0, int(np.searchsorted(x, x_min, side="left")) - 1)
+        stop = min(len(x), int(np.searchsorted(x, x_max, side="right")) + 1)
+    num_bins = max(1, int(num_pixels))
+    if stop - start <= POINTS_PER_PIXEL * num_bins:
+        return np.arange(start, stop)
+    return start + _bin_extremes(typing.cast(_Array1D, y[start:stop]), num_bins)
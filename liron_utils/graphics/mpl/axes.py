@@ -30,6 +30,23 @@ _P = typing.ParamSpec("_P")
 _Array = np.ndarray[typing.Any, np.dtype[typing.Any]]
 
 
+def _per_axis_params(vec_params: dict[str, typing.Any], num_axes: int) -> Sequence[dict[str, typing.Any]]:
+    """Split ``vec_params`` into one kwargs mapping per axis (see :meth:`_Axes._vectorize`).
+
+    Args:
+        vec_params: Per-call kwargs.
+        num_axes: Number of axes.
+
+    Returns:
+        Per-axis rows of ``vec_params`` if its list-valued entries all have length
+        ``num_axes``, else ``vec_params`` itself for every axis.
+    """
+    params = dl_to_ld(vec_params, lazy=True)  # a view: rows are only built for the axes that read them
+    if params is None or len(params) != num_axes:
+        return [vec_params] * num_axes
+    return params
+
+
 def _extract_layout_padding(fig_kw: dict[str, typing.Any]) -> list[typing.Any]:
     """Pop layout padding keys from ``fig_kw`` and return them in fixed order.
 
@@ -499,8 +516,11 @@ class _Axes:
                 **subplot_kw,
             )
 
-    def __getitem__(self, item: typing.Any) -> "_Axes":
-        """Return a deep-copied ``_Axes`` whose ``axs`` is sliced by ``item``.
+    def __getitem__(self, item: typing.Any) -> typing.Self:
+        """Return a view of the axes sliced by ``item``.
+
+        The view is a shallow copy: it shares ``self.fig`` and the matplotlib axes
+        themselves, so plotting on it draws on this figure, and nothing is copied.
 
         Args:
             item: Anything accepted by ``np.ndarray.__getitem__`` on ``self.axs``.
@@ -508,7 +528,7 @@ class _Axes:
         Returns:
             A new ``_Axes`` sharing ``self.fig`` but holding the sliced axes array.
         """
-        out = copy.deepcopy(self)
+        out = copy.copy(self)
         out.axs = np.atleast_2d(self.axs[item])
         return out
 
@@ -524,45 +544,48 @@ class _Axes:
         with the per-axis slice of ``vec_params``; results are collected into a
         matching object-dtype ndarray.
 
+        The decorator and the wrapper it returns are ``functools.partial`` objects rather
+        than fresh closures, since plotting methods build them anew on every call.
+
         Args:
             ax: Optional single axis to bind ``func`` to.
-            **vec_params: Per-call kwargs. List-valued entries are de-interleaved
-                (via ``dl_to_ld``) to one mapping per axis; scalar entries are broadcast.
+            **vec_params: Per-call kwargs. List-valued entries with one value per axis are
+                split between the axes (column-major); otherwise all of them are broadcast.
 
         Returns:
             A decorator wrapping ``func`` into a callable that returns an object-dtype
             ndarray of per-axis results.
         """
+        return functools.partial(self._bind_vectorized, ax, vec_params)
 
-        def decorator(func: Callable[..., _R]) -> Callable[..., _Array]:
-            @functools.wraps(func)
-            def wrapper(*args: typing.Any, **kwargs: typing.Any) -> _Array:
-                if ax is not None:
-                    return typing.cast(_Array, func(ax, *args, **vec_params, **kwargs))
-
-                m, n = self.axs.shape
-
-                params_list = dl_to_ld(vec_params)
-                if params_list is None or len(params_list) != m * n:
-                    params_list = list(np.repeat(typing.cast(typing.Any, vec_params), m * n))
-
-                out: _Array = np.empty((m, n), dtype=object)
-
-                for i in range(m):
-                    for j in range(n):
-                        if isinstance(self.axs[i, j], Axes_plt):
-                            out[i, j] = func(
-                                self.axs[i, j],
-                                *args,
-                                **params_list[j * m + i],
-                                **kwargs,
-                            )
-
-                return out
-
-            return wrapper
-
-        return decorator
+    def _bind_vectorized(
+        self,
+        ax: Axes_plt | None,
+        vec_params: dict[str, typing.Any],
+        func: Callable[..., _R],
+    ) -> Callable[..., _Array]:
+        """The decorator returned by :meth:`_vectorize`."""
+        return functools.partial(self._call_vectorized, func, ax, vec_params)
+
+    def _call_vectorized(
+        self,
+        func: Callable[..., _R],
+        ax: Axes_plt | None,
+        vec_params: dict[str, typing.Any],
+        *args: typing.Any,
+        **kwargs: typing.Any,
+    ) -> _Array:
+        """The wrapper returned by :meth:`_vectorize`'s decorator."""
+        if ax is not None:
+            return typing.cast(_Array, func(ax, *args, **vec_params, **kwargs))
+
+        axs = self.axs.ravel(order="F")
+        params_list = _per_axis_params(vec_params, axs.size)
+        out: _Array = np.empty(axs.size, dtype=object)
+        for k, ax_k in enumerate(axs):
+            if isinstance(ax_k, Axes_plt):
+                out[k] = func(ax_k, *args, **params_list[k], **kwargs)
+        return out.reshape(self.axs.shape, order="F")
 
     def _merge_kwargs(
         self,
@@ -577,18 +600,13 @@ class _Axes:
             **kwargs: Caller-supplied overrides applied on top of the defaults.
 
         Returns:
-            A decorator wrapping ``func`` so each call uses the merged kwargs.
+            A decorator binding the merged kwargs to ``func`` (``functools.partial``).
         """
-
-        def decorator(func: Callable[_P, _R]) -> Callable[_P, _R]:
-            @functools.wraps(func)
-            def wrapper(*args: _P.args, **outer_kwargs: _P.kwargs) -> _R:  # pylint: disable=unused-argument
-                kwargs_merged = merge_kwargs(**{key: kwargs})[key]
-                return func(*args, **kwargs_merged)
-
-            return wrapper
-
-        return decorator
+        kwargs_merged = merge_kwargs(**{key: kwargs})[key]
+        return typing.cast(
+            Callable[[Callable[_P, _R]], Callable[_P, _R]],
+            functools.partial(functools.partial, **kwargs_merged),
+        )
 
     def draw_xy_lines(self, **xy_lines_kw: typing.Any) -> None:
         """Draw bold ``x=0`` and ``y=0`` lines on each axis to highlight the origin.
@@ -14,6 +14,7 @@ from matplotlib.figure import Figure
 
 from ...signal_processing.base import interp1
 from ...uncertainties_math import to_numpy
+from ..common.decimation import can_decimate, m4_indices
 from ..common.fitting import curve_fit_confidence_band, curve_fit_prep_data
 from ..common.spectra import (
     fft_data,
@@ -45,6 +46,39 @@ _Array = np.ndarray[typing.Any, np.dtype[typing.Any]]
 #   - PyWavelet.dwt (wavelet transform) and plot_wavelet
 
 
+def _pixel_width(ax: Axes_plt) -> int:
+    """Width of ``ax``'s plotting area, in pixels at the larger of the figure and ``savefig.dpi`` resolutions.
+
+    A ``dpi=`` passed to ``savefig`` itself is not known here; saving above both resolutions
+    draws fewer than 4 points per output pixel.
+    """
+    fig_dpi = ax.figure.dpi
+    savefig_dpi = matplotlib.rcParams["savefig.dpi"]
+    dpi = fig_dpi if savefig_dpi == "figure" else max(fig_dpi, float(savefig_dpi))
+    return max(1, int(ax.get_window_extent().width * dpi / fig_dpi))
+
+
+def _plot_decimated(ax: Axes_plt, x: _Array1D, y: _Array1D, **plot_kw: typing.Any) -> list[typing.Any]:
+    """``ax.plot(x, y)`` M4-decimated to the axes' width, re-decimated whenever its x-limits change.
+
+    The full ``x``/``y`` stay referenced by the ``xlim_changed`` callback, so zooming in
+    brings back the samples dropped at the outer zoom level. The decimated line keeps
+    the endpoints and the global extremes, so autoscaling sees the full data limits.
+    """
+    idx = m4_indices(x, y, _pixel_width(ax))
+    lines = ax.plot(x[idx], y[idx], **plot_kw)
+
+    def redecimate(ax: Axes_plt) -> None:
+        if lines[0].axes is None:  # the line was removed
+            ax.callbacks.disconnect(cid)
+            return
+        idx = m4_indices(x, y, _pixel_width(ax), x_range=ax.get_xlim())
+        lines[0].set_data(x[idx], y[idx])
+
+    cid = ax.callbacks.connect("xlim_changed", redecimate)
+    return lines
+
+
 class Axes(_Axes):
 
     def plot(
@@ -52,6 +86,8 @@ class Axes(_Axes):
         x: _Vec[_N],
         y: _Vec[_N] | None = None,
         z: _Vec[_N] | None = None,
+        *,
+        decimate: bool = False,
         **plot_kw: typing.Any,
     ) -> _Array:
         """Plot 2D curve y=f(x) (or 3D when z is given) on each axis of the grid.
@@ -61,6 +97,10 @@ class Axes(_Axes):
                 x-axis becomes range(len(x)).
             y: 1D y-axis data of length N.
             z: 1D z-axis data of length N for 3D plots.
+            decimate: Draw at most 4 samples per horizontal pixel (the first, min, max
+                and last of each pixel column, so peaks are kept), and redo it from the full
+                data on zoom/pan. For very long 2D lines (e.g. audio) with x sorted
+                ascending; other data is plotted as is.
             **plot_kw: Forwarded to matplotlib.axes.Axes.plot.
 
         Returns:
@@ -76,6 +116,10 @@ class Axes(_Axes):
             z: _Vec[_N] | None = None,
             **plot_kw: typing.Any,
         ) -> list[typing.Any]:
+            if decimate and z is None:
+                x_full, y_full = (np.arange(len(x)), x) if y is None else (x, y)
+                if can_decimate(x_full, y_full):
+                    return _plot_decimated(ax, x_full, y_full, **plot_kw)
             args: list[_Vec[_N]] = [x]
             if y is not None:
                 args += [y]
@@ -191,6 +235,8 @@ class Axes(_Axes):
         y: _Vec[_N] | None = None,
         xerr: _Vec[_N] | None = None,
         yerr: _Vec[_N] | None = None,
+        *,
+        decimate: bool = False,
         **errorbar_kw: typing.Any,
     ) -> _Array:
         """Plot y=f(x) with error bars on each axis.
@@ -204,6 +250,9 @@ class Axes(_Axes):
             y: 1D y-axis data of length N. May also be an uncertainties array.
             xerr: 1D errors in x, length N.
             yerr: 1D errors in y, length N.
+            decimate: Keep at most 4 points per horizontal pixel, as ``plot(decimate=True)``
+                does. The error bars are not redrawn on zoom/pan, so this is a one-time
+                decimation to the axes' current width.
             **errorbar_kw: Forwarded to matplotlib.axes.Axes.errorbar.
 
         Returns:
@@ -228,6 +277,14 @@ class Axes(_Axes):
             x, xerr = typing.cast(tuple[_Vec[_N], _Vec[_N] | None], to_numpy(x, xerr))
             y, yerr = typing.cast(tuple[_Vec[_N], _Vec[_N] | None], to_numpy(y, yerr))
 
+            if decimate and can_decimate(x, y):
+                idx = m4_indices(x, y, _pixel_width(ax))
+                x, y = typing.cast(_Vec[_N], x[idx]), typing.cast(_Vec[_N], y[idx])
+                xerr, yerr = (  # (N,) or (2, N) errors
+                    typing.cast(_Vec[_N], err[..., idx]) if err is not None and np.ndim(err) > 0 else err
+                    for err in (xerr, yerr)
+                )
+
             return ax.errorbar(x, y, xerr=xerr, yerr=yerr, **errorbar_kw)
 
         return _plot_errorbar()
@@ -384,7 +441,7 @@ class Axes(_Axes):
             curve_fit_plot_kw: dict[str, typing.Any] | None = None,
             **errorbar_kw: typing.Any,
         ) -> None:
-            errorbar_kw = {"label": "Data", "zorder": -1} | errorbar_kw
+            errorbar_kw = typing.cast(dict[str, typing.Any], {"label": "Data", "zorder": -1}) | errorbar_kw
 
             if curve_fit_plot_kw is None:
                 curve_fit_plot_kw = {}
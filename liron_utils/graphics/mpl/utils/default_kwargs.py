@@ -1,3 +1,4 @@
+import functools
 import typing
 
 from scipy.signal import windows
@@ -79,6 +80,12 @@ def update_kwargs(key: str | None = None, **kwargs: typing.Any) -> type[DefaultK
     return DefaultKwargs
 
 
+@functools.cache
+def _defaults(key: str) -> _FuncDefaultKwargs:
+    """``DefaultKwargs[key.upper()]``, cached (:func:`update_kwargs` updates these dicts in place)."""
+    return typing.cast(_FuncDefaultKwargs, DefaultKwargs[key.upper()])
+
+
 def merge_kwargs(**kwargs: typing.Any) -> dict[str, typing.Any]:
     """Merge each provided kwargs dict with its ``DefaultKwargs`` counterpart.
 
@@ -92,10 +99,4 @@ def merge_kwargs(**kwargs: typing.Any) -> dict[str, typing.Any]:
     Returns:
         Dict with the same keys as ``kwargs``, each mapped to the merged dict.
     """
-    result: dict[str, typing.Any] = {}
-    for key in kwargs:  # pylint: disable=consider-using-dict-items
-        value = kwargs[key]
-        if value is None:
-            value = {}
-        result[key] = DefaultKwargs[key.upper()] | value
-    return result
+    return {key: _defaults(key) | (value or {}) for key, value in kwargs.items()}
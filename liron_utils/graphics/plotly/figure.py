@@ -9,6 +9,7 @@ from plotly.subplots import make_subplots
 from ...signal_processing.base import interp1
 from ...uncertainties_math import to_numpy
 from ..common import COLORS
+from ..common.decimation import can_decimate, m4_indices
 from ..common.files import get_savefig_file_name
 from ..common.fitting import curve_fit_confidence_band, curve_fit_prep_data
 from ..common.spectra import (
@@ -26,6 +27,20 @@ _SpanRange = int | tuple[int, int]
 _SpecRow = list[dict[str, typing.Any] | None]
 _Array1D = np.ndarray[tuple[int], np.dtype[typing.Any]]
 
+WEBGL_THRESHOLD = 100_000  # default points per trace from which Figure draws lines/markers with WebGL
+
+
+def _as_array(values: typing.Any) -> typing.Any:
+    """``values`` as an ndarray if numeric, else unchanged.
+
+    Plotly serializes numeric ndarrays as base64 typed arrays (``{"dtype": "f8", "bdata": ...}``),
+    but lists as JSON numbers, which take ~2.5x the bytes and much longer to write and parse.
+    """
+    if values is None or isinstance(values, np.ndarray):
+        return values
+    arr = np.asarray(values)
+    return arr if arr.dtype.kind in "biuf" else values
+
 
 def _as_range(value: _SpanRange) -> tuple[int, int]:
     """Promote a single int row/col index to a 0-based half-open ``(start, end)`` range."""
@@ -90,6 +105,7 @@ class Figure(go.Figure):
         shared_xaxes: bool = False,
         shared_yaxes: bool = False,
         specs: list[_SpecRow] | None = None,
+        webgl_threshold: int | None = WEBGL_THRESHOLD,
         **make_subplots_kw: typing.Any,
     ) -> None:
         """Create a figure holding an ``nrows × ncols`` subplot grid.
@@ -103,6 +119,10 @@ class Figure(go.Figure):
             shared_xaxes: Share x-axes across subplots (forwarded to ``make_subplots``).
             shared_yaxes: Share y-axes across subplots (forwarded to ``make_subplots``).
             specs: Explicit ``make_subplots`` specs grid; overrides ``span_layout``.
+            webgl_threshold: Number of points from which ``plot``, ``plot_errorbar`` and
+                ``plot_filled_error`` create ``go.Scattergl`` (WebGL) traces instead of
+                ``go.Scatter`` (SVG), which becomes unusable above ~100k points. None
+                always uses ``go.Scatter``.
             **make_subplots_kw: Forwarded to ``plotly.subplots.make_subplots``
                 (``subplot_titles``, ``row_heights``, ``column_widths``,
                 ``horizontal_spacing``, ...).
@@ -126,6 +146,24 @@ class Figure(go.Figure):
         # row=/col= addressing on this subclass instance fails.
         self._grid_ref = base._grid_ref
         self._grid_str = base._grid_str
+        self._webgl_threshold = webgl_threshold
+
+    def _scatter(self, x: typing.Any, y: typing.Any, **scatter_kw: typing.Any) -> go.Scatter | go.Scattergl:
+        """A 2D scatter trace: ``go.Scattergl`` from ``webgl_threshold`` points on, else ``go.Scatter``.
+
+        Numeric data is passed as ndarrays, so it is written as base64 typed arrays.
+        """
+        x, y = _as_array(x), _as_array(y)
+        num_points = len(x) if x is not None else len(y) if y is not None else 0
+        use_webgl = self._webgl_threshold is not None and num_points >= self._webgl_threshold
+        return (go.Scattergl if use_webgl else go.Scatter)(x=x, y=y, **scatter_kw)
+
+    def _subplot_width(self, row: int, col: int) -> int:
+        """Approximate width of subplot ``(row, col)``, in pixels (layout or template width × x-domain)."""
+        width = self.layout.width or self.layout.template.layout.width or 700  # 700: plotly's default
+        subplot = self.get_subplot(row, col)
+        x_domain = subplot.xaxis.domain if subplot is not None and hasattr(subplot, "xaxis") else (0, 1)
+        return max(1, int(width * (x_domain[1] - x_domain[0])))
 
     def save(self, file_name: str | None = None, **write_kw: typing.Any) -> str:
         """Save the figure to disk, dispatching on the file extension.
@@ -161,6 +199,7 @@ class Figure(go.Figure):
         *,
         row: int = 1,
         col: int = 1,
+        decimate: bool | int = False,
         **scatter_kw: typing.Any,
     ) -> "Figure":
         """Add a 2D line trace (or 3D when ``z`` is given).
@@ -173,19 +212,29 @@ class Figure(go.Figure):
                 ``"scene"`` subplot).
             row: Target subplot row (1-based).
             col: Target subplot column (1-based).
-            **scatter_kw: Forwarded to ``go.Scatter`` / ``go.Scatter3d``.
+            decimate: Keep at most 4 samples per horizontal pixel of the subplot (the
+                first, min, max and last of each pixel column, so peaks are kept). ``True``
+                takes the width from the layout (or template); an int gives it in pixels.
+                The decimation is static: zooming in the browser doesn't bring back samples,
+                so pass a larger width to keep detail. Applies to 2D lines with x sorted
+                ascending; other data is plotted as is.
+            **scatter_kw: Forwarded to ``go.Scatter`` / ``go.Scattergl`` / ``go.Scatter3d``.
 
         Returns:
             self (chainable).
         """
         if y is None:
             x, y = typing.cast(_Array1D, np.arange(len(x))), x
+        if decimate is not False and z is None and can_decimate(x, y):
+            num_pixels = self._subplot_width(row, col) if decimate is True else int(decimate)
+            idx = m4_indices(x, y, num_pixels)
+            x, y = typing.cast(_Array1D, x[idx]), typing.cast(_Array1D, y[idx])
         scatter_kw = {"mode": "lines"} | scatter_kw
         trace: typing.Any
         if z is not None:
-            trace = go.Scatter3d(x=x, y=y, z=z, **scatter_kw)
+            trace = go.Scatter3d(x=_as_array(x), y=_as_array(y), z=_as_array(z), **scatter_kw)
         else:
-            trace = go.Scatter(x=x, y=y, **scatter_kw)
+            trace = self._scatter(x, y, **scatter_kw)
         self.add_trace(trace, row=row, col=col)
         return self
 
@@ -388,7 +437,7 @@ class Figure(go.Figure):
             yerr: 1D errors in y. Ignored if ``y`` is an uncertainties array.
             row: Target subplot row (1-based).
             col: Target subplot column (1-based).
-            **scatter_kw: Forwarded to ``go.Scatter``.
+            **scatter_kw: Forwarded to ``go.Scatter`` / ``go.Scattergl``.
 
         Returns:
             self (chainable).
@@ -402,11 +451,11 @@ class Figure(go.Figure):
 
         scatter_kw = {"mode": "markers", "marker": {"size": 8}} | scatter_kw
         error_bar_style = {"type": "data", "color": COLORS.RED_E, "thickness": 1.4}
-        trace = go.Scatter(
-            x=x,
-            y=y,
-            error_x=error_bar_style | {"array": xerr} if xerr is not None else None,
-            error_y=error_bar_style | {"array": yerr} if yerr is not None else None,
+        trace = self._scatter(
+            x,
+            y,
+            error_x=error_bar_style | {"array": _as_array(xerr)} if xerr is not None else None,
+            error_y=error_bar_style | {"array": _as_array(yerr)} if yerr is not None else None,
             **scatter_kw,
         )
         self.add_trace(trace, row=row, col=col)
@@ -438,7 +487,7 @@ class Figure(go.Figure):
             y_high: 1D upper bound; required when ``y`` is None.
             row: Target subplot row (1-based).
             col: Target subplot column (1-based).
-            **scatter_kw: Forwarded to the upper (filled) ``go.Scatter``.
+            **scatter_kw: Forwarded to the upper (filled) ``go.Scatter`` / ``go.Scattergl``.
 
         Returns:
             self (chainable).
@@ -458,11 +507,11 @@ class Figure(go.Figure):
 
         fillcolor = scatter_kw.pop("fillcolor", "rgba(187, 187, 187, 0.4)")  # LIGHT_GRAY at 0.4 alpha
         band_style = {"mode": "lines", "line": {"width": 0}, "hoverinfo": "skip"}
-        self.add_trace(go.Scatter(x=x, y=y_low, showlegend=False, **band_style), row=row, col=col)
+        self.add_trace(self._scatter(x, y_low, showlegend=False, **band_style), row=row, col=col)
         self.add_trace(
-            go.Scatter(
-                x=x,
-                y=y_high,
+            self._scatter(
+                x,
+                y_high,
                 fill="tonexty",
                 fillcolor=fillcolor,
                 showlegend=scatter_kw.pop("showlegend", False),
@@ -1,16 +1,37 @@
 # flake8: noqa: F401, F403
 
-from .base import *
-from .decorators import *
-from .dicts import *
-from .docstring import *
-from .imports import *
-from .logs import *
-from .os import *
-from .parallel import *
-from .prints import *
+import typing
 
-# from .pip import *
-from .progress_bar import *
+from .imports import lazy_import
 
-__all__ = [s for s in dir() if not s.startswith("_")]
+if typing.TYPE_CHECKING:
+    from .base import *
+    from .decorators import *
+    from .dicts import *
+    from .docstring import *
+    from .imports import *
+    from .logs import *
+    from .os import *
+    from .parallel import *
+    from .prints import *
+
+    # from .pip import *
+    from .progress_bar import *
+    from .telemetry import *
+
+__getattr__, __dir__ = lazy_import(
+    __name__,
+    star_submodules=[
+        "base",
+        "decorators",
+        "dicts",
+        "docstring",
+        "imports",
+        "logs",
+        "os",
+        "parallel",
+        "prints",
+        "progress_bar",
+        "telemetry",
+    ],
+)
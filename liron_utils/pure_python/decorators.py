@@ -1,4 +1,16 @@
+import collections
+import contextlib
+import functools
+import hashlib
+import inspect
+import os
+import pickle
+import re
+import sys
+import threading
+import types
 import typing
+from collections.abc import Callable
 
 
 def decorate_repr(cls: type) -> type:
@@ -18,3 +30,267 @@ def decorate_repr(cls: type) -> type:
 
     cls.__repr__ = _repr  # type: ignore[method-assign,assignment]
     return cls
+
+
+_P = typing.ParamSpec("_P")
+_R = typing.TypeVar("_R")
+
+DISK_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "liron_utils")
+
+
+def _update_hash(h: "hashlib._Hash", obj: typing.Any) -> None:
+    """Feed ``obj`` into ``h``: ndarrays by their raw buffer, containers recursively, anything else pickled."""
+    np = sys.modules.get("numpy")  # an ndarray implies numpy was imported; don't import it otherwise
+    if np is not None and isinstance(obj, np.ndarray) and not obj.dtype.hasobject:
+        h.update(f"ndarray:{obj.dtype.descr}:{obj.shape}".encode())  # descr keeps structured field names
+        h.update(np.ascontiguousarray(obj).data)  # no pickling, and no copy if already contiguous
+    elif isinstance(obj, bytes):
+        h.update(f"bytes:{len(obj)}:".encode())
+        h.update(obj)
+    elif obj is None or isinstance(obj, (str, int, float, complex)):  # bool is an int
+        h.update(f"{type(obj).__name__}:{obj!r};".encode())
+    elif isinstance(obj, (tuple, list)):
+        h.update(f"{type(obj).__name__}:{len(obj)}:".encode())
+        for item in obj:
+            _update_hash(h, item)
+    elif isinstance(obj, dict):
+        h.update(f"dict:{len(obj)}:".encode())
+        for key, value in obj.items():
+            _update_hash(h, key)
+            _update_hash(h, value)
+    else:
+        h.update(pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+def hash_value(obj: typing.Any) -> str:
+    """Hash ``obj`` by value, as :func:`hash_args` hashes arguments.
+
+    Args:
+        obj: NumPy arrays, bytes, scalars, and lists/tuples/dicts of those; anything else is pickled.
+
+    Returns:
+        A hex digest.
+    """
+    h = hashlib.sha256()  # hardware-accelerated on most CPUs: ~2.5x faster than blake2b on large buffers
+    _update_hash(h, obj)
+    return h.hexdigest()[:32]
+
+
+def _hash_bound(signature: inspect.Signature, args: tuple[typing.Any, ...], kwargs: dict[str, typing.Any]) -> str:
+    """:func:`hash_args`, given the (precomputed) signature of the called function."""
+    bound = signature.bind(*args, **kwargs)
+    bound.apply_defaults()
+    return hash_value(bound.arguments)
+
+
+def hash_args(func: Callable[..., typing.Any], *args: typing.Any, **kwargs: typing.Any) -> str:
+    """Hash a call of ``func``, so that calls with equal arguments (defaults filled in) collide.
+
+    NumPy arrays are hashed by dtype, shape and raw buffer, which is much faster than
+    pickling them.
+
+    Args:
+        func: The called function.
+        *args: Positional arguments of the call.
+        **kwargs: Keyword arguments of the call.
+
+    Returns:
+        A hex digest.
+    """
+    return _hash_bound(inspect.signature(func), args, kwargs)
+
+
+def _update_code_hash(h: "hashlib._Hash", code: types.CodeType) -> None:
+    """Feed ``code`` into ``h``: its bytecode, names and constants (nested code objects recursively)."""
+    h.update(code.co_code)
+    h.update(repr(code.co_names).encode())
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            _update_code_hash(h, const)
+        elif isinstance(const, frozenset):  # e.g. `x in {"a", "b"}`; its repr order varies with PYTHONHASHSEED
+            h.update(f"frozenset:{sorted(map(repr, const))};".encode())
+        else:
+            h.update(f"{type(const).__name__}:{const!r};".encode())
+
+
+class _DiskStore:
+    """One pickle file per key in ``directory``, evicted least-recently-used beyond ``max_bytes``.
+
+    Safe to share between processes: files are written to a temporary name and atomically
+    renamed into place, and a file evicted (or not yet written) by another process is a miss.
+    Recency is the file's modification time, refreshed on every hit.
+    """
+
+    def __init__(self, directory: str, max_bytes: int) -> None:
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+    def get(self, key: str) -> tuple[bool, typing.Any]:
+        """Return ``(True, value)`` on a hit, ``(False, None)`` on a miss."""
+        path = os.path.join(self.directory, f"{key}.pkl")
+        try:
+            with open(path, "rb") as f:
+                value = pickle.load(f)
+            os.utime(path)
+        except (FileNotFoundError, EOFError, pickle.UnpicklingError):
+            return False, None
+        return True, value
+
+    def set(self, key: str, value: typing.Any) -> None:
+        """Store ``value`` under ``key``, then evict the least recently used files above ``max_bytes``."""
+        path = os.path.join(self.directory, f"{key}.pkl")
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        os.makedirs(self.directory, exist_ok=True)
+        with open(tmp, "wb") as f:
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+        self.evict()
+
+    def evict(self) -> None:
+        """Delete the least recently used files until the store fits in ``max_bytes``."""
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(".pkl"):
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:  # evicted by another process meanwhile
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(path)
+            total -= size
+
+    def clear(self) -> None:
+        """Delete every stored value."""
+        if not os.path.isdir(self.directory):
+            return
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(".pkl"):
+                with contextlib.suppress(FileNotFoundError):
+                    os.remove(entry.path)
+
+
+def _cached(func: Callable[_P, _R], maxsize: int | None, store: _DiskStore | None) -> Callable[_P, _R]:
+    """Wrap ``func`` with an in-memory LRU of ``maxsize`` entries, in front of an optional disk ``store``."""
+    memory: collections.OrderedDict[str, typing.Any] = collections.OrderedDict()
+    lock = threading.Lock()
+    signature = inspect.signature(func)  # once: inspect.signature() costs more than hashing small arguments
+
+    @functools.wraps(func)
+    def wrapper(*args: _P.args, **kwargs: _P.kwargs) -> _R:
+        key = _hash_bound(signature, args, kwargs)
+        with lock:
+            if key in memory:
+                memory.move_to_end(key)
+                return typing.cast(_R, memory[key])
+
+        hit, value = store.get(key) if store is not None else (False, None)
+        if not hit:
+            value = func(*args, **kwargs)
+            if store is not None:
+                store.set(key, value)
+
+        with lock:
+            memory[key] = value
+            if maxsize is not None and len(memory) > maxsize:
+                memory.popitem(last=False)
+        return typing.cast(_R, value)
+
+    def cache_clear() -> None:
+        with lock:
+            memory.clear()
+        if store is not None:
+            store.clear()
+
+    wrapper.cache_clear = cache_clear  # type: ignore[attr-defined]
+    return wrapper
+
+
+@typing.overload
+def memoize(func: Callable[_P, _R], *, maxsize: int | None = 128) -> Callable[_P, _R]: ...
+
+
+@typing.overload
+def memoize(func: None = None, *, maxsize: int | None = 128) -> Callable[[Callable[_P, _R]], Callable[_P, _R]]: ...
+
+
+def memoize(func: Callable[_P, _R] | None = None, *, maxsize: int | None = 128) -> typing.Any:
+    """Cache ``func``'s results in memory, keyed by :func:`hash_args`.
+
+    Unlike ``functools.lru_cache``, arguments don't need to be hashable: NumPy arrays,
+    lists and dicts are hashed by value. ``func.cache_clear()`` empties the cache.
+
+    Args:
+        func: Function to decorate (allows using ``@memoize`` without parentheses).
+        maxsize: Maximum number of cached results (least recently used are dropped first);
+            None is unbounded.
+
+    Returns:
+        The decorated function.
+
+    Example:
+        >>> @memoize
+        ... def spectrum(x, fs=1.0):
+        ...     return np.abs(np.fft.rfft(x))
+    """
+    if func is None:
+        return functools.partial(memoize, maxsize=maxsize)
+    return _cached(func, maxsize, None)
+
+
+@typing.overload
+def disk_cache(
+    func: Callable[_P, _R], *, cache_dir: str | None = None, max_bytes: int = 1 << 30, maxsize: int | None = 128
+) -> Callable[_P, _R]: ...
+
+
+@typing.overload
+def disk_cache(
+    func: None = None, *, cache_dir: str | None = None, max_bytes: int = 1 << 30, maxsize: int | None = 128
+) -> Callable[[Callable[_P, _R]], Callable[_P, _R]]: ...
+
+
+def disk_cache(
+    func: Callable[_P, _R] | None = None,
+    *,
+    cache_dir: str | None = None,
+    max_bytes: int = 1 << 30,
+    maxsize: int | None = 128,
+) -> typing.Any:
+    """Cache ``func``'s results on disk (shared between processes and sessions), with an in-memory tier in front.
+
+    Results are pickled to one file per call under ``cache_dir/<module>.<function>-<code hash>``,
+    so editing ``func``'s body starts a fresh cache. The directory is safe to share between
+    concurrent processes (e.g. ``parallel_map`` workers). ``func.cache_clear()`` empties both tiers.
+
+    Args:
+        func: Function to decorate (allows using ``@disk_cache`` without parentheses).
+        cache_dir: Root cache directory; None uses ``DISK_CACHE_DIR``.
+        max_bytes: Size bound of this function's on-disk cache (least recently used results
+            are deleted first).
+        maxsize: Size of the in-memory tier, as in :func:`memoize` (0 disables it).
+
+    Returns:
+        The decorated function.
+
+    Example:
+        >>> @disk_cache(max_bytes=10 * 2**20)
+        ... def fit(x, y, p0):
+        ...     return scipy.optimize.curve_fit(model, x, y, p0)
+    """
+    if func is None:
+        return functools.partial(disk_cache, cache_dir=cache_dir, max_bytes=max_bytes, maxsize=maxsize)
+
+    h = hashlib.sha256()
+    code = getattr(func, "__code__", None)
+    if code is not None:
+        _update_code_hash(h, code)
+    code_hash = h.hexdigest()[:8]
+    # e.g. "<locals>" of nested functions: '<' and '>' are not allowed in Windows paths
+    name = re.sub(r"[^\w.-]", "_", f"{func.__module__}.{func.__qualname__}")
+    directory = os.path.join(cache_dir or DISK_CACHE_DIR, f"{name}-{code_hash}")
+    return _cached(func, maxsize, _DiskStore(directory, max_bytes))
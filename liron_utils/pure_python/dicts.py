@@ -1,11 +1,15 @@
+import collections
+import heapq
+import itertools
+import math
+import sys
 import threading
+import time
 import typing
 from collections import OrderedDict
-from collections.abc import ItemsView, Iterator, KeysView, ValuesView
+from collections.abc import Callable, Iterable, Iterator, Sequence
 from typing import Generic, TypeVar
 
-import pandas as pd
-
 _T = TypeVar("_T")
 
 
@@ -42,33 +46,124 @@ class dict_(dict[_K, _V]):  # pylint: disable=invalid-name
     __delattr__ = dict.__delitem__  # type: ignore[assignment]
 
 
-def dl_to_ld(dl: dict[str, list[typing.Any]]) -> list[dict[str, typing.Any]] | None:
+_LAZY_ROWS = 10_000  # dl_to_ld returns a lazy view from this many rows on
+
+
+def _is_array(value: typing.Any) -> bool:
+    """Whether ``value`` is a NumPy array (without importing NumPy)."""
+    np = sys.modules.get("numpy")
+    return np is not None and isinstance(value, np.ndarray)
+
+
+def _is_column(value: typing.Any) -> bool:
+    """Whether a ``dl_to_ld`` value is a column (1-D array or non-string sequence), rather than a scalar."""
+    ndim = getattr(value, "ndim", None)
+    if ndim is not None:
+        if ndim > 1:
+            raise ValueError("Array values must be 1-dimensional.")
+        return bool(ndim == 1)
+    return isinstance(value, Sequence) and not isinstance(value, (str, bytes))
+
+
+class RecordsView(Sequence[dict[str, typing.Any]]):
+    """Read-only list-of-dicts view over a dict-of-lists; each row is built on access.
+
+    Array columns are read with ``ndarray.item``, so rows hold Python scalars as
+    ``ndarray.tolist()`` would give, without converting the whole column.
+    """
+
+    def __init__(self, dl: dict[str, typing.Any], columns: list[str], num_rows: int) -> None:
+        """Initialize the view.
+
+        Args:
+            dl: Mapping ``{key: column-or-scalar}``; scalars are repeated in every row.
+            columns: Keys of ``dl`` whose values are columns of length ``num_rows``.
+            num_rows: Number of rows.
+        """
+        self._template = dict(dl)  # key order of ``dl``; column entries are overwritten per row
+        self._getters = [(key, dl[key].item if _is_array(dl[key]) else dl[key].__getitem__) for key in columns]
+        self._num_rows = num_rows
+
+    def __len__(self) -> int:
+        return self._num_rows
+
+    @typing.overload
+    def __getitem__(self, index: int) -> dict[str, typing.Any]: ...
+
+    @typing.overload
+    def __getitem__(self, index: slice) -> list[dict[str, typing.Any]]: ...
+
+    def __getitem__(self, index: int | slice) -> dict[str, typing.Any] | list[dict[str, typing.Any]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._num_rows))]
+        if not -self._num_rows <= index < self._num_rows:
+            raise IndexError("RecordsView index out of range")
+        index %= self._num_rows
+        row = self._template.copy()
+        for key, get in self._getters:
+            row[key] = get(index)
+        return row
+
+    def __repr__(self) -> str:
+        return f"RecordsView({self._num_rows} rows)"
+
+
+def dl_to_ld(dl: dict[str, typing.Any], lazy: bool | None = None) -> list[dict[str, typing.Any]] | RecordsView | None:
     """Convert a dict-of-lists into a list-of-dicts.
 
+    Columns may be lists, tuples or 1-D arrays; arrays are converted in one ``tolist()``
+    call (or read row by row in a lazy view) rather than element by element. Scalar
+    values (including strings) are repeated in every row.
+
     Args:
         dl: Mapping ``{key: list-of-values}`` with equal-length lists.
+        lazy: Return a :class:`RecordsView` that builds each row on access instead of a
+            list. ``None`` chooses it from 10,000 rows on.
 
     Returns:
-        List of records (one dict per row), or ``None`` if ``dl`` values are scalars.
+        List of records (one dict per row), or ``None`` if all ``dl`` values are scalars,
+        the columns differ in length, or an array value is not 1-dimensional.
+
+    Example:
+        >>> dl_to_ld({"x": np.array([1.0, 2.0]), "label": ["a", "b"], "color": "k"})
+        [{'x': 1.0, 'label': 'a', 'color': 'k'}, {'x': 2.0, 'label': 'b', 'color': 'k'}]
     """
+    if not dl:
+        return []
     try:
-        records = pd.DataFrame(dl).to_dict(orient="records")
-    except ValueError:  # dict values are scalars
+        columns = [key for key, value in dl.items() if _is_column(value)]
+    except ValueError:
         return None
-    return typing.cast(list[dict[str, typing.Any]], records)
+    if not columns or len({len(dl[key]) for key in columns}) != 1:
+        return None
+    num_rows = len(dl[columns[0]])
+
+    if lazy or (lazy is None and num_rows >= _LAZY_ROWS):
+        return RecordsView(dl, columns, num_rows)
+    values = [dl[key].tolist() if _is_array(dl[key]) else dl[key] for key in columns]  # one C-level conversion
+    if len(columns) == len(dl):
+        return [dict(zip(columns, row)) for row in zip(*values)]
+    template = dict(dl)  # scalars, in the key order of ``dl``
+    return [template | dict(zip(columns, row)) for row in zip(*values)]
 
 
-def ld_to_dl(ld: list[dict[str, typing.Any]]) -> dict[str, list[typing.Any]]:
+def ld_to_dl(ld: Iterable[dict[str, typing.Any]]) -> dict[str, list[typing.Any]]:
     """Convert a list-of-dicts into a dict-of-lists.
 
     Args:
-        ld: Sequence of records sharing the same keys.
+        ld: Sequence of records. Keys missing from a record are filled with ``nan``.
 
     Returns:
-        Mapping ``{key: list-of-values}``.
+        Mapping ``{key: list-of-values}``, keys in order of first appearance.
     """
-    dl = pd.DataFrame(ld).to_dict(orient="list")
-    return typing.cast(dict[str, list[typing.Any]], dl)
+    ld = ld if isinstance(ld, (list, tuple)) else list(ld)
+    if not ld:
+        return {}
+    first = ld[0].keys()
+    if all(row.keys() == first for row in ld):  # common case: same keys
+        return {key: [row[key] for row in ld] for key in first}
+    keys = list(dict.fromkeys(key for row in ld for key in row))
+    return {key: [row.get(key, math.nan) for row in ld] for key in keys}
 
 
 class NamedQueue(Generic[_T]):
@@ -76,6 +171,11 @@ class NamedQueue(Generic[_T]):
 
     Adding a name that already exists moves it to the most-recent position.
     When the queue is full, the oldest item is evicted to make room.
+
+    Every operation holds one lock for its duration, so for many items use the bulk
+    :meth:`enqueue_many`/:meth:`dequeue_many`, which take it once per batch. Iteration,
+    :meth:`keys`, :meth:`values` and :meth:`items` work on a snapshot taken under the lock,
+    so other threads may keep modifying the queue meanwhile.
     """
 
     def __init__(self, max_size: int = 0) -> None:
@@ -87,27 +187,80 @@ class NamedQueue(Generic[_T]):
         self.maxsize = max_size
         self.queue: OrderedDict[str, _T] = OrderedDict()
         self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._waiting = 0  # consumers blocked in dequeue_many
+
+    # Unlocked primitives (the caller holds the lock); every insertion/removal goes through them.
+
+    def _put(self, name: str, item: _T) -> None:
+        """Add ``item`` under ``name``."""
+        if name in self.queue:
+            self._pop(name)
+        elif 0 < self.maxsize <= len(self.queue):
+            self._popitem()  # FIFO order
+        self.queue[name] = item
+
+    def _pop(self, name: str) -> _T:
+        """Remove and return the item under ``name``."""
+        return self.queue.pop(name)
+
+    def _popitem(self) -> tuple[str, _T]:
+        """Remove and return the oldest ``(name, item)``."""
+        return self.queue.popitem(last=False)
+
+    def _purge(self) -> None:
+        """Drop the entries that are no longer valid, before a read; a plain queue has none."""
 
     def enqueue(self, name: str, item: _T) -> None:
         """Add ``item`` under ``name`` (evicts the oldest entry if full)."""
         with self._lock:
-            if name in self.queue:
-                del self.queue[name]
-            elif 0 < self.maxsize <= len(self.queue):
-                self.queue.popitem(last=False)  # FIFO order
-            self.queue[name] = item
+            self._put(name, item)
+            if self._waiting:
+                self._not_empty.notify()
+
+    def enqueue_many(self, items: Iterable[tuple[str, _T]]) -> None:
+        """Add ``(name, item)`` pairs in order, as :meth:`enqueue` does, under a single lock acquisition."""
+        items = list(items)  # don't run the caller's generator under the lock
+        with self._lock:
+            for name, item in items:
+                self._put(name, item)
+            if self._waiting:
+                self._not_empty.notify(len(items))
 
     def dequeue(self) -> tuple[str, _T] | None:
         """Pop and return the oldest ``(name, item)``, or ``None`` if empty."""
         with self._lock:
+            self._purge()
             if self.queue:
-                return self.queue.popitem(last=False)
+                return self._popitem()
             return None
 
+    def dequeue_many(self, n: int | None = None, timeout: float | None = 0.0) -> list[tuple[str, _T]]:
+        """Pop up to ``n`` of the oldest ``(name, item)`` pairs (all if None), oldest first.
+
+        Args:
+            n: Maximal number of pairs to pop.
+            timeout: If the queue is empty, wait up to this many seconds (None waits
+                indefinitely) for an item rather than spinning on an empty queue.
+
+        Returns:
+            The popped pairs; empty if the queue stayed empty.
+        """
+        with self._lock:
+            self._purge()
+            if not self.queue and timeout != 0:
+                self._waiting += 1
+                try:
+                    self._not_empty.wait_for(lambda: self.queue, timeout)
+                finally:
+                    self._waiting -= 1
+                self._purge()
+            return [self._popitem() for _ in range(len(self.queue) if n is None else min(n, len(self.queue)))]
+
     def remove(self, name: str) -> _T:
         """Remove and return the item registered under ``name``."""
         with self._lock:
-            return self.queue.pop(name)
+            return self._pop(name)
 
     def update(self, name: str, item: _T) -> None:
         """Set the item registered under ``name``, inserting it if missing."""
@@ -115,7 +268,7 @@ class NamedQueue(Generic[_T]):
             if name in self.queue:
                 self.queue[name] = item
             else:
-                self.enqueue(name, item)
+                self._put(name, item)
 
     def __contains__(self, name: object) -> bool:
         with self._lock:
@@ -129,31 +282,317 @@ class NamedQueue(Generic[_T]):
             return self.queue[name]
 
     def __repr__(self) -> str:
-        with self._lock:
-            return f"Queue({list(self.queue.items())})"
+        return f"Queue({self.items()})"
 
     def __iter__(self) -> Iterator[tuple[str, _T]]:
-        with self._lock:
-            return iter(self.queue.items())
+        return iter(self.items())
 
     def __next__(self) -> tuple[str, _T]:
         with self._lock:
+            self._purge()
             if self.queue:
-                return self.queue.popitem(last=False)
+                return self._popitem()
             raise StopIteration
 
-    def keys(self) -> KeysView[str]:
+    def keys(self) -> list[str]:
+        """Snapshot of the names, oldest first."""
+        with self._lock:
+            self._purge()
+            return list(self.queue)
+
+    def values(self) -> list[_T]:
+        """Snapshot of the items, oldest first."""
+        with self._lock:
+            self._purge()
+            return list(self.queue.values())
+
+    def items(self) -> list[tuple[str, _T]]:
+        """Snapshot of the ``(name, item)`` pairs, oldest first."""
         with self._lock:
-            return self.queue.keys()
+            self._purge()
+            return list(self.queue.items())
 
-    def values(self) -> ValuesView[_T]:
+    def clear(self) -> None:
+        with self._lock:
+            self.queue.clear()
+
+
+class CacheStats(typing.NamedTuple):
+    """Counters of a :class:`NamedCache` (see :meth:`NamedCache.stats`)."""
+
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    weight: float
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of lookups that hit (0 before the first lookup)."""
+        return self.hits / max(1, self.hits + self.misses)
+
+
+def _weigh(item: typing.Any, _seen: set[int] | None = None) -> float:
+    """Bytes held by ``item``: ``nbytes`` for arrays/tensors, ``sys.getsizeof`` for other objects.
+
+    Tuples, lists, sets and dicts add up their elements (each object counted once), so e.g.
+    a tuple of arrays weighs the arrays' data, not just the tuple's pointers.
+    """
+    seen = set() if _seen is None else _seen
+    if id(item) in seen:  # shared or self-referencing
+        return 0.0
+    seen.add(id(item))
+    nbytes = getattr(item, "nbytes", None)
+    if isinstance(nbytes, (int, float)):
+        return float(nbytes)
+    weight = float(sys.getsizeof(item))
+    if isinstance(item, (tuple, list, set, frozenset, dict)):
+        elements = itertools.chain.from_iterable(item.items()) if isinstance(item, dict) else item
+        weight += sum(_weigh(element, seen) for element in elements)
+    return weight
+
+
+class NamedCache(NamedQueue[_T]):  # pylint: disable=too-many-instance-attributes
+    """:class:`NamedQueue` turned into a thread-safe LRU cache with TTL and weight bounds.
+
+    Lookups (:meth:`__getitem__`, :meth:`get`) move the entry to the most-recent position, so
+    the queue order is the recency order and eviction drops the least-recently used entry.
+    An entry is evicted when the cache exceeds ``max_size`` entries (reason ``"size"``) or
+    ``max_weight`` total weight (reason ``"weight"``), and dropped once its TTL has passed
+    (reason ``"expired"``). Expired entries are never returned or counted: they are removed
+    when the cache is read (looked up, iterated, measured, dequeued), when room is needed, or by
+    :meth:`expire`. Explicit removals (:meth:`remove`, :meth:`dequeue`, ...) are not evictions.
+
+    ``on_evict(name, item, reason)`` is called after the lock is released, so it may use the cache.
+
+    Example:
+        >>> cache = NamedCache(max_weight=1e9, ttl=60)  # at most 1 GB of arrays, for a minute each
+        >>> cache.enqueue("x", np.zeros((1000, 1000)))  # weighs 8 MB (ndarray.nbytes)
+        >>> cache.get("x") is not None, cache.stats().hits
+        (True, 1)
+    """
+
+    def __init__(
+        self,
+        max_size: int = 0,
+        *,
+        ttl: float | None = None,
+        max_weight: float = 0,
+        weigh: Callable[[_T], float] = _weigh,
+        on_evict: Callable[[str, _T, str], None] | None = None,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_size: Maximum number of entries; ``0`` means unbounded.
+            ttl: Default time-to-live of an entry, in seconds; ``None`` means forever.
+            max_weight: Maximum total weight of the entries; ``0`` means unbounded.
+            weigh: Weight of an item. Defaults to its size in bytes (``nbytes`` for arrays,
+                summed over the elements of tuples, lists, sets and dicts).
+            on_evict: Called as ``on_evict(name, item, reason)`` for every evicted entry,
+                ``reason`` being ``"size"``, ``"weight"`` or ``"expired"``.
+        """
+        super().__init__(max_size)
+        self.ttl = ttl
+        self.max_weight = max_weight
+        self.weigh = weigh
+        self.on_evict = on_evict
+        self.weight = 0.0
+        self._meta: dict[str, tuple[float, float]] = {}  # name -> (weight, expiry deadline)
+        self._deadlines: list[tuple[float, str]] = []  # min-heap; entries of replaced/removed names are skipped
+        self._counts = {"hits": 0, "misses": 0, "evictions": 0}
+        self._evicted: collections.deque[tuple[str, _T, str]] = collections.deque()
+
+    # Unlocked primitives (the caller holds the lock).
+
+    def _put(self, name: str, item: _T, ttl: float | None = None) -> None:
+        """Add ``item`` under ``name`` as the most recent entry and evict what no longer fits."""
+        if name in self.queue:  # a replacement, not an eviction
+            self._pop(name)
+        ttl = self.ttl if ttl is None else ttl
+        weight = self.weigh(item)
+        deadline = math.inf if ttl is None else time.monotonic() + ttl
+        self.queue[name] = item
+        self._meta[name] = (weight, deadline)
+        self.weight += weight
+        if ttl is not None:
+            heapq.heappush(self._deadlines, (deadline, name))
+            if len(self._deadlines) > 2 * len(self._meta) + 64:  # drop stale entries
+                self._deadlines = [(d, n) for d, n in self._deadlines if self._meta.get(n, (0, None))[1] == d]
+                heapq.heapify(self._deadlines)
+        self._shrink()
+
+    def _pop(self, name: str) -> _T:
+        self.weight -= self._meta.pop(name)[0]
+        return self.queue.pop(name)
+
+    def _popitem(self) -> tuple[str, _T]:
+        name, item = self.queue.popitem(last=False)
+        self.weight -= self._meta.pop(name)[0]
+        return name, item
+
+    def _evict(self, name: str, reason: str) -> None:
+        """Remove ``name`` and queue its eviction callback."""
+        item = self._pop(name)
+        self._counts["evictions"] += 1
+        if self.on_evict is not None:
+            self._evicted.append((name, item, reason))
+
+    def _expired(self, name: str) -> bool:
+        return self._meta[name][1] <= time.monotonic()
+
+    def _expire(self) -> int:
+        """Evict every expired entry; returns their number."""
+        now, n = time.monotonic(), 0
+        while self._deadlines and self._deadlines[0][0] <= now:
+            deadline, name = heapq.heappop(self._deadlines)
+            if name in self._meta and self._meta[name][1] == deadline:  # else replaced or removed since
+                self._evict(name, "expired")
+                n += 1
+        return n
+
+    def _purge(self) -> None:
+        self._expire()
+
+    def _shrink(self) -> None:
+        """Evict least-recently used entries until the size and weight bounds hold."""
+        if 0 < self.maxsize < len(self.queue) or 0 < self.max_weight < self.weight:
+            self._expire()  # expired entries go first
+        while self.queue and 0 < self.maxsize < len(self.queue):
+            self._evict(next(iter(self.queue)), "size")
+        while self.queue and 0 < self.max_weight < self.weight:  # may evict the new entry itself if too heavy
+            self._evict(next(iter(self.queue)), "weight")
+
+    def _lookup(self, name: str) -> tuple[bool, _T | None]:
+        """``(hit, item)`` for ``name``, refreshing its recency on a hit."""
+        if name in self.queue and self._expired(name):
+            self._evict(name, "expired")
+        if name not in self.queue:
+            self._counts["misses"] += 1
+            return False, None
+        self._counts["hits"] += 1
+        self.queue.move_to_end(name)
+        return True, self.queue[name]
+
+    def _notify(self) -> None:
+        """Run the queued eviction callbacks (without holding the lock)."""
+        while self._evicted and self.on_evict is not None:
+            try:
+                name, item, reason = self._evicted.popleft()
+            except IndexError:  # another thread drained it first
+                return
+            self.on_evict(name, item, reason)
+
+    def enqueue(self, name: str, item: _T, ttl: float | None = None) -> None:
+        """Add ``item`` under ``name``, evicting least-recently used entries if the cache is full.
+
+        Args:
+            name: Name of the entry.
+            item: The item.
+            ttl: Time-to-live of this entry, in seconds (defaults to the cache's ``ttl``).
+        """
+        with self._lock:
+            self._put(name, item, ttl)
+            if self._waiting:
+                self._not_empty.notify()
+        self._notify()
+
+    def enqueue_many(self, items: Iterable[tuple[str, _T]]) -> None:
+        super().enqueue_many(items)
+        self._notify()
+
+    # Reads purge expired entries (see `_purge`); run the eviction callbacks that queued.
+
+    def dequeue(self) -> tuple[str, _T] | None:
+        out = super().dequeue()
+        self._notify()
+        return out
+
+    def dequeue_many(self, n: int | None = None, timeout: float | None = 0.0) -> list[tuple[str, _T]]:
+        out = super().dequeue_many(n, timeout)
+        self._notify()
+        return out
+
+    def __next__(self) -> tuple[str, _T]:
+        try:
+            return super().__next__()
+        finally:
+            self._notify()
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._expire()
+            n = len(self.queue)
+        self._notify()
+        return n
+
+    def keys(self) -> list[str]:
+        out = super().keys()
+        self._notify()
+        return out
+
+    def values(self) -> list[_T]:
+        out = super().values()
+        self._notify()
+        return out
+
+    def items(self) -> list[tuple[str, _T]]:
+        out = super().items()
+        self._notify()
+        return out
+
+    def update(self, name: str, item: _T) -> None:
+        """Set the item under ``name`` in place (keeping its recency and expiry), inserting it if missing."""
+        with self._lock:
+            if name in self.queue:
+                weight, deadline = self._meta[name]
+                new_weight = self.weigh(item)
+                self.queue[name] = item
+                self._meta[name] = (new_weight, deadline)
+                self.weight += new_weight - weight
+                self._shrink()
+            else:
+                self._put(name, item)
+        self._notify()
+
+    def get(self, name: str, default: _T | None = None) -> _T | None:
+        """Return the item under ``name`` (marking it as recently used), or ``default`` on a miss."""
+        with self._lock:
+            hit, item = self._lookup(name)
+        self._notify()
+        return item if hit else default
+
+    def __getitem__(self, name: str) -> _T:
+        with self._lock:
+            hit, item = self._lookup(name)
+        self._notify()
+        if not hit:
+            raise KeyError(name)
+        return typing.cast(_T, item)
+
+    def __contains__(self, name: object) -> bool:
+        with self._lock:
+            return name in self.queue and not self._expired(typing.cast(str, name))
+
+    def expire(self) -> int:
+        """Evict every expired entry now (otherwise they are dropped lazily).
+
+        Returns:
+            The number of evicted entries.
+        """
         with self._lock:
-            return self.queue.values()
+            n = self._expire()
+        self._notify()
+        return n
 
-    def items(self) -> ItemsView[str, _T]:
+    def stats(self) -> CacheStats:
+        """Snapshot of the hit/miss/eviction counters and of the current size and weight."""
         with self._lock:
-            return self.queue.items()
+            return CacheStats(**self._counts, size=len(self.queue), weight=self.weight)
 
     def clear(self) -> None:
         with self._lock:
             self.queue.clear()
+            self._meta.clear()
+            self.weight = 0.0
+            self._deadlines.clear()
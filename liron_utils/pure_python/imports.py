@@ -1,6 +1,11 @@
+import ast
+import importlib
+import importlib.util
 import os
 import sys
 import types
+import typing
+from collections.abc import Callable, Iterable
 
 
 def import_module(file_name: str) -> types.ModuleType:
@@ -18,3 +23,125 @@ def import_module(file_name: str) -> types.ModuleType:
     h = __import__(file_name)
     sys.path.pop(-1)
     return h
+
+
+def _public_names(tree: ast.Module) -> list[str]:
+    """Return the names ``from <module> import *`` would bind, read from its syntax tree.
+
+    A literal ``__all__`` wins. Otherwise, every public top-level ``def``, ``class`` and
+    assignment target is collected (descending into top-level ``if``/``try`` blocks).
+    Imported names are deliberately skipped, so ``np``, ``typing`` etc. no longer leak
+    through package star-exports.
+
+    Args:
+        tree: Parsed module source.
+
+    Returns:
+        Public names in definition order.
+    """
+    names: list[str] = []
+
+    def visit(body: list[ast.stmt]) -> None:
+        for node in body:
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+                names.append(node.name)
+            elif isinstance(node, ast.Assign):
+                names.extend(t.id for t in node.targets if isinstance(t, ast.Name))
+            elif isinstance(node, ast.AnnAssign) and isinstance(node.target, ast.Name):
+                names.append(node.target.id)
+            elif isinstance(node, ast.If):
+                visit(node.body)
+                visit(node.orelse)
+            elif isinstance(node, ast.Try):
+                visit(node.body)
+                for handler in node.handlers:
+                    visit(handler.body)
+                visit(node.orelse)
+                visit(node.finalbody)
+
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and any(isinstance(t, ast.Name) and t.id == "__all__" for t in node.targets):
+            if isinstance(node.value, (ast.List, ast.Tuple)):
+                return [typing.cast(str, ast.literal_eval(elt)) for elt in node.value.elts]
+
+    visit(tree.body)
+    return list(dict.fromkeys(name for name in names if not name.startswith("_")))
+
+
+def _star_names(module_name: str) -> list[str]:
+    """Statically resolve the star-exports of ``module_name`` without importing it.
+
+    Args:
+        module_name: Absolute dotted name of a source module.
+
+    Returns:
+        Public names (see :func:`_public_names`).
+    """
+    spec = importlib.util.find_spec(module_name)
+    assert spec is not None and spec.origin is not None, f"Cannot locate source of '{module_name}'."
+    with open(spec.origin, encoding="utf-8") as f:
+        tree = ast.parse(f.read(), filename=spec.origin)
+    return _public_names(tree)
+
+
+def lazy_import(
+    package: str,
+    *,
+    submodules: Iterable[str] = (),
+    star_submodules: Iterable[str] = (),
+    attrs: dict[str, str] | None = None,
+) -> tuple[Callable[[str], typing.Any], Callable[[], list[str]]]:
+    """Build PEP 562 ``__getattr__``/``__dir__`` so a package loads its members on first access.
+
+    Replaces eager ``from .sub import *`` lines in a package ``__init__``: nothing is
+    imported until an attribute is looked up, after which the value is cached on the
+    package so later lookups bypass ``__getattr__``. The star-export names themselves
+    are resolved from source (not by importing) on the first lookup, and ``__all__`` is
+    served through ``__getattr__`` as well.
+
+    Args:
+        package: The package's ``__name__``.
+        submodules: Submodules exposed as attributes (``package.sub``).
+        star_submodules: Submodules whose public names are re-exported, as with
+            ``from .sub import *``. On name clashes the later submodule wins. These
+            submodules are also exposed as attributes, unless a re-exported name shadows them.
+        attrs: Explicit ``{attribute: submodule}`` re-exports.
+
+    Returns:
+        ``(__getattr__, __dir__)`` to assign at package level.
+
+    Example:
+        >>> __getattr__, __dir__ = lazy_import(__name__, star_submodules=["base", "filtering"])
+    """
+    subs = set(submodules)
+    star_subs = list(star_submodules)
+    lazy_subs = subs | set(star_subs)
+    attr2sub: dict[str, str] = {}
+
+    def resolve() -> dict[str, str]:
+        if not attr2sub:
+            for sub in star_subs:
+                attr2sub.update(dict.fromkeys(_star_names(f"{package}.{sub}"), sub))
+            attr2sub.update(attrs or {})
+        return attr2sub
+
+    def __getattr__(name: str) -> typing.Any:
+        if name == "__all__":
+            value: typing.Any = sorted(subs | set(resolve()))
+        elif name.startswith("__"):  # e.g. hasattr(module, "__wrapped__") probes; don't parse sources for those
+            raise AttributeError(f"module '{package}' has no attribute '{name}'")
+        elif name in subs:
+            value = importlib.import_module(f".{name}", package)
+        elif name in resolve():
+            value = getattr(importlib.import_module(f".{attr2sub[name]}", package), name)
+        elif name in lazy_subs:
+            value = importlib.import_module(f".{name}", package)
+        else:
+            raise AttributeError(f"module '{package}' has no attribute '{name}'")
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(vars(sys.modules[package])) | lazy_subs | set(resolve()))
+
+    return __getattr__, __dir__
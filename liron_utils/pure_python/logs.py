@@ -1,20 +1,281 @@
 import atexit
+import collections
+import contextlib
+import cProfile
+import datetime
+import functools
 import inspect
+import io
+import json
 import logging
+import math
+import os
+import pstats
+import queue
+import random
 import sys
+import threading
 import time
 import typing
-from logging.handlers import RotatingFileHandler
-from types import TracebackType
+from collections.abc import Callable, Generator
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from types import CodeType, TracebackType
 
 from colorama import Back, Fore, Style
 
 from .dicts import dict_
+from .telemetry import percentiles
+
+_P = typing.ParamSpec("_P")
+_R = typing.TypeVar("_R")
 
 # todo: change to use loguru
 
 
-class Logger:
+@functools.cache
+def _class_func(code: CodeType) -> str:
+    """``Class.func`` (or ``func``) shown for a record logged from ``code``, e.g. ``Model.fit``."""
+    return code.co_qualname.rsplit("<locals>.", maxsplit=1)[-1]
+
+
+class _QueueHandler(QueueHandler):
+    """Hands records to a :class:`QueueListener` in the same process, as cheaply as possible.
+
+    The stock ``prepare`` formats every record and copies it on the caller's thread. Here
+    formatting is left to the listener; only ``%``-args are merged into the message, so that
+    objects mutated after the call are logged as they were.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        if record.args:
+            record.msg = record.getMessage()
+            record.args = None
+        return record
+
+
+# Attributes every LogRecord has; anything else on a record came in through ``extra``
+_RECORD_ATTRS = frozenset(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime", "class_func"}
+
+
+class _JsonFormatter(logging.Formatter):
+    """Formats a record as one JSON object (no trailing newline)."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        out = {
+            "timestamp": datetime.datetime.fromtimestamp(record.created, datetime.timezone.utc).isoformat(
+                timespec="milliseconds"
+            ),
+            "level": logging.getLevelName(record.levelno),  # record.levelname may carry colors by now
+            "file": record.pathname,
+            "line": record.lineno,
+            "class_func": getattr(record, "class_func", record.funcName),
+            "message": record.getMessage(),
+        }
+        out |= {key: value for key, value in vars(record).items() if key not in _RECORD_ATTRS}
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            out["exception"] = record.exc_text
+        return json.dumps(out, default=str)
+
+
+class JsonLinesHandler(RotatingFileHandler):  # pylint: disable=too-many-instance-attributes
+    """Writes records as JSON lines, in batches, rotating the file by size and/or age.
+
+    Records are buffered and written (and flushed) together once ``batch_size`` of them are
+    pending, ``flush_interval`` seconds passed since the last write, a record of level
+    ``flush_level`` or above arrives, or the handler is flushed/closed. Rotation is checked
+    before every batch and renames ``file.jsonl`` to ``file.jsonl.1`` etc., as
+    :class:`~logging.handlers.RotatingFileHandler` does.
+
+    Each line holds ``timestamp`` (ISO 8601, UTC), ``level``, ``file``, ``line``,
+    ``class_func``, ``message``, ``elapsed`` (seconds since ``time_log``, if given), any
+    ``extra`` fields, and ``exception`` (the formatted traceback, if any).
+
+    Example:
+        >>> with Logger(json_file_name="./logs.jsonl") as logger:
+        ...     logger.info("epoch done", extra={"epoch": 3, "loss": 0.12})
+        >>> [json.loads(line)["loss"] for line in open("./logs.jsonl")]
+        [0.12]
+    """
+
+    def __init__(
+        self,
+        file_name: str,
+        *,
+        batch_size: int = 1000,
+        flush_interval: float = 1.0,
+        flush_level: int = logging.ERROR,
+        max_bytes: int = 0,
+        rotate_interval: float | None = None,
+        backup_count: int = 5,
+    ) -> None:
+        """Initialize the handler.
+
+        Args:
+            file_name: Output path.
+            batch_size: Number of pending records that triggers a write.
+            flush_interval: Longest time, in seconds, a record waits for a write while others arrive.
+            flush_level: Records of this level or above are written at once.
+            max_bytes: Rotate once the file reached this size (0 never rotates by size).
+            rotate_interval: Rotate every this many seconds (None never rotates by age).
+            backup_count: Number of rotated files to keep.
+        """
+        super().__init__(file_name, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8", delay=True)
+        self.setFormatter(_JsonFormatter())
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.flush_level = flush_level
+        self.rotate_interval = rotate_interval
+        self.buffer: list[str] = []
+        self._next_flush = time.monotonic() + flush_interval
+        self._rotate_at = time.time() + rotate_interval if rotate_interval is not None else float("inf")
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self.buffer.append(self.format(record))
+        except Exception:  # pylint: disable=broad-exception-caught
+            self.handleError(record)
+            return
+        if len(self.buffer) >= self.batch_size or record.levelno >= self.flush_level:
+            self.flush()
+        elif time.monotonic() >= self._next_flush:
+            self.flush()
+
+    def flush(self) -> None:
+        with self.lock:  # type: ignore[union-attr]
+            self._next_flush = time.monotonic() + self.flush_interval
+            if not self.buffer:
+                return
+            if self.stream is None:
+                self.stream = self._open()
+            if 0 < self.maxBytes <= self.stream.tell() or time.time() >= self._rotate_at:
+                self.doRollover()  # leaves the stream closed (delay=True)
+                self.stream = self._open()
+                if self.rotate_interval is not None:
+                    self._rotate_at = time.time() + self.rotate_interval
+            self.stream.write("\n".join(self.buffer) + "\n")
+            self.stream.flush()
+            self.buffer.clear()
+
+    def close(self) -> None:
+        self.flush()
+        super().close()
+
+
+class SpanRecord(typing.NamedTuple):
+    """One finished :meth:`Logger.span` (times in seconds).
+
+    Attributes:
+        path: ``/``-joined names of the enclosing spans and this one, e.g. ``"fit/epoch"``.
+        parent: Path of the enclosing span (None at top level).
+        thread: Id of the thread it ran in.
+        start: ``time.perf_counter()`` at entry.
+        duration: Wall time.
+        self_time: Wall time not spent in child spans.
+    """
+
+    path: str
+    parent: str | None
+    thread: int
+    start: float
+    duration: float
+    self_time: float
+
+
+class SpanStats:
+    """Running statistics of the finished spans of one path, in constant memory whatever their number.
+
+    Attributes:
+        count: Number of spans.
+        total: Total wall time.
+        self_time: Total wall time not spent in child spans.
+        max: Longest duration.
+        decades: Span count per decade of duration, e.g. ``{-2: 7}`` = 7 spans took 10-100 ms.
+        sample: Uniform random sample of at most ``SAMPLE_SIZE`` durations (reservoir sampling),
+            for percentiles.
+    """
+
+    SAMPLE_SIZE = 1024
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.self_time = 0.0
+        self.max = 0.0
+        self.decades: collections.Counter[int] = collections.Counter()
+        self.sample: list[float] = []
+
+    def add(self, duration: float, self_time: float) -> None:
+        """Account for one finished span."""
+        self.count += 1
+        self.total += duration
+        self.self_time += self_time
+        self.max = max(self.max, duration)
+        self.decades[math.floor(math.log10(max(duration, 1e-9)))] += 1
+        if len(self.sample) < self.SAMPLE_SIZE:
+            self.sample.append(duration)
+        elif (i := random.randrange(self.count)) < self.SAMPLE_SIZE:
+            self.sample[i] = duration
+
+
+def _format_seconds(seconds: float) -> str:
+    """E.g. ``"12.3 ms"``."""
+    for unit, scale in (("s", 1.0), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.3g} {unit}"
+    return f"{seconds * 1e9:.3g} ns"
+
+
+class _SamplingProfiler(threading.Thread):
+    """Samples the stack of one thread every ``interval`` seconds, starting ``delay`` seconds in.
+
+    Spans shorter than ``delay`` cost nothing but starting and stopping this thread.
+    """
+
+    def __init__(self, thread_id: int, delay: float, interval: float = 0.005) -> None:
+        super().__init__(daemon=True)
+        self.thread_id, self.delay, self.interval = thread_id, delay, interval
+        self.done = threading.Event()
+        self.samples = 0
+        self.inclusive: collections.Counter[CodeType] = collections.Counter()  # samples with the code on the stack
+        self.exclusive: collections.Counter[CodeType] = collections.Counter()  # samples with the code on top
+
+    def run(self) -> None:
+        if self.done.wait(self.delay):
+            return
+        while not self.done.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)  # pylint: disable=protected-access
+            if frame is None:
+                continue
+            self.samples += 1
+            self.exclusive[frame.f_code] += 1
+            codes = set()
+            while frame is not None:
+                codes.add(frame.f_code)
+                frame = frame.f_back
+            self.inclusive.update(codes)
+
+    def stop(self) -> None:
+        """Stop sampling and wait for the thread."""
+        self.done.set()
+        self.join()
+
+    def report(self, top: int = 15) -> str:
+        """Functions by share of samples they were on the stack (total) and on top of it (self)."""
+        lines = [
+            f"{self.samples} samples every {_format_seconds(self.interval)}",
+            f"{'total':>7s} {'self':>7s}  function",
+        ]
+        for code, count in self.inclusive.most_common(top):
+            lines.append(
+                f"{count / self.samples:7.1%} {self.exclusive[code] / self.samples:7.1%}  "
+                f"{_class_func(code)} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+            )
+        return "\n".join(lines)
+
+
+class Logger:  # pylint: disable=too-many-instance-attributes
     """Context-managed logger with a colored console handler and a rotating file handler.
 
     Examples:
@@ -27,6 +288,16 @@ class Logger:
 
         >>> logger = Logger()
         >>> raise ValueError("This is an error.")  # Logged via sys.excepthook
+
+        >>> with Logger(asynchronous=True) as logger:  # formatting and I/O on a background thread
+        ...     for i in range(100_000):
+        ...         logger.info("step %d", i)
+
+        >>> with Logger() as logger:  # span durations are summarized on exit
+        ...     with logger.span("fit"):
+        ...         for epoch in range(10):
+        ...             with logger.span("epoch", profile_threshold=60):  # profile epochs longer than a minute
+        ...                 train_one_epoch()
     """
 
     NAME2LEVEL = dict_(logging._nameToLevel)  # pylint: disable=protected-access
@@ -46,11 +317,11 @@ class Logger:
 
     ENTER_CALLED = False
 
-    def __init__(
+    def __init__(  # pylint: disable=too-many-arguments,too-many-locals
         self,
         file_name: str = "./logs.log",
         *,
-        min_level_file: int = logging.INFO,
+        min_level_file: int | None = logging.INFO,
         min_level_console: int | None = None,
         default_level: int = logging.INFO,
         log_message_format: str = "%(asctime)s"
@@ -64,17 +335,30 @@ class Logger:
         "%(message)s",
         max_file_size: int = 10 * 1024 * 1024,
         backup_count: int = 5,
+        asynchronous: bool = False,
+        json_file_name: str | None = None,
+        json_kw: dict[str, typing.Any] | None = None,
+        max_spans: int = 10_000,
     ) -> None:
         """Initialize the logger and install file and console handlers.
 
         Args:
             file_name: Logger file path; ``.log`` is appended if missing.
-            min_level_file: Lowest level written to file.
+            min_level_file: Lowest level written to file; ``None`` disables file output.
             min_level_console: Lowest level written to console; ``None`` disables console output.
             default_level: Level used by ``log`` when no explicit level is provided.
             log_message_format: ``logging.Formatter`` format string applied to records.
             max_file_size: Rotating-file size limit in bytes.
             backup_count: Number of rotated backups to keep.
+            asynchronous: If True, ``log`` only queues the record, and a background thread
+                formats and writes it (flushed on ``__exit__``). Console lines may then
+                interleave with ``print`` output out of order.
+            json_file_name: If given, records of at least ``min_level_file`` (all records if
+                ``None``) are also written there as JSON lines (see :class:`JsonLinesHandler`).
+            json_kw: Forwarded to :class:`JsonLinesHandler`; rotation defaults to
+                ``max_file_size``/``backup_count``.
+            max_spans: Number of most recent :meth:`span` records kept in ``self.spans``.
+                The per-path statistics in ``self.span_stats`` cover every span.
 
         Examples:
             >>> with Logger(min_level_console=Logger.NAME2LEVEL["WARNING"]) as logger:
@@ -94,6 +378,11 @@ class Logger:
             pass
         self.logger = logging.getLogger(file_name)
         self.default_level = default_level
+        self.spans: collections.deque[SpanRecord] = collections.deque(maxlen=max_spans)
+        self.span_stats: dict[str, SpanStats] = {}
+        self._span_stack = threading.local()
+        self._spans_lock = threading.Lock()
+        self._spans_reported = 0
         self.logger.setLevel(logging.DEBUG)
 
         # Create a file handler to write log messages to a file
@@ -105,29 +394,19 @@ class Logger:
                     Logger.LEVEL2NAME[record.levelno],
                 )
 
-                record.class_func = self._get_class_func(record)
+                if not hasattr(record, "class_func"):  # set by Logger.log; not for records logged otherwise
+                    record.class_func = record.funcName
 
                 return super().format(record)
 
-            @staticmethod
-            def _get_class_func(record: logging.LogRecord) -> str:
-                frame = inspect.currentframe()
-                while frame:
-                    if frame.f_code.co_name == record.funcName:
-                        # Look for 'self' or 'cls' in the frame's local variables
-                        local_self = frame.f_locals.get("self", None) or frame.f_locals.get("cls", None)
-                        if local_self:
-                            return f"{local_self.__class__.__name__}.{record.funcName}"
-                    frame = frame.f_back
-                return record.funcName  # Fallback
+        handlers: list[logging.Handler] = []
 
         # Use RotatingFileHandler instead of FileHandler for file size rotation
         self.file_handler = RotatingFileHandler(file_name, maxBytes=max_file_size, backupCount=backup_count)
         if min_level_file is not None:
             self.file_handler.setLevel(min_level_file)
-            formatter = _Formatter(log_message_format)
-            self.file_handler.setFormatter(formatter)
-            self.logger.addHandler(self.file_handler)
+            self.file_handler.setFormatter(_Formatter(log_message_format))
+            handlers.append(self.file_handler)
 
         # Create a console handler to write log messages to the console
         class _FormatterColored(_Formatter):
@@ -149,9 +428,28 @@ class Logger:
         self.console_handler = logging.StreamHandler(sys.stdout)
         if min_level_console is not None:
             self.console_handler.setLevel(min_level_console)
-            formatter = _FormatterColored(log_message_format)
-            self.console_handler.setFormatter(formatter)
-            self.logger.addHandler(self.console_handler)
+            self.console_handler.setFormatter(_FormatterColored(log_message_format))
+            handlers.append(self.console_handler)
+
+        if json_file_name is not None:
+            self.json_handler = JsonLinesHandler(
+                json_file_name, **({"max_bytes": max_file_size, "backup_count": backup_count} | (json_kw or {}))
+            )
+            if min_level_file is not None:
+                self.json_handler.setLevel(min_level_file)
+            handlers.append(self.json_handler)
+
+        # Records below every handler's level are dropped before they are even created. A NOTSET
+        # handler takes everything, but a NOTSET logger would defer to its parent's level instead.
+        self.logger.setLevel(max(1, min((handler.level for handler in handlers), default=logging.CRITICAL)))
+        self.queue_handler = _QueueHandler(queue.SimpleQueue())
+        self.listener: QueueListener | None = None
+        if asynchronous:
+            self.listener = QueueListener(self.queue_handler.queue, *handlers, respect_handler_level=True)
+            self.listener.start()
+            handlers = [self.queue_handler]
+        for handler in handlers:
+            self.logger.addHandler(handler)
 
         atexit.register(self.__exit__, None, None, None)  # Register exit function
 
@@ -187,11 +485,22 @@ class Logger:
             if not issubclass(exc_type, KeyboardInterrupt):  # Ignore keyboard interrupts
                 self.error("Uncaught exception:", exc_info=(exc_type, exc_value, exc_traceback))
 
+        num_spans = sum(stats.count for stats in self.span_stats.values())
+        if num_spans > self._spans_reported:
+            self.info(f"Spans:\n{self.span_report()}")
+            self._spans_reported = num_spans
         self.info(self.EXIT_MSG)
+        if self.listener is not None:  # flush the queued records
+            self.logger.removeHandler(self.queue_handler)
+            self.listener.stop()
+            self.listener = None
         self.logger.removeHandler(self.file_handler)
         self.file_handler.close()
         self.logger.removeHandler(self.console_handler)
         self.console_handler.close()
+        if hasattr(self, "json_handler"):
+            self.logger.removeHandler(self.json_handler)
+            self.json_handler.close()
 
     def log(
         self,
@@ -214,7 +523,7 @@ class Logger:
             exc_info: If True, attach current exception info.
             time_log: Reference timestamp; if given, message includes elapsed time.
             f: Format spec used inside the elapsed-time placeholder.
-            stacklevel: Forwarded to ``logging.Logger.log``.
+            stacklevel: Which frame is reported as the call site, as in ``logging.Logger.log``.
             **kwargs: Forwarded to ``logging.Logger.log``.
 
         Returns:
@@ -223,14 +532,30 @@ class Logger:
         if level is None:
             level = self.default_level
 
-        kwargs = {"stacklevel": stacklevel} | kwargs
-
         tm = time.time()
+        if not self.logger.isEnabledFor(level):
+            return tm
+        extra: dict[str, typing.Any] = {} if time_log is None else {"elapsed": tm - time_log}
         if time_log is not None:
             msg = msg.replace("{}", "{" + f + "}")
             msg = msg.format(tm - time_log)
 
-        self.logger.log(level, msg, *args, exc_info=exc_info, **kwargs)
+        frame = inspect.currentframe()
+        for _ in range(stacklevel - 1):
+            frame = frame.f_back if frame is not None else None
+        if frame is not None:
+            extra["class_func"] = _class_func(frame.f_code)
+        extra |= kwargs.pop("extra", {})
+        if frame is None or exc_info or kwargs:  # uncommon: let logging resolve the call site
+            self.logger.log(level, msg, *args, exc_info=exc_info, stacklevel=stacklevel, extra=extra, **kwargs)
+            return tm
+
+        # Build the record from the frame at hand instead of having logging walk the stack for it again
+        code = frame.f_code
+        record = self.logger.makeRecord(
+            self.logger.name, level, code.co_filename, frame.f_lineno, msg, args, None, code.co_name, extra
+        )
+        self.logger.handle(record)
 
         return tm
 
@@ -262,3 +587,153 @@ class Logger:
         return self.log(msg, *args, level=logging.CRITICAL, **kwargs)
 
     fatal = critical
+
+    @contextlib.contextmanager
+    def span(
+        self, name: str, *, profile_threshold: float | None = None, profiler: str = "sampling"
+    ) -> Generator[None, None, None]:
+        """Time the enclosed block as a span nested in the enclosing spans of the same thread.
+
+        Finished spans are aggregated per path in ``self.span_stats`` (the latest ones are also kept
+        in ``self.spans``), and summarized (see :meth:`span_report`) on ``__exit__``.
+
+        Args:
+            name: Span name; the span is recorded under the path of the enclosing spans, e.g. ``"fit/epoch"``.
+            profile_threshold: If given, profile spans that run longer than this many seconds and
+                log the profile.
+            profiler: ``"sampling"`` samples the stack every 5 ms, starting only once the span
+                crossed ``profile_threshold`` (so shorter spans cost nothing). ``"cprofile"`` runs
+                the whole span under :mod:`cProfile` (deterministic, but slows it down) and keeps
+                the profile only if the span turned out long.
+
+        Example:
+            >>> with logger.span("load"):
+            ...     data = load()
+        """
+        stack: list[list[typing.Any]] = self._span_stack.__dict__.setdefault("stack", [])
+        parent = stack[-1][0] if stack else None
+        path = name if parent is None else f"{parent}/{name}"
+        frame: list[typing.Any] = [path, 0.0]  # [path, time spent in child spans]
+        stack.append(frame)
+
+        sampler, profile = None, None
+        if profile_threshold is not None and profiler == "sampling":
+            sampler = _SamplingProfiler(threading.get_ident(), profile_threshold)
+            sampler.start()
+        elif profile_threshold is not None:
+            assert profiler == "cprofile", f"Unknown profiler '{profiler}'."
+            profile = cProfile.Profile()
+            try:
+                profile.enable()
+            except ValueError:  # another profiler is active (e.g. an enclosing span's)
+                profile = None
+
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            duration = time.perf_counter() - start
+            if profile is not None:
+                profile.disable()
+            if sampler is not None:
+                sampler.stop()
+            stack.pop()
+            if stack:
+                stack[-1][1] += duration
+            record = SpanRecord(path, parent, threading.get_ident(), start, duration, duration - frame[1])
+            self.spans.append(record)
+            with self._spans_lock:
+                if path not in self.span_stats:
+                    self.span_stats[path] = SpanStats()
+                self.span_stats[path].add(duration, record.self_time)
+
+            if profile_threshold is not None and duration > profile_threshold:
+                if sampler is not None and sampler.samples:
+                    report = sampler.report()
+                elif profile is not None:
+                    stream = io.StringIO()
+                    pstats.Stats(profile, stream=stream).sort_stats("cumulative").print_stats(15)
+                    report = stream.getvalue().strip()
+                else:
+                    report = "(no profile)"
+                self.warning(f"Span '{path}' took {_format_seconds(duration)}. Profile:\n{report}", stacklevel=5)
+
+    @typing.overload
+    def timed(self, func: Callable[_P, _R], /) -> Callable[_P, _R]: ...
+
+    @typing.overload
+    def timed(
+        self,
+        func: None = None,
+        /,
+        *,
+        name: str | None = None,
+        profile_threshold: float | None = None,
+        profiler: str = "sampling",
+    ) -> Callable[[Callable[_P, _R]], Callable[_P, _R]]: ...
+
+    def timed(
+        self,
+        func: Callable[_P, _R] | None = None,
+        /,
+        *,
+        name: str | None = None,
+        profile_threshold: float | None = None,
+        profiler: str = "sampling",
+    ) -> typing.Any:
+        """Decorator running every call of ``func`` in a :meth:`span`.
+
+        Args:
+            func: Function to time.
+            name: Span name; defaults to ``func``'s qualified name (as ``Class.func``).
+            profile_threshold: See :meth:`span`.
+            profiler: See :meth:`span`.
+
+        Example:
+            >>> @logger.timed
+            ... def step(batch): ...
+            >>>
+            >>> @logger.timed(name="eval", profile_threshold=10)
+            ... def evaluate(model): ...
+        """
+
+        def decorator(f: Callable[_P, _R]) -> Callable[_P, _R]:
+            span_name = name or f.__qualname__.rsplit("<locals>.", maxsplit=1)[-1]
+
+            @functools.wraps(f)
+            def wrapper(*args: _P.args, **kwargs: _P.kwargs) -> _R:
+                with self.span(span_name, profile_threshold=profile_threshold, profiler=profiler):
+                    return f(*args, **kwargs)
+
+            return wrapper
+
+        return decorator if func is None else decorator(func)
+
+    def span_report(self) -> str:
+        """Summarize ``self.span_stats``.
+
+        Returns:
+            A table with, per span path (children indented under their parents): call count, total,
+            mean, p50, p95 and max duration, total self time (not in child spans), and a histogram
+            of the durations by decade (e.g. ``10ms:7`` = 7 calls took 10-100 ms). Percentiles are
+            estimated from a sample of the durations once there are more than ``SpanStats.SAMPLE_SIZE``.
+        """
+        with self._spans_lock:
+            span_stats = dict(self.span_stats)
+
+        columns = ("total", "mean", "p50", "p95", "max", "self")
+        lines = [f"{'span':30s} {'count':>7s} " + " ".join(f"{c:>9s}" for c in columns) + "  histogram"]
+        for path in sorted(span_stats, key=lambda p: p.split("/")):  # children right after their parent
+            stats = span_stats[path]
+            p = percentiles(stats.sample, (50, 95))
+            histogram = " ".join(
+                f"{_format_seconds(10.0**decade)}:{stats.decades[decade]}" for decade in sorted(stats.decades)
+            )
+            times = [stats.total, stats.total / stats.count, p["p50"], p["p95"], stats.max, stats.self_time]
+            label = "  " * path.count("/") + path.rsplit("/", maxsplit=1)[-1]
+            lines.append(
+                f"{label:30s} {stats.count:7d} "
+                + " ".join(f"{_format_seconds(t):>9s}" for t in times)
+                + f"  {histogram}"
+            )
+        return "\n".join(lines)
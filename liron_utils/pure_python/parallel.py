@@ -1,37 +1,455 @@
+# pylint: disable=too-many-lines
+import asyncio
+import atexit
+import contextlib
 import functools
+import itertools
+import json
+import math
 import multiprocessing as mp
+import os
+import pickle
+import queue
+import secrets
+import struct
 import sys
 import threading
+import time
+import traceback
 import typing
 import warnings
-from collections.abc import Callable, Iterable
+from collections.abc import (
+    AsyncGenerator,
+    Awaitable,
+    Callable,
+    Generator,
+    Iterable,
+    Iterator,
+    Sequence,
+    Sized,
+)
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from multiprocessing import resource_tracker
+from multiprocessing.pool import Pool
+from multiprocessing.shared_memory import SharedMemory
 
-from .progress_bar import tqdm_
+from .decorators import hash_value
+from .progress_bar import TaskProgress, tqdm_
+from .telemetry import TaskRecord, Telemetry
 
 _T = typing.TypeVar("_T")
+_DoneEntry = tuple[int, typing.Any, BaseException | None]  # (index, output, error) of a finished parallel_map task
 
 NUM_CPUS = mp.cpu_count()
 NUM_PROCESSES_TO_USE = NUM_CPUS
 NUM_THREADS_TO_USE = 20
+NUM_CONCURRENT_TASKS = 100
 
+_TARGET_CHUNK_SEC = 0.05  # adaptive chunks aim for this much work each: amortizes IPC without starving workers
+_MAX_CHUNKSIZE = 4096
 
-def parallel_map(
+# ndarray kwargs/results at least this large travel through shared memory instead of being pickled per task
+SHARED_MEMORY_MIN_NBYTES = 1 << 20
+
+
+# In UNIX 'fork' is fastest (workers inherit the parent's imports instead of re-importing them) but is unsafe
+# if the parent holds locks in other threads; 'forkserver' is the safe UNIX alternative. Windows only has 'spawn'.
+DEFAULT_START_METHOD = "spawn" if sys.platform == "win32" else "fork"
+
+_shared_pools: dict[tuple[str, int], Pool] = {}
+_shared_pools_lock = threading.Lock()
+
+
+def make_pool(num_processes: int = NUM_PROCESSES_TO_USE, start_method: str | None = None) -> Pool:
+    """Create a new process pool; use it as a context manager to terminate it on exit.
+
+    Args:
+        num_processes: Worker process count.
+        start_method: ``"fork"``, ``"forkserver"`` or ``"spawn"``; None uses ``DEFAULT_START_METHOD``.
+
+    Returns:
+        A ``multiprocessing.pool.Pool`` from the requested start-method context.
+
+    Example:
+        >>> with make_pool(8, start_method="forkserver") as pool:
+        ...     for x in range(10):
+        ...         out = parallel_map(func, range(100), pool=pool, x=x)
+    """
+    if os.name == "posix":
+        # Workers then share the parent's tracker, so shared-memory blocks are tracked once, by their owner
+        resource_tracker.ensure_running()
+    return mp.get_context(start_method or DEFAULT_START_METHOD).Pool(processes=num_processes)
+
+
+def get_pool(num_processes: int = NUM_PROCESSES_TO_USE, start_method: str | None = None) -> Pool:
+    """Return a module-level pool shared by all callers, creating it on first use.
+
+    Repeated ``parallel_map(..., pool=get_pool())`` calls (e.g. in a loop) reuse the same
+    workers instead of paying pool spin-up and teardown every time. Don't close the returned
+    pool yourself; use :func:`close_pools` (also called at interpreter exit).
+
+    Workers are started when the pool is created, so with ``fork`` they only know the
+    functions that existed at that point; functions defined later in ``__main__`` can't be
+    resolved by them.
+
+    Args:
+        num_processes: Worker process count (one shared pool per size and start method).
+        start_method: ``"fork"``, ``"forkserver"`` or ``"spawn"``; None uses ``DEFAULT_START_METHOD``.
+
+    Returns:
+        The shared ``multiprocessing.pool.Pool``.
+    """
+    key = (start_method or DEFAULT_START_METHOD, num_processes)
+    with _shared_pools_lock:
+        if key not in _shared_pools:
+            _shared_pools[key] = make_pool(num_processes, key[0])
+        return _shared_pools[key]
+
+
+def close_pools() -> None:
+    """Terminate every pool handed out by :func:`get_pool`."""
+    with _shared_pools_lock:
+        for pool in _shared_pools.values():
+            pool.terminate()
+            pool.join()
+        _shared_pools.clear()
+
+
+atexit.register(close_pools)
+
+
+def _pool_context(
+    pool: Pool | None, num_processes: int, start_method: str | None
+) -> contextlib.AbstractContextManager[Pool]:
+    """Use ``pool`` as-is (left running), or create a pool that is terminated on exit."""
+    if pool is not None:
+        assert start_method is None, "'start_method' must not be given together with 'pool'."
+        return contextlib.nullcontext(pool)
+    return make_pool(num_processes, start_method)
+
+
+class TaskError(typing.NamedTuple):
+    """A task that raised during a parallel run.
+
+    Attributes:
+        exception: The raised exception (for process pools, its ``__cause__`` holds the worker-side traceback).
+        traceback: The formatted traceback, worker side included.
+    """
+
+    exception: BaseException
+    traceback: str
+
+
+class ParallelResult(list[_T | None]):
+    """Outputs of a parallel run, aligned with its input: ``None`` where a task failed or never ran.
+
+    A plain list of the outputs, that additionally records per-task errors and timings.
+
+    Attributes:
+        errors: ``{index: TaskError}`` for every task that raised.
+        durations: Per-task run time in seconds (``None`` where the task failed or never ran).
+        telemetry: Detailed per-task records of successful tasks, if requested (``telemetry=True``).
+    """
+
+    def __init__(self, num_tasks: int) -> None:
+        super().__init__([None] * num_tasks)
+        self.errors: dict[int, TaskError] = {}
+        self.durations: list[float | None] = [None] * num_tasks
+        self.telemetry: Telemetry | None = None
+
+    @property
+    def ok(self) -> bool:
+        """True if no task failed."""
+        return not self.errors
+
+    def raise_first(self) -> None:
+        """Re-raise the exception of the first failed task (by input index), if any."""
+        if self.errors:
+            raise self.errors[min(self.errors)].exception
+
+
+class ParallelAbortedError(RuntimeError):
+    """Raised when a parallel run is cut short because too many tasks failed.
+
+    Attributes:
+        result: The partial result; tasks that were cancelled are ``None`` without an entry in ``errors``.
+    """
+
+    def __init__(self, result: ParallelResult[typing.Any]) -> None:
+        super().__init__(f"Aborted after {len(result.errors)} failed task(s); outstanding tasks were cancelled.")
+        self.result = result
+
+
+def _max_failures(fail_fast: bool, max_failures: int | None) -> float:
+    """Failures tolerated before a run is aborted."""
+    if fail_fast:
+        return 0
+    return math.inf if max_failures is None else max_failures
+
+
+def _record_failure(result: ParallelResult[typing.Any], index: int, e: BaseException, max_failures: float) -> None:
+    """Store a failed task in ``result``; raise :class:`ParallelAbortedError` once more than ``max_failures`` failed."""
+    warnings.warn(f"Exception at index {index}: {e}")
+    result.errors[index] = TaskError(e, "".join(traceback.format_exception(e)))
+    if len(result.errors) > max_failures:
+        raise ParallelAbortedError(result) from e
+
+
+def _timed_call(func: Callable[[typing.Any], _T], item: typing.Any) -> tuple[_T, float]:
+    """Evaluate ``func(item)`` and report how long it took."""
+    t0 = time.perf_counter()
+    out = func(item)
+    return out, time.perf_counter() - t0
+
+
+def _traced_call(payload: bytes) -> tuple[bytes, tuple[float, float, float, float, int]]:
+    """Worker-side: evaluate a pickled ``(func, item)`` task, timing it and its (de)serialization.
+
+    Returns:
+        The pickled output, and ``(started, finished, cpu, serialization, pid)``.
+    """
+    t0 = time.perf_counter()
+    func, item = pickle.loads(payload)
+    started, cpu0, t1 = time.time(), time.thread_time(), time.perf_counter()
+    out = func(item)
+    cpu, t2 = time.thread_time() - cpu0, time.perf_counter()
+    payload = pickle.dumps(out)
+    return payload, (started, started + t2 - t1, cpu, t1 - t0 + time.perf_counter() - t2, os.getpid())
+
+
+class _TaskTracer:
+    """Parent-side bookkeeping of ``parallel_map(..., telemetry=True)``.
+
+    Tasks are pickled here rather than by the pool, so both ends of the (de)serialization can be timed.
+    """
+
+    def __init__(self) -> None:
+        self.telemetry = Telemetry()
+        self.submitted: dict[int, tuple[float, float]] = {}  # index -> (submitted, serialization)
+
+    def task(
+        self, index: int, func: Callable[..., typing.Any], item: typing.Any
+    ) -> tuple[Callable[..., typing.Any], tuple[typing.Any, ...]]:
+        """The ``(func, args)`` to submit to the pool for ``func(item)``."""
+        t0 = time.perf_counter()
+        payload = pickle.dumps((func, item))
+        self.submitted[index] = (time.time(), time.perf_counter() - t0)
+        return _traced_call, (payload,)
+
+    def finish(self, index: int, out: tuple[bytes, tuple[float, float, float, float, int]]) -> tuple[typing.Any, float]:
+        """Record a finished task.
+
+        Returns:
+            The task output and its duration.
+        """
+        payload, (started, finished, cpu, serialization, worker) = out
+        t0 = time.perf_counter()
+        value = pickle.loads(payload)
+        submitted, serialization_parent = self.submitted.pop(index)
+        serialization += serialization_parent + time.perf_counter() - t0
+        self.telemetry.records.append(TaskRecord(index, worker, submitted, started, finished, cpu, serialization))
+        return value, finished - started
+
+
+class _SharedArray(typing.NamedTuple):
+    """Picklable handle to an ndarray stored in a ``multiprocessing.shared_memory`` block."""
+
+    name: str
+    shape: tuple[int, ...]
+    dtype: (
+        typing.Any
+    )  # np.dtype: pickles whole, unlike dtype.str, which reduces structured dtypes to raw bytes ("|V16")
+
+
+_attached: dict[str, SharedMemory] = {}  # worker-side: blocks backing the kwargs of the current parallel_map call
+
+
+def _is_shareable(value: typing.Any, min_nbytes: int) -> bool:
+    """Whether ``value`` is an ndarray worth passing through shared memory (object arrays hold pointers)."""
+    np = sys.modules.get("numpy")  # an ndarray implies numpy was imported; don't import it otherwise
+    return np is not None and isinstance(value, np.ndarray) and not value.dtype.hasobject and value.nbytes >= min_nbytes
+
+
+def _to_shared(arr: typing.Any, name: str | None = None) -> tuple[SharedMemory, _SharedArray]:
+    """Copy ``arr`` into a new shared-memory block (owned by the caller, who must unlink it)."""
+    import numpy as np  # pylint: disable=import-outside-toplevel
+
+    shm = SharedMemory(name, create=True, size=max(arr.nbytes, 1))
+    np.ndarray(arr.shape, arr.dtype, buffer=shm.buf)[...] = arr
+    return shm, _SharedArray(shm.name, arr.shape, arr.dtype)
+
+
+def _attach(handle: _SharedArray) -> typing.Any:
+    """Worker-side: a read-only ndarray view of a parent-owned block (mapped once per worker)."""
+    import numpy as np  # pylint: disable=import-outside-toplevel
+
+    if handle.name not in _attached:
+        _attached[handle.name] = SharedMemory(handle.name)
+    arr = np.ndarray(handle.shape, handle.dtype, buffer=_attached[handle.name].buf)
+    arr.flags.writeable = False
+    return arr
+
+
+def _detach_stale(names: Iterable[str]) -> None:
+    """Worker-side: unmap blocks left over from previous calls (persistent pools outlive them)."""
+    for name in set(_attached) - set(names):
+        try:
+            _attached.pop(name).close()
+        except BufferError:  # ``func`` kept a view alive; leave it mapped
+            pass
+
+
+def _call_shared(
+    func: Callable[..., typing.Any], kwargs: dict[str, typing.Any], result_name: str | None, item: typing.Any
+) -> typing.Any:
+    """Worker-side :func:`parallel_map` task: resolve shared kwargs, run ``func``, share a large ndarray result.
+
+    The result block is named ``result_name`` (None never shares the result), so the parent can
+    unlink it even if it never receives the result.
+    """
+    handles = {key: value for key, value in kwargs.items() if isinstance(value, _SharedArray)}
+    _detach_stale(handle.name for handle in handles.values())
+    out = func(item, **(kwargs | {key: _attach(handle) for key, handle in handles.items()}))
+
+    if result_name is None or not _is_shareable(out, SHARED_MEMORY_MIN_NBYTES):
+        return out
+    shm, handle = _to_shared(out, result_name)
+    shm.close()  # the parent unlinks the block after copying it out
+    return handle
+
+
+class _SharedTask:
+    """Parent-side: the per-item task of a :func:`parallel_map` call, and the result blocks it may create.
+
+    Task ``index`` writes a large ndarray result to the block ``f"{prefix}{index}"``. Blocks whose
+    result is never collected (an aborted run, whose remaining tasks may still be running in a
+    caller's pool) are unlinked by name on :meth:`close`, or as soon as they arrive after it.
+    """
+
+    def __init__(self, func: Callable[..., typing.Any], kwargs: dict[str, typing.Any], share_results: bool) -> None:
+        self.func = func
+        self.kwargs = kwargs
+        self.prefix = f"psm_{secrets.token_hex(4)}_" if share_results else None
+        self._uncollected: set[int] = set()
+        self._closed = False
+        self._lock = threading.Lock()
+
+    def task(self, index: int) -> Callable[[typing.Any], typing.Any]:
+        """The picklable ``func(item, **kwargs)`` for item ``index``."""
+        if self.prefix is None:
+            if not any(isinstance(value, _SharedArray) for value in self.kwargs.values()):
+                return functools.partial(self.func, **self.kwargs)  # pass kwargs to func
+            return functools.partial(_call_shared, self.func, self.kwargs, None)
+        with self._lock:
+            self._uncollected.add(index)
+        return functools.partial(_call_shared, self.func, self.kwargs, f"{self.prefix}{index}")
+
+    def collect(self, index: int, out: typing.Any) -> typing.Any:
+        """The output of task ``index``, copied out of its result block (which is freed)."""
+        with self._lock:
+            self._uncollected.discard(index)
+        return _from_shared_result(out)
+
+    def finished(self, index: int) -> None:
+        """Result-handler side: task ``index`` returned; free its block if it will never be collected."""
+        with self._lock:
+            if self._closed:
+                self._unlink(index)
+
+    def close(self) -> None:
+        """Free the result blocks that were not collected, now and as later tasks finish."""
+        with self._lock:
+            self._closed = True
+            for index in self._uncollected:
+                self._unlink(index)
+            self._uncollected.clear()
+
+    def _unlink(self, index: int) -> None:
+        try:
+            shm = SharedMemory(f"{self.prefix}{index}")
+        except FileNotFoundError:  # the task is still running, failed, or returned a small output
+            return
+        shm.close()
+        shm.unlink()
+
+
+@contextlib.contextmanager
+def _shared_task(func: Callable[..., typing.Any], kwargs: dict[str, typing.Any]) -> Generator[_SharedTask, None, None]:
+    """Parent-side: move large ndarray kwargs into shared memory for the duration of the block.
+
+    Yields:
+        The per-item tasks; result blocks left uncollected on exit are freed.
+    """
+    kwargs = dict(kwargs)
+    shms: list[SharedMemory] = []
+    shared: _SharedTask | None = None
+    try:
+        for key, value in kwargs.items():
+            if _is_shareable(value, SHARED_MEMORY_MIN_NBYTES):
+                shm, kwargs[key] = _to_shared(value)
+                shms.append(shm)
+        shared = _SharedTask(func, kwargs, share_results="numpy" in sys.modules)
+        yield shared
+    finally:
+        if shared is not None:
+            shared.close()
+        for shm in shms:
+            shm.close()
+            shm.unlink()
+
+
+def _from_shared_result(out: typing.Any) -> typing.Any:
+    """Parent-side: copy an ndarray result out of its worker-created block and free the block."""
+    if not isinstance(out, _SharedArray):
+        return out
+    import numpy as np  # pylint: disable=import-outside-toplevel
+
+    shm = SharedMemory(out.name)
+    try:
+        return np.array(np.ndarray(out.shape, out.dtype, buffer=shm.buf))
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def parallel_map(  # pylint: disable=too-many-arguments,too-many-locals
     func: Callable[..., _T],
     iterable: Iterable[typing.Any],
     *,
     callback: Callable[..., typing.Any] | None = None,
     error_callback: Callable[..., typing.Any] | None = None,
     num_processes: int = NUM_PROCESSES_TO_USE,
+    start_method: str | None = None,
+    pool: Pool | None = None,
+    fail_fast: bool = False,
+    max_failures: int | None = None,
+    telemetry: bool = False,
+    cost: Sequence[float | None] | Callable[[typing.Any], float] | None = None,
+    checkpoint: str | None = None,
+    resume: bool = False,
+    task_progress: bool = False,
     tqdm_kw: dict[str, typing.Any] | None = None,
     **kwargs: typing.Any,
-) -> list[_T]:
+) -> ParallelResult[_T]:
     """Run ``func`` over ``iterable`` in parallel using a process pool.
 
-    ``func`` must be a global (picklable) function. On macOS the ``fork`` start
-    method is used; on Windows the default (``spawn``) is used, so anything not
+    ``func`` must be a global (picklable) function. On Linux and macOS the ``fork``
+    start method is used by default; on Windows ``spawn`` is used, so anything not
     guarded by ``if __name__ == "__main__"`` may be executed in each worker.
 
+    NumPy arrays of at least ``SHARED_MEMORY_MIN_NBYTES`` are not pickled into every task:
+    array ``kwargs`` are copied once into shared memory and reach ``func`` as read-only
+    views, and array results are handed back through shared memory as well.
+
+    Idle workers pull the next task from the pool's queue one item at a time, so uneven
+    per-item costs balance themselves, except for the tail: an expensive item submitted
+    last keeps one worker busy long after the rest finished. Given ``cost``, items are
+    submitted longest-first (LPT scheduling), leaving the cheap items to fill the gaps at
+    the end.
+
+    The bar advances as tasks complete, in whatever order they do. Long tasks can also move it
+    while they run, by calling :func:`report_progress` (see ``task_progress``).
+
     References:
         - https://stackoverflow.com/questions/64095876
         - https://stackoverflow.com/questions/72935231
@@ -41,14 +459,42 @@ def parallel_map(
         func: Function to evaluate in parallel; its first positional argument is
             the per-iteration value.
         iterable: Source of first-argument values for ``func``.
-        callback: Per-task success callback.
-        error_callback: Per-task error callback.
+        callback: Per-task success callback, called with the task output in the calling
+            thread, in completion order.
+        error_callback: Per-task error callback, called with the exception.
         num_processes: Worker process count; capped at ``min(NUM_CPUS, len(iterable))``.
+            Ignored when ``pool`` is given.
+        start_method: ``"fork"``, ``"forkserver"`` or ``"spawn"``; None uses ``DEFAULT_START_METHOD``.
+        pool: Existing pool to run on (see :func:`make_pool` / :func:`get_pool`); it is left
+            running. None creates a pool for this call only.
+        fail_fast: Abort on the first failed task (same as ``max_failures=0``).
+        max_failures: Abort once more than this many tasks failed (None never aborts).
+            Aborting terminates an internal pool, cancelling the outstanding tasks; tasks
+            already queued on a caller-provided ``pool`` still run.
+        telemetry: If True, record per-task wall/CPU time, queue wait, worker id and
+            (de)serialization time in ``.telemetry`` (see :class:`Telemetry`).
+        cost: Per-item cost estimates (a sequence aligned with ``iterable``, or a function
+            of the item), e.g. the ``.durations`` of a previous run on the same items.
+            Unknown (``None``) costs are scheduled first.
+        checkpoint: Directory in which every finished task's output is appended as it
+            arrives (see ``resume``).
+        resume: Continue the run saved in ``checkpoint`` (e.g. one that crashed): its results
+            are loaded and only the remaining indices (including previously failed ones) are
+            run. The checkpoint must be of the same ``func``, ``iterable`` and ``kwargs``. If
+            ``checkpoint`` doesn't exist yet, the run starts from scratch.
+        task_progress: If True, the bar also counts the part of the running tasks that ``func``
+            reported done through :func:`report_progress` (refreshed while waiting for results).
         tqdm_kw: Forwarded to ``tqdm_``.
         **kwargs: Forwarded to ``func`` as keyword arguments.
 
     Returns:
-        ``func`` outputs in the iteration order of ``iterable``.
+        ``func`` outputs in the iteration order of ``iterable``; failed tasks are ``None``,
+        with their exceptions in ``.errors``.
+
+    Raises:
+        ParallelAbortedError: If more than ``max_failures`` tasks failed.
+        FileExistsError: If ``checkpoint`` already exists and ``resume`` is False.
+        ValueError: If ``checkpoint`` holds results of a different ``func``, ``iterable`` or ``kwargs``.
 
     Example:
         >>> import time
@@ -59,12 +505,6 @@ def parallel_map(
         >>> if __name__ == "__main__":
         ...     out = parallel_map(func=func, iterable=range(100), num_processes=8, x=1, y=2)
     """
-    if sys.platform == "darwin":  # in UNIX 'fork' can be used (faster but more dangerous)
-        pool_cls = mp.get_context("fork").Pool
-    else:  # In Windows only 'spawn' is available
-        pool_cls = mp.Pool
-        mp.Process()
-
     if num_processes > NUM_CPUS:
         warnings.warn(
             f"Requested number of processes {num_processes} is larger than number of CPUs {NUM_CPUS}.\n"
@@ -72,47 +512,357 @@ def parallel_map(
             category=UserWarning,
         )
     iterable = list(iterable)
-    num_processes = min(num_processes, NUM_CPUS, len(iterable))
+    result: ParallelResult[_T] = ParallelResult(len(iterable))
+    ckpt = _resume(checkpoint, result, resume=resume, func=func, iterable=iterable, kwargs=kwargs)
+    pending = [index for index in _longest_first(iterable, cost) if ckpt is None or index not in ckpt.done]
+    num_processes = min(num_processes, NUM_CPUS, len(pending))
+    if not pending:
+        return result
 
-    with pool_cls(processes=num_processes) as pool:
-        func_partial = functools.partial(func, **kwargs)  # pass kwargs to func
+    limit = _max_failures(fail_fast, max_failures)
+    tracer = _TaskTracer() if telemetry else None
+    progress = TaskProgress(len(iterable)) if task_progress else None
+    done: queue.SimpleQueue[_DoneEntry] = queue.SimpleQueue()
+    try:
+        with (
+            _shared_task(func, kwargs) as shared,
+            _pool_context(pool, num_processes, start_method) as pool_,
+        ):
+            for index in pending:
+                item = iterable[index]
+                func_task = shared.task(index)
+                func_task = func_task if progress is None else progress.task(index, func_task)
+                task, args = (_timed_call, (func_task, item)) if tracer is None else tracer.task(index, func_task, item)
+                pool_.apply_async(
+                    task,
+                    args=args,
+                    callback=functools.partial(_on_task_done, done, shared, index),
+                    error_callback=functools.partial(_on_task_error, done, index),
+                )
 
-        out_async = [
-            pool.apply_async(
-                func=func_partial,
-                args=(i,),
-                callback=callback,
-                error_callback=error_callback,
+            completions = (
+                (done.get() for _ in tqdm_(range(len(pending)), **(tqdm_kw or {})))
+                if progress is None
+                else progress.completed(done, len(pending), tqdm_kw or {})
             )
-            for i in iterable
-        ]
+            for index, out, err in completions:  # in completion order
+                if err is not None:
+                    if error_callback is not None:
+                        error_callback(err)
+                    _record_failure(result, index, err, limit)
+                    continue
+                value, result.durations[index] = out if tracer is None else tracer.finish(index, out)
+                result[index] = shared.collect(index, value)
+                if ckpt is not None:
+                    ckpt.append(index, result[index], result.durations[index])
+                if callback is not None:
+                    callback(result[index])
+    finally:
+        if tracer is not None:
+            tracer.telemetry.stop()
+            result.telemetry = tracer.telemetry
+        if ckpt is not None:
+            ckpt.close()
+        if progress is not None:
+            progress.close()
+
+    return result
+
+
+class _Checkpoint:
+    """Append-only log of finished :func:`parallel_map` tasks in ``directory``.
+
+    ``results.bin`` holds one record per task: a ``(index, size)`` header followed by
+    ``size`` bytes of pickled ``(output, duration)``. Records are flushed as they are
+    written, so a crash loses at most the record being written, which :meth:`load`
+    discards. ``meta.json`` identifies the run the log belongs to: the function, and a
+    hash of its inputs (see :func:`_fingerprint`).
+    """
+
+    _HEADER = struct.Struct("<QQ")
+
+    def __init__(self, directory: str, meta: dict[str, typing.Any], resume: bool) -> None:
+        meta_path = os.path.join(directory, "meta.json")
+        if os.path.exists(meta_path):
+            if not resume:
+                raise FileExistsError(f"Checkpoint '{directory}' already exists; pass resume=True to continue it.")
+            with open(meta_path, encoding="utf-8") as f:
+                saved = json.load(f)
+            if saved != meta:
+                raise ValueError(f"Checkpoint '{directory}' belongs to another run ({saved}); expected {meta}.")
+        os.makedirs(directory, exist_ok=True)
+        self.path = os.path.join(directory, "results.bin")
+        self.done: set[int] = set()
+        self.file: typing.BinaryIO | None = None
+        if not os.path.exists(meta_path):
+            with open(meta_path, "w", encoding="utf-8") as f:
+                json.dump(meta, f)
+
+    def load(self) -> dict[int, tuple[typing.Any, float | None]]:
+        """Read back the complete records (dropping a torn last one).
+
+        Returns:
+            ``{index: (output, duration)}``.
+        """
+        out: dict[int, tuple[typing.Any, float | None]] = {}
+        if not os.path.exists(self.path):
+            return out
+        with open(self.path, "rb") as f:
+            data = f.read()
+        pos = 0
+        while pos + self._HEADER.size <= len(data):
+            index, size = self._HEADER.unpack_from(data, pos)
+            end = pos + self._HEADER.size + size
+            if end > len(data):
+                break
+            out[index] = pickle.loads(data[pos + self._HEADER.size : end])
+            pos = end
+        if pos < len(data):  # torn write: cut it off, so that new records are appended after the last good one
+            with open(self.path, "r+b") as f:
+                f.truncate(pos)
+        self.done.update(out)
+        return out
+
+    def append(self, index: int, output: typing.Any, duration: float | None) -> None:
+        """Persist one finished task."""
+        if self.file is None:
+            self.file = open(self.path, "ab")  # pylint: disable=consider-using-with
+        payload = pickle.dumps((output, duration), protocol=pickle.HIGHEST_PROTOCOL)
+        self.file.write(self._HEADER.pack(index, len(payload)) + payload)
+        self.file.flush()
+        self.done.add(index)
+
+    def close(self) -> None:
+        """Close the log file."""
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+
+def _fingerprint(
+    func: Callable[..., typing.Any],
+    iterable: list[typing.Any],
+    kwargs: dict[str, typing.Any],
+) -> dict[str, typing.Any]:
+    """Identify a :func:`parallel_map` run: ``func``'s name, and a hash of everything it is called with.
+
+    ``functools.partial`` objects are unwrapped, their bound arguments counting as inputs.
+    """
+    bound: list[typing.Any] = []
+    while isinstance(func, functools.partial):
+        bound.append((func.args, func.keywords))
+        func = func.func
+    name = getattr(func, "__qualname__", type(func).__qualname__)  # callable instances are named by their class
+    return {
+        "func": f"{getattr(func, '__module__', type(func).__module__)}.{name}",
+        "num_tasks": len(iterable),
+        "inputs": hash_value([bound, iterable, kwargs]),
+    }
+
+
+def _resume(
+    checkpoint: str | None,
+    result: ParallelResult[_T],
+    *,
+    resume: bool,
+    func: Callable[..., typing.Any],
+    iterable: list[typing.Any],
+    kwargs: dict[str, typing.Any],
+) -> _Checkpoint | None:
+    """Open the ``checkpoint`` of a :func:`parallel_map` run and fill ``result`` with what it holds."""
+    if checkpoint is None:
+        return None
+    ckpt = _Checkpoint(checkpoint, _fingerprint(func, iterable, kwargs), resume)
+    for index, (value, duration) in ckpt.load().items():
+        result[index], result.durations[index] = value, duration
+    return ckpt
+
 
-        out: list[_T] = []
+def _longest_first(
+    items: list[typing.Any], cost: Sequence[float | None] | Callable[[typing.Any], float] | None
+) -> list[int]:
+    """Indices of ``items`` by decreasing ``cost`` (input order if None; unknown costs first)."""
+    if cost is None:
+        return list(range(len(items)))
+    costs = [cost(item) for item in items] if callable(cost) else list(cost)
+    assert len(costs) == len(items), f"Got {len(costs)} costs for {len(items)} items."
+    return sorted(range(len(items)), key=lambda i: -math.inf if costs[i] is None else -typing.cast(float, costs[i]))
 
-        if tqdm_kw is None:
-            tqdm_kw = {}
 
-        for out_async_i in tqdm_(out_async, **tqdm_kw):
-            try:
-                out += [out_async_i.get()]
+def _on_task_done(done: queue.SimpleQueue[typing.Any], shared: _SharedTask, index: int, out: typing.Any) -> None:
+    """Parent-side :func:`parallel_map` task callback (runs in the pool's result-handler thread)."""
+    done.put((index, out, None))
+    shared.finished(index)
 
-            except KeyboardInterrupt as e:
-                raise e
 
-            except Exception as e:  # pylint: disable=broad-exception-caught
-                warnings.warn(f"Exception at index {out_async_i}: {e}")
+def _on_task_error(done: queue.SimpleQueue[typing.Any], index: int, err: BaseException) -> None:
+    """Parent-side :func:`parallel_map` task error callback."""
+    done.put((index, None, err))
 
-    return out
 
+def _run_chunk(func: Callable[[typing.Any], _T], chunk: list[typing.Any]) -> tuple[list[_T], float]:
+    """Worker-side: evaluate ``func`` over one chunk and report how long it took."""
+    t0 = time.perf_counter()
+    out = [func(item) for item in chunk]
+    return out, time.perf_counter() - t0
 
-def parallel_threading(
+
+class _ChunkSizer:
+    """Adaptive chunk size for :func:`parallel_imap`.
+
+    Starts at one item and steers towards ``_TARGET_CHUNK_SEC`` of work per chunk from the
+    measured per-item cost, at most doubling per step. With a known input length, chunks are
+    capped so every worker still gets ~4 of them (same heuristic as ``Pool.map``), and shrink
+    towards the end of the input (guided self-scheduling) so that no worker is left finishing
+    a large chunk while the others idle.
+    """
+
+    def __init__(self, chunksize: int | None, total: int | None, num_processes: int) -> None:
+        self.fixed = chunksize is not None
+        self.size = chunksize if chunksize is not None else 1
+        self.max_size = _MAX_CHUNKSIZE if total is None else max(1, -(-total // (4 * num_processes)))
+        self.total = total
+        self.num_processes = num_processes
+        self.consumed = 0
+
+    def claim(self) -> int:
+        """Size of the next chunk to hand out."""
+        size = self.size
+        if not self.fixed and self.total is not None:
+            size = max(1, min(size, -(-(self.total - self.consumed) // (2 * self.num_processes))))
+        self.consumed += size
+        return size
+
+    def update(self, num_items: int, elapsed: float) -> None:
+        """Feed back the wall time ``elapsed`` a chunk of ``num_items`` items took in a worker."""
+        if self.fixed or num_items == 0:
+            return
+        per_item = elapsed / num_items
+        target = int(_TARGET_CHUNK_SEC / per_item) if per_item > 0 else self.max_size
+        self.size = max(1, min(target, 2 * self.size, self.max_size))
+
+
+def parallel_imap(  # pylint: disable=too-many-arguments
+    func: Callable[..., _T],
+    iterable: Iterable[typing.Any],
+    *,
+    num_processes: int = NUM_PROCESSES_TO_USE,
+    chunksize: int | None = None,
+    max_in_flight: int | None = None,
+    ordered: bool = True,
+    start_method: str | None = None,
+    pool: Pool | None = None,
+    tqdm_kw: dict[str, typing.Any] | None = None,
+    **kwargs: typing.Any,
+) -> Generator[_T, None, None]:
+    """Lazily stream ``func`` over ``iterable`` through a process pool with bounded memory.
+
+    Unlike :func:`parallel_map`, the input is consumed on demand (generators are never
+    materialized), items are shipped to workers in chunks, and at most ``max_in_flight``
+    chunks are submitted-but-not-yet-yielded at any time, so memory stays bounded for
+    arbitrarily long inputs. Results are yielded as soon as they are available.
+
+    ``func`` must be a global (picklable) function (see :func:`parallel_map`). An internal
+    pool lives as long as the generator; closing it early terminates the workers. With a
+    caller-provided ``pool``, chunks already submitted keep running after an early close.
+
+    Args:
+        func: Function to evaluate in parallel; its first positional argument is
+            the per-iteration value.
+        iterable: Source of first-argument values for ``func`` (may be an endless generator).
+        num_processes: Worker process count; capped at ``NUM_CPUS`` (and ``len(iterable)`` if known).
+        chunksize: Items per task. None adapts it on the fly to ~``_TARGET_CHUNK_SEC`` of work per chunk.
+        max_in_flight: Maximum outstanding chunks (default ``2 * num_processes``).
+        ordered: If True, yield in input order (later chunks that finish early are buffered,
+            within the ``max_in_flight`` bound); otherwise yield in completion order.
+        start_method: ``"fork"``, ``"forkserver"`` or ``"spawn"``; None uses ``DEFAULT_START_METHOD``.
+        pool: Existing pool to run on (left running); None creates one for this generator.
+        tqdm_kw: Forwarded to ``tqdm_``.
+        **kwargs: Forwarded to ``func`` as keyword arguments.
+
+    Yields:
+        ``func`` outputs.
+
+    Raises:
+        Exception: Any exception raised by ``func`` is re-raised when its chunk completes.
+
+    Example:
+        >>> def func(it, x):
+        ...     return it * x
+        >>>
+        >>> if __name__ == "__main__":
+        ...     total = sum(parallel_imap(func, range(10_000_000), x=2))
+    """
+    total = len(iterable) if hasattr(iterable, "__len__") else None  # type: ignore[arg-type]
+    num_processes = min(num_processes, NUM_CPUS, total if total else NUM_CPUS)
+    if max_in_flight is None:
+        max_in_flight = 2 * num_processes
+    sizer = _ChunkSizer(chunksize, total, num_processes)
+    it = iter(iterable)
+    func_partial = functools.partial(func, **kwargs)  # pass kwargs to func
+
+    def results() -> Generator[_T, None, None]:
+        done: queue.SimpleQueue[tuple[int, tuple[list[_T], float] | None, BaseException | None]] = queue.SimpleQueue()
+
+        def on_result(idx: int, res: tuple[list[_T], float]) -> None:
+            done.put((idx, res, None))
+
+        def on_error(idx: int, err: BaseException) -> None:
+            done.put((idx, None, err))
+
+        with _pool_context(pool, num_processes, start_method) as pool_:
+            num_submitted = num_done = 0
+            buffered: dict[int, list[_T]] = {}
+            exhausted = False
+
+            while True:
+                while not exhausted and num_submitted - num_done < max_in_flight:
+                    chunk = list(itertools.islice(it, sizer.claim()))
+                    if not chunk:
+                        exhausted = True
+                        break
+                    pool_.apply_async(
+                        _run_chunk,
+                        args=(func_partial, chunk),
+                        callback=functools.partial(on_result, num_submitted),
+                        error_callback=functools.partial(on_error, num_submitted),
+                    )
+                    num_submitted += 1
+
+                if num_done == num_submitted:
+                    return
+
+                idx, res, err = done.get()
+                if err is not None:
+                    raise err
+                assert res is not None
+                values, elapsed = res
+                sizer.update(len(values), elapsed)
+
+                if not ordered:
+                    num_done += 1
+                    yield from values
+                    continue
+                buffered[idx] = values
+                while num_done in buffered:
+                    yield from buffered.pop(num_done)
+                    num_done += 1
+
+    yield from tqdm_(results(), **({"total": total} | (tqdm_kw or {})))
+
+
+def parallel_threading(  # pylint: disable=too-many-locals
     func: Callable[..., _T],
     iterable: Iterable[typing.Any],
     lock: bool = False,
     num_threads: int = NUM_THREADS_TO_USE,
     tqdm_kw: dict[str, typing.Any] | None = None,
+    *,
+    fail_fast: bool = False,
+    max_failures: int | None = None,
+    telemetry: bool = False,
     **kwargs: typing.Any,
-) -> list[_T | None]:
+) -> ParallelResult[_T]:
     """Run ``func`` over ``iterable`` in parallel using a thread pool.
 
     Args:
@@ -122,37 +872,295 @@ def parallel_threading(
         lock: If True, serialize calls to ``func`` via a shared lock.
         num_threads: Worker thread count.
         tqdm_kw: Forwarded to ``tqdm_``.
+        fail_fast: Abort on the first failed task (same as ``max_failures=0``).
+        max_failures: Abort once more than this many tasks failed (None never aborts).
+            Aborting cancels the tasks that haven't started yet.
+        telemetry: If True, record per-task wall/CPU time, queue wait and worker thread
+            in ``.telemetry`` (see :class:`Telemetry`).
         **kwargs: Forwarded to ``func`` as keyword arguments.
 
     Returns:
-        ``func`` outputs in the iteration order of ``iterable``;
-        any item whose call raised an exception is ``None``.
+        ``func`` outputs in the iteration order of ``iterable``; failed tasks are ``None``,
+        with their exceptions in ``.errors``.
+
+    Raises:
+        ParallelAbortedError: If more than ``max_failures`` tasks failed.
     """
-    thread_lock: threading.Lock | None = threading.Lock() if lock else None
+    thread_lock = threading.Lock() if lock else contextlib.nullcontext()
+    trace = Telemetry() if telemetry else None
+    submitted: dict[int, float] = {}
 
-    def wrapped_func(index: int, item: typing.Any) -> tuple[int, _T | None]:
-        try:
-            if thread_lock is not None:
-                with thread_lock:
-                    result = func(item, **kwargs)
-            else:
-                result = func(item, **kwargs)
-            return index, result
-        except Exception as e:  # pylint: disable=broad-exception-caught
-            warnings.warn(f"Exception at index {index}: {e}")
-            return index, None
+    def wrapped_func(index: int, item: typing.Any) -> tuple[_T, float]:
+        with thread_lock:
+            started, cpu0 = time.time(), time.thread_time()
+            out, elapsed = _timed_call(functools.partial(func, **kwargs), item)
+            if trace is not None:
+                cpu = time.thread_time() - cpu0
+                trace.records.append(
+                    TaskRecord(index, threading.get_ident(), submitted[index], started, started + elapsed, cpu, 0.0)
+                )
+            return out, elapsed
 
     iterable = list(iterable)
-    out: list[_T | None] = [None] * len(iterable)
+    result: ParallelResult[_T] = ParallelResult(len(iterable))
+    limit = _max_failures(fail_fast, max_failures)
     with ThreadPoolExecutor(max_workers=num_threads) as executor:
-        futures = [executor.submit(wrapped_func, i, item) for i, item in enumerate(iterable)]
+        futures = {}
+        for index, item in enumerate(iterable):
+            submitted[index] = time.time()
+            futures[executor.submit(wrapped_func, index, item)] = index
+        try:
+            for future in tqdm_(as_completed(futures), **({"total": len(futures)} | (tqdm_kw or {}))):
+                index = futures[future]
+                try:
+                    result[index], result.durations[index] = future.result()
+                except Exception as e:  # pylint: disable=broad-exception-caught
+                    _record_failure(result, index, e, limit)
+        except BaseException:
+            executor.shutdown(cancel_futures=True)
+            raise
+        finally:
+            if trace is not None:
+                trace.stop()
+                result.telemetry = trace
+
+    return result
+
+
+async def _call_with_retries(
+    coro_fn: Callable[..., Awaitable[_T]],
+    item: typing.Any,
+    kwargs: dict[str, typing.Any],
+    *,
+    timeout: float | None,
+    retries: int,
+    retry_delay: float,
+) -> tuple[_T, float]:
+    """Await ``coro_fn(item, **kwargs)``, retrying failures (timeouts included) with exponential backoff.
+
+    Returns:
+        The output, and the seconds it took (all attempts included).
+    """
+    t0 = time.perf_counter()
+    attempt = 0
+    while True:
+        try:
+            return await asyncio.wait_for(coro_fn(item, **kwargs), timeout), time.perf_counter() - t0
+        except Exception:  # pylint: disable=broad-exception-caught
+            if attempt == retries:
+                raise
+        await asyncio.sleep(retry_delay * 2**attempt)
+        attempt += 1
+
+
+async def _as_completed_bounded(
+    coros: Iterable[tuple[int, Awaitable[_T]]], concurrency: int
+) -> AsyncGenerator[tuple[int, _T | TaskError], None]:
+    """Run at most ``concurrency`` of ``coros`` at once, yielding ``(index, result)`` as each one finishes.
+
+    ``coros`` is pulled lazily, one coroutine per freed slot. A failed coroutine yields its
+    :class:`TaskError` as its result.
+    """
+    coros = iter(coros)
+    pending: dict[asyncio.Future[_T], int] = {}
+    try:
+        while True:
+            for index, coro in itertools.islice(coros, concurrency - len(pending)):
+                pending[asyncio.ensure_future(coro)] = index
+            if not pending:
+                return
 
-        if tqdm_kw is None:
-            tqdm_kw = {}
-        tqdm_kw = {"total": len(futures)} | tqdm_kw
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                index = pending.pop(task)
+                try:
+                    result: _T | TaskError = task.result()
+                except Exception as e:  # pylint: disable=broad-exception-caught
+                    result = TaskError(e, "".join(traceback.format_exception(e)))
+                yield index, result
+    finally:
+        for task in pending:  # cancelled (or raised a BaseException) before finishing: don't leak the window
+            task.cancel()
 
-        for future in tqdm_(as_completed(futures), **tqdm_kw):
-            index, result = future.result()
-            out[index] = result
 
-    return out
+async def _run_async(
+    coro_fn: Callable[..., Awaitable[_T]],
+    iterable: Iterable[typing.Any],
+    kwargs: dict[str, typing.Any],
+    *,
+    concurrency: int,
+    timeout: float | None,
+    retries: int,
+    retry_delay: float,
+    tqdm_kw: dict[str, typing.Any] | None,
+) -> AsyncGenerator[tuple[int, tuple[_T, float] | TaskError], None]:
+    """Yield ``(index, (output, seconds))`` or ``(index, TaskError)`` per item as it completes, with a progress bar."""
+    total = len(iterable) if hasattr(iterable, "__len__") else None  # type: ignore[arg-type]
+    # ``tqdm_`` wraps a synchronous iterable, so drive it by hand: one ``next`` per finished item
+    progress = tqdm_(
+        itertools.repeat(None) if total is None else itertools.repeat(None, total),
+        **({"total": total} | (tqdm_kw or {})),
+    )
+    next(progress, None)
+
+    coros = (
+        (i, _call_with_retries(coro_fn, item, kwargs, timeout=timeout, retries=retries, retry_delay=retry_delay))
+        for i, item in enumerate(iterable)
+    )
+    try:
+        async for index, output in _as_completed_bounded(coros, concurrency):
+            next(progress, None)
+            yield index, output
+    finally:
+        progress.close()  # flush the count (the bar only catches up once per refresh interval)
+
+
+async def parallel_async_iter(
+    coro_fn: Callable[..., Awaitable[_T]],
+    iterable: Iterable[typing.Any],
+    *,
+    concurrency: int = NUM_CONCURRENT_TASKS,
+    timeout: float | None = None,
+    retries: int = 0,
+    retry_delay: float = 0.0,
+    tqdm_kw: dict[str, typing.Any] | None = None,
+    **kwargs: typing.Any,
+) -> AsyncGenerator[tuple[int, _T | TaskError], None]:
+    """Like :func:`parallel_async`, but yield every item's output as soon as it is ready.
+
+    Args:
+        coro_fn: ``async`` function evaluated per item; its first positional argument is
+            the per-iteration value.
+        iterable: Source of first-argument values for ``coro_fn``.
+        concurrency: Maximum number of items in flight.
+        timeout: Per-attempt timeout in seconds (None waits forever).
+        retries: Extra attempts for an item whose call raised or timed out.
+        retry_delay: Delay before the first retry, doubled on every further retry.
+        tqdm_kw: Forwarded to ``tqdm_``.
+        **kwargs: Forwarded to ``coro_fn`` as keyword arguments.
+
+    Yields:
+        ``(index, output)`` in completion order, ``index`` being the item's position in
+        ``iterable``. An item whose last attempt failed yields its :class:`TaskError` as
+        ``output`` (as ``asyncio.gather(..., return_exceptions=True)`` does).
+
+    Example:
+        >>> async for index, page in parallel_async_iter(fetch, urls, concurrency=200, session=session):
+        ...     if not isinstance(page, TaskError):
+        ...         save(urls[index], page)
+    """
+    run = _run_async(
+        coro_fn,
+        iterable,
+        kwargs,
+        concurrency=concurrency,
+        timeout=timeout,
+        retries=retries,
+        retry_delay=retry_delay,
+        tqdm_kw=tqdm_kw,
+    )
+    async with contextlib.aclosing(run):  # stopping early cancels the items in flight
+        async for index, output in run:
+            yield index, output if isinstance(output, TaskError) else output[0]
+
+
+class _CountingIterator(Iterator[typing.Any]):
+    """Iterator over ``iterable`` that counts the items drawn from it so far."""
+
+    def __init__(self, iterable: Iterable[typing.Any]) -> None:
+        self._it = iter(iterable)
+        self.count = 0
+
+    def __next__(self) -> typing.Any:
+        item = next(self._it)
+        self.count += 1
+        return item
+
+
+async def parallel_async(  # pylint: disable=too-many-arguments,too-many-locals
+    coro_fn: Callable[..., Awaitable[_T]],
+    iterable: Iterable[typing.Any],
+    *,
+    concurrency: int = NUM_CONCURRENT_TASKS,
+    timeout: float | None = None,
+    retries: int = 0,
+    retry_delay: float = 0.0,
+    fail_fast: bool = False,
+    max_failures: int | None = None,
+    tqdm_kw: dict[str, typing.Any] | None = None,
+    **kwargs: typing.Any,
+) -> ParallelResult[_T]:
+    """Run coroutine function ``coro_fn`` over ``iterable`` concurrently on the running event loop.
+
+    The asyncio counterpart of :func:`parallel_threading` for I/O-bound work: thousands of
+    concurrent requests cost one task each instead of one OS thread each. At most
+    ``concurrency`` items are in flight; the next item is pulled from ``iterable`` (which is
+    consumed lazily) as soon as one finishes. From synchronous code, use
+    ``asyncio.run(parallel_async(...))``. To handle outputs as they complete, use
+    :func:`parallel_async_iter`.
+
+    Args:
+        coro_fn: ``async`` function evaluated per item; its first positional argument is
+            the per-iteration value.
+        iterable: Source of first-argument values for ``coro_fn``.
+        concurrency: Maximum number of items in flight.
+        timeout: Per-attempt timeout in seconds (None waits forever).
+        retries: Extra attempts for an item whose call raised or timed out.
+        retry_delay: Delay before the first retry, doubled on every further retry.
+        fail_fast: Abort on the first failed item (same as ``max_failures=0``).
+        max_failures: Abort once more than this many items failed (None never aborts).
+            Aborting cancels the items in flight.
+        tqdm_kw: Forwarded to ``tqdm_``.
+        **kwargs: Forwarded to ``coro_fn`` as keyword arguments.
+
+    Returns:
+        ``coro_fn`` outputs in the iteration order of ``iterable``; items whose last attempt
+        failed are ``None``, with their exceptions in ``.errors``. ``.durations`` include retries.
+
+    Raises:
+        ParallelAbortedError: If more than ``max_failures`` items failed. The partial result
+            still has one entry per input; for an unsized ``iterable``, the inputs that never
+            ran are drawn (not run) to count them.
+
+    Example:
+        >>> async def fetch(url, session):
+        ...     async with session.get(url) as response:
+        ...         return await response.read()
+        >>>
+        >>> async def main(urls):
+        ...     async with aiohttp.ClientSession() as session:
+        ...         return await parallel_async(fetch, urls, concurrency=200, timeout=10, retries=2, session=session)
+        >>>
+        >>> pages = asyncio.run(main(urls))
+    """
+    limit = _max_failures(fail_fast, max_failures)
+    outputs: dict[int, tuple[_T, float]] = {}
+    errors: dict[int, TaskError] = {}
+    items = iterable if isinstance(iterable, Sized) else _CountingIterator(iterable)
+    run = _run_async(
+        coro_fn,
+        items,
+        kwargs,
+        concurrency=concurrency,
+        timeout=timeout,
+        retries=retries,
+        retry_delay=retry_delay,
+        tqdm_kw=tqdm_kw,
+    )
+    async with contextlib.aclosing(run):  # aborting cancels the items in flight
+        async for index, output in run:
+            if isinstance(output, TaskError):
+                errors[index] = output
+                if len(errors) > limit:
+                    break
+            else:
+                outputs[index] = output
+
+    # An aborted run leaves the rest of a lazy iterable unconsumed; count it (without running it) to size the result
+    num_items = len(items) if isinstance(items, Sized) else items.count + sum(1 for _ in items)
+    result: ParallelResult[_T] = ParallelResult(num_items)
+    for index, (value, duration) in outputs.items():
+        result[index], result.durations[index] = value, duration
+    for index in sorted(errors):
+        _record_failure(result, index, errors[index].exception, limit)
+    return result
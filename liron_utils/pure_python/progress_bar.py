@@ -7,22 +7,45 @@ __all__ = [
     "TqdmProgressBar",
     "HTMLProgressBar",
     "tqdm_",
+    "TaskProgress",
+    "report_progress",
 ]
 
-import datetime
+import functools
+import math
+import queue
 import sys
+import threading
 import time
 import typing
 from collections.abc import Callable, Generator, Iterable
+from multiprocessing.shared_memory import SharedMemory
 
 from tqdm.auto import tqdm
 
 _T = typing.TypeVar("_T")
 
 
-class BaseProgressBar:
+_RATE_SMOOTHING = 0.3  # weight of the newest rate sample in the EWMA (as tqdm's ``smoothing``)
+
+
+def _format_duration(seconds: float) -> str:
+    """Format a duration as ``"DD:HH:MM:SS"``."""
+    minutes, sec = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    days, hours = divmod(hours, 24)
+    return "%02d:%02d:%02d:%02d" % (days, hours, minutes, sec)
+
+
+class BaseProgressBar:  # pylint: disable=too-many-instance-attributes
     """Abstract progress bar with shared timing helpers.
 
+    :meth:`update` is cheap enough for tight loops: it only adds to a counter, and every so
+    often (sized from the observed rate to land a few times per refresh interval) reads the
+    clock, updates the rate estimate and lets the subclass render (:meth:`render`), at most
+    ``refresh_rate`` times per second and only once progress crossed the next ``chunk_size``
+    percent. The last step is always rendered.
+
     Example:
         >>> import numpy as np
         >>> n_vec = np.linspace(0, 10, 100)
@@ -32,12 +55,13 @@ class BaseProgressBar:
         >>> pbar.finished()
     """
 
-    def __init__(self, iterations: int | float = 0, chunk_size: int | float = 10) -> None:
+    def __init__(self, iterations: int | float = 0, chunk_size: int | float = 10, refresh_rate: float = 10.0) -> None:
         """Initialize the bar.
 
         Args:
             iterations: Total iteration count (or duration).
             chunk_size: Progress threshold for updates (in percent).
+            refresh_rate: Maximal number of renders per second.
         """
         self.n_total = float(iterations)
         self.n = 0
@@ -45,9 +69,52 @@ class BaseProgressBar:
         self.p_chunk = chunk_size
         self.t_start = time.time()
         self.t_done = self.t_start - 1
+        self.min_interval = 1 / refresh_rate
+        self.rate = 0.0  # steps/sec, exponentially weighted moving average
 
-    def update(self) -> None:
-        """Advance the progress bar by one step. Overridden by subclasses."""
+        self._next_check = 1  # step count at which to look at the clock next
+        self._stride = 1
+        self._last_n, self._last_t = 0, time.monotonic()
+        self._next_render = 0.0
+        self._rendered_n = 0
+
+    def update(self, n: int = 1) -> None:
+        """Advance the progress bar by ``n`` steps.
+
+        Args:
+            n: Number of steps done since the last call.
+        """
+        self.n += n
+        if self.n >= self._next_check:
+            self._tick()
+
+    def _tick(self) -> None:
+        """Sample the rate, schedule the next clock read and render if due."""
+        now = time.monotonic()
+        if now > self._last_t:
+            sample = (self.n - self._last_n) / (now - self._last_t)
+            self.rate = sample if not self.rate else _RATE_SMOOTHING * sample + (1 - _RATE_SMOOTHING) * self.rate
+            self._stride = max(1, min(2 * self._stride, int(sample * self.min_interval / 4)))
+            self._last_n, self._last_t = self.n, now
+        self._next_check = self.n + self._stride
+        if self.n < self.n_total:  # don't step over the end, which is always rendered
+            self._next_check = min(self._next_check, math.ceil(self.n_total))
+
+        p = self.percent()
+        last = self.n >= self.n_total > self._rendered_n
+        if last or (p >= self.p_chunk and now >= self._next_render):
+            self._next_render = now + self.min_interval
+            self._rendered_n = self.n
+            if self.p_chunk_size > 0:  # skip the chunks crossed since the last render
+                self.p_chunk += self.p_chunk_size * (1 + int((p - self.p_chunk) // self.p_chunk_size))
+            self.render(p)
+
+    def render(self, p: float) -> None:
+        """Draw the bar at progress percentage ``p``. Overridden by subclasses."""
+
+    def percent(self) -> float:
+        """Return the current progress in percent."""
+        return 100.0 * self.n / self.n_total if self.n_total > 0 else 0.0
 
     def total_time(self) -> float:
         """Return the total elapsed time, in seconds."""
@@ -60,26 +127,23 @@ class BaseProgressBar:
     def time_remaining_est(self, p: float) -> str:
         """Estimate the remaining time at progress percentage ``p``.
 
+        The steps left are divided by the smoothed rate, so the estimate follows changes in
+        speed rather than averaging over the whole run (which it falls back to before the
+        first rate sample).
+
         Args:
             p: Current progress in percent (``0 < p <= 100``).
 
         Returns:
             ``"DD:HH:MM:SS"`` string of remaining time.
         """
-        if 100 >= p > 0.0:
-            t_r_est = (time.time() - self.t_start) * (100.0 - p) / p
+        if not 100 >= p > 0.0:
+            t_r_est = 0.0
+        elif self.rate > 0:
+            t_r_est = self.n_total * (100.0 - p) / 100.0 / self.rate
         else:
-            t_r_est = 0
-
-        dd = datetime.datetime(1, 1, 1) + datetime.timedelta(seconds=t_r_est)
-        time_string = "%02d:%02d:%02d:%02d" % (
-            dd.day - 1,
-            dd.hour,
-            dd.minute,
-            dd.second,
-        )
-
-        return time_string
+            t_r_est = (time.time() - self.t_start) * (100.0 - p) / p
+        return _format_duration(t_r_est)
 
     def finished(self) -> None:
         """Mark the bar as finished and record the completion time."""
@@ -89,18 +153,13 @@ class BaseProgressBar:
 class TextProgressBar(BaseProgressBar):
     """A simple text-based progress bar printed to stdout."""
 
-    def update(self) -> None:
-        self.n += 1
-        n = self.n
-        p = (n / self.n_total) * 100.0
-        if p >= self.p_chunk:
-            print(
-                "%4.1f%%." % p
-                + " Run time: %s." % self.time_elapsed()
-                + " Est. time left: %s" % self.time_remaining_est(p),
-            )
-            sys.stdout.flush()
-            self.p_chunk += self.p_chunk_size
+    def render(self, p: float) -> None:
+        print(
+            "%4.1f%%." % p
+            + " Run time: %s." % self.time_elapsed()
+            + " Est. time left: %s" % self.time_remaining_est(p),
+        )
+        sys.stdout.flush()
 
     def finished(self) -> None:
         self.t_done = time.time()
@@ -108,17 +167,15 @@ class TextProgressBar(BaseProgressBar):
 
 
 class EnhancedTextProgressBar(BaseProgressBar):
-    """A text-based bar that draws a fixed-width ``[*** ]`` progress widget."""
+    """A text-based bar that draws a fixed-width ``[*** ]`` progress widget, redrawn in place."""
 
-    def __init__(self, iterations: int | float = 0, chunk_size: int | float = 10) -> None:
-        super().__init__(iterations, chunk_size)
+    def __init__(self, iterations: int | float = 0, chunk_size: int | float = 0, refresh_rate: float = 10.0) -> None:
+        super().__init__(iterations, chunk_size, refresh_rate)
         self.fill_char = "*"
         self.width = 25
 
-    def update(self) -> None:
-        self.n += 1
-        n = self.n
-        percent_done = int(round(n / self.n_total * 100.0))
+    def render(self, p: float) -> None:
+        percent_done = int(round(p))
         all_full = self.width - 2
         num_hashes = int(round((percent_done / 100.0) * all_full))
         prog_bar = "[" + self.fill_char * num_hashes + " " * (all_full - num_hashes) + "]"
@@ -127,7 +184,7 @@ class EnhancedTextProgressBar(BaseProgressBar):
         prog_bar = prog_bar[0:pct_place] + (pct_string + prog_bar[pct_place + len(pct_string) :])
         prog_bar += " Elapsed {} / Remaining {}".format(
             self.time_elapsed().strip(),
-            self.time_remaining_est(percent_done),
+            self.time_remaining_est(p),
         )
         print("\r", prog_bar, end="")
         sys.stdout.flush()
@@ -153,15 +210,15 @@ class TqdmProgressBar(BaseProgressBar):
         self.t_start = time.time()
         self.t_done = self.t_start - 1
 
-    def update(self) -> None:
-        self.pbar.update()
+    def update(self, n: int = 1) -> None:
+        self.pbar.update(n)
 
     def finished(self) -> None:
         self.pbar.close()
         self.t_done = time.time()
 
 
-class HTMLProgressBar(BaseProgressBar):  # pylint: disable=too-many-instance-attributes
+class HTMLProgressBar(BaseProgressBar):
     """HTML progress bar for IPython notebooks.
 
     Based on the IPython ProgressBar demo notebook at
@@ -175,8 +232,8 @@ class HTMLProgressBar(BaseProgressBar):  # pylint: disable=too-many-instance-att
         ...     pbar.update()
     """
 
-    def __init__(self, iterations: int | float = 0, chunk_size: float = 1.0) -> None:
-        super().__init__(iterations, chunk_size)
+    def __init__(self, iterations: int | float = 0, chunk_size: float = 1.0, refresh_rate: float = 10.0) -> None:
+        super().__init__(iterations, chunk_size, refresh_rate)
 
         import uuid  # pylint: disable=import-outside-toplevel
 
@@ -200,35 +257,19 @@ class HTMLProgressBar(BaseProgressBar):  # pylint: disable=too-many-instance-att
         )
         self.display(self.pb)  # type: ignore[no-untyped-call]
 
-    def update(self) -> None:
-        self.n += 1
-        n = self.n
-        p = (n / self.n_total) * 100.0
-        if p >= self.p_chunk:
-            lbl = "Elapsed time: %s. " % self.time_elapsed() + "Est. remaining time: %s." % self.time_remaining_est(p)
-            js_code = (
-                "$('div#%s').width('%i%%');"
-                % (
-                    self.divid,
-                    p,
-                )
-                + f"$('p#{self.textid}').text('{lbl}');"
-            )
-            self.display(self._javascript_cls(js_code))  # type: ignore[no-untyped-call]
-            self.p_chunk += self.p_chunk_size
+    def render(self, p: float) -> None:
+        lbl = "Elapsed time: %s. " % self.time_elapsed() + "Est. remaining time: %s." % self.time_remaining_est(p)
+        js_code = "$('div#%s').width('%i%%');" % (self.divid, p) + f"$('p#{self.textid}').text('{lbl}');"
+        self.display(self._javascript_cls(js_code))  # type: ignore[no-untyped-call]
 
     def finished(self) -> None:
         self.t_done = time.time()
         lbl = "Elapsed time: %s" % self.time_elapsed()
-        # BUG: int(self.divid, 100.0) is invalid — self.divid is a UUID string, not a number
-        js_code = (
-            "$('div#%s').width('%i%%');" % int(self.divid, 100.0)  # type: ignore[call-overload]
-            + f"$('p#{self.textid}').text('{lbl}');"
-        )
+        js_code = "$('div#%s').width('%i%%');" % (self.divid, 100) + f"$('p#{self.textid}').text('{lbl}');"
         self.display(self._javascript_cls(js_code))  # type: ignore[no-untyped-call]
 
 
-def tqdm_(
+def tqdm_(  # pylint: disable=too-many-locals
     iterable: Iterable[_T],
     desc: str | Callable[..., str] | None = None,
     total: int | float | None = None,
@@ -240,6 +281,11 @@ def tqdm_(
 ) -> Generator[_T, None, None]:
     """Wrap ``iterable`` with a tqdm bar whose description/postfix can be functions of index.
 
+    Built for tight loops: the bar is touched at most once per ``mininterval`` (tqdm's render
+    interval, 0.1 sec by default) instead of once per item. Items are counted in one batched
+    ``update(n)``, callable ``desc``/``postfix`` are only evaluated then (with the index of the
+    item about to be yielded), and constant ones are set once.
+
     Args:
         iterable: Iterable to decorate.
         desc: Prefix string for the bar, or callable ``(i) -> str``.
@@ -252,32 +298,162 @@ def tqdm_(
     Yields:
         Items from ``iterable`` after updating the bar.
     """
-    if not callable(desc):
-        desc_str = desc
+    if hasattr(iterable, "__len__"):
+        total = len(iterable)  # type: ignore[arg-type]
+
+    pbar = tqdm(
+        total=total,
+        disable=disable,
+        unit=unit,
+        desc=None if callable(desc) else desc,
+        postfix=None if callable(postfix) else postfix,
+        **kwargs,
+    )
+    if pbar.disable:
+        yield from iterable
+        return
+
+    mininterval = pbar.mininterval
+    next_refresh = 0.0
+    i, shown = -1, 0  # index of the current item; items counted on the bar so far
+    # Reading the clock costs more than a cheap loop body, so it is read only every `stride`
+    # items, with `stride` adapted to the observed rate to get ~4 reads per `mininterval` (growing
+    # at most 2x per read, so a few fast items up front don't blind the bar to slower ones after them)
+    next_check, stride, last_i, last_t = 0, 1, 0, time.monotonic()
+    exhausted = False
+    try:
+        for i, val in enumerate(iterable):
+            if i >= next_check:
+                now = time.monotonic()
+                if now > last_t:
+                    stride = max(1, min(2 * stride, int((i - last_i) / (now - last_t) * mininterval / 4)))
+                last_i, last_t, next_check = i, now, i + stride
+
+                if now >= next_refresh:
+                    next_refresh = now + mininterval
+                    if callable(desc):
+                        pbar.set_description(desc(i), refresh=False)
+                    if callable(postfix):
+                        pbar.set_postfix(postfix(i), refresh=False)
+                    pbar.update(i - shown)  # the items before `i` are done
+                    shown = i
+                    if callable(desc) or callable(postfix):
+                        pbar.refresh()
+            yield val
+        exhausted = True
+    finally:
+        pbar.update(i + exhausted - shown)
+        pbar.close()
+
+
+# worker-side: the slots of the current ``parallel_map(..., task_progress=True)`` run
+_progress_blocks: dict[str, tuple[SharedMemory, "memoryview[float]"]] = {}
+_task_progress = threading.local()  # worker-side: ``(slots, index)`` of the task being evaluated
+
+
+def report_progress(done: float, total: float = 1.0) -> None:
+    """Report how far the task being evaluated got, from inside the ``func`` of a :func:`parallel_map` call.
+
+    With ``parallel_map(..., task_progress=True)`` the parent's bar advances by ``done / total`` of a
+    task while it runs, so a few long tasks don't leave it frozen. Elsewhere (e.g. when ``func`` is
+    called directly) this does nothing.
 
-        def desc_fn(_i: int) -> str | None:
-            return desc_str
+    Args:
+        done: Work done so far on the current task.
+        total: Total work of the current task.
 
-        resolved_desc: Callable[..., str | None] = desc_fn
-    else:
-        resolved_desc = desc
+    Example:
+        >>> def fit(seed, epochs):
+        ...     for epoch in range(epochs):
+        ...         ...
+        ...         report_progress(epoch + 1, epochs)
+        >>>
+        >>> out = parallel_map(fit, range(8), task_progress=True, epochs=100)
+    """
+    current: tuple["memoryview[float]", int] | None = getattr(_task_progress, "current", None)
+    if current is not None:
+        slots, index = current
+        slots[index] = min(max(done / total, 0.0), 1.0)
 
-    if not callable(postfix):
 
-        def postfix_fn(_i: int) -> dict[str, typing.Any] | None:
-            return None
+def _slots(shm: SharedMemory) -> "memoryview[float]":
+    """The float64 slots of a progress block."""
+    return typing.cast(memoryview, shm.buf).cast("d")
 
-        resolved_postfix: Callable[..., dict[str, typing.Any] | None] = postfix_fn
-    else:
-        resolved_postfix = postfix
 
-    if hasattr(iterable, "__len__"):
-        total = len(iterable)  # type: ignore[arg-type]
+def _call_with_progress(name: str, index: int, func: Callable[[typing.Any], _T], item: typing.Any) -> _T:
+    """Worker-side: evaluate ``func(item)`` with :func:`report_progress` writing to slot ``index`` of block ``name``."""
+    if name not in _progress_blocks:  # a new run: unmap the blocks of previous ones (a worker runs one task at a time)
+        for shm, slots in _progress_blocks.values():
+            slots.release()
+            shm.close()
+        _progress_blocks.clear()
+        shm = SharedMemory(name)
+        _progress_blocks[name] = (shm, _slots(shm))
+    slots = _progress_blocks[name][1]
+    _task_progress.current = (slots, index)
+    try:
+        return func(item)
+    finally:
+        _task_progress.current = None
+        slots[index] = 1.0
 
-    pbar = tqdm(total=total, disable=disable, unit=unit, **kwargs)
 
-    for i, val in enumerate(iterable):
-        pbar.set_description(resolved_desc(i))
-        pbar.set_postfix(resolved_postfix(i))
-        yield val
-        pbar.update(1)
+class TaskProgress:
+    """One progress bar over tasks running in other processes (backs ``parallel_map(..., task_progress=True)``).
+
+    One float64 slot per task in a shared-memory block holds the fraction of it done. Workers
+    write their task's slot (one writer each, so no locking), and the parent's bar shows the sum.
+
+    Example:
+        >>> progress = TaskProgress(len(items))
+        >>> for i, item in enumerate(items):
+        ...     pool.apply_async(progress.task(i, func), (item,), callback=done.put)
+        >>> results = list(progress.completed(done, len(items), {"desc": "fit"}))
+        >>> progress.close()
+    """
+
+    def __init__(self, num_tasks: int) -> None:
+        self.shm = SharedMemory(create=True, size=8 * max(num_tasks, 1))
+        self.slots = _slots(self.shm)  # new blocks are zero-filled
+
+    def task(self, index: int, func: Callable[[typing.Any], _T]) -> Callable[[typing.Any], _T]:
+        """The picklable task evaluating ``func`` as task ``index``."""
+        return functools.partial(_call_with_progress, self.shm.name, index, func)
+
+    def completed(
+        self, done: queue.SimpleQueue[_T], num_tasks: int, tqdm_kw: dict[str, typing.Any]
+    ) -> Generator[_T, None, None]:
+        """Yield the entries of ``done`` as they arrive, showing the summed slots on a bar meanwhile.
+
+        Callable ``desc``/``postfix`` in ``tqdm_kw`` get the number of completed tasks.
+        """
+        desc, postfix = tqdm_kw.get("desc"), tqdm_kw.get("postfix")
+        kw = {"unit": "it"} | tqdm_kw | {"desc": None if callable(desc) else desc}
+        kw["postfix"] = None if callable(postfix) else postfix
+        with tqdm(total=num_tasks, **kw) as pbar:
+            next_refresh = 0.0
+            for completed in range(num_tasks):
+                while True:
+                    now = time.monotonic()
+                    if now >= next_refresh and not pbar.disable:
+                        next_refresh = now + pbar.mininterval
+                        if callable(desc):
+                            pbar.set_description(desc(completed), refresh=False)
+                        if callable(postfix):
+                            pbar.set_postfix(postfix(completed), refresh=False)
+                        pbar.n = min(round(math.fsum(self.slots), 2), num_tasks)
+                        pbar.refresh()
+                    try:
+                        entry = done.get(timeout=None if pbar.disable else max(next_refresh - now, 0.0))
+                        break
+                    except queue.Empty:
+                        continue
+                yield entry
+            pbar.n = num_tasks
+
+    def close(self) -> None:
+        """Free the block."""
+        self.slots.release()
+        self.shm.close()
+        self.shm.unlink()
@@ -0,0 +1,130 @@
+import json
+import os
+import time
+import typing
+from collections.abc import Iterable
+
+
+class TaskRecord(typing.NamedTuple):
+    """Timing of one task of a parallel run (timestamps are ``time.time()`` seconds).
+
+    Attributes:
+        task: Input index of the task.
+        worker: Id of the worker that ran it (process id, or thread id for thread pools).
+        submitted: When the task was handed to the pool.
+        started: When the worker started evaluating it.
+        finished: When the worker finished evaluating it.
+        cpu: CPU time the worker thread spent evaluating it.
+        serialization: Time spent pickling/unpickling its arguments and result (both sides).
+    """
+
+    task: int
+    worker: int
+    submitted: float
+    started: float
+    finished: float
+    cpu: float
+    serialization: float
+
+    @property
+    def wall(self) -> float:
+        """Wall time of the evaluation itself."""
+        return self.finished - self.started
+
+    @property
+    def queue_wait(self) -> float:
+        """Time between submission and the start of the evaluation (includes argument transfer)."""
+        return self.started - self.submitted
+
+
+def percentiles(values: Iterable[float], qs: tuple[int, ...] = (50, 95, 99)) -> dict[str, float]:
+    """Nearest-rank percentiles of ``values``.
+
+    Args:
+        values: Samples, in any order.
+        qs: Percentiles to compute, in 0-100.
+
+    Returns:
+        E.g. ``{"p50": ..., "p95": ..., "p99": ...}``; zeros for empty ``values``.
+    """
+    values = sorted(values)
+    if not values:
+        return {f"p{q}": 0.0 for q in qs}
+    return {f"p{q}": values[min(len(values) - 1, max(0, -(-q * len(values) // 100) - 1))] for q in qs}
+
+
+class Telemetry:
+    """Per-task timing records of a parallel run, e.g. ``parallel_map(..., telemetry=True).telemetry``.
+
+    Example:
+        >>> out = parallel_map(func, range(1000), telemetry=True)
+        >>> out.telemetry.summary()["latency"]
+        {'p50': 0.012, 'p95': 0.048, 'p99': 0.31}
+        >>> out.telemetry.dump_chrome_trace("trace.json")  # open in chrome://tracing or ui.perfetto.dev
+    """
+
+    def __init__(self) -> None:
+        self.records: list[TaskRecord] = []
+        self.started = time.time()
+        self.finished = self.started
+
+    def stop(self) -> None:
+        """Mark the end of the run."""
+        self.finished = time.time()
+
+    def workers(self) -> list[int]:
+        """Worker ids in order of their first task start."""
+        return list(dict.fromkeys(r.worker for r in sorted(self.records, key=lambda r: r.started)))
+
+    def summary(self) -> dict[str, typing.Any]:
+        """Aggregate the records.
+
+        Returns:
+            ``tasks``, ``wall`` (run duration, seconds), ``throughput`` (tasks/sec),
+            ``latency`` and ``queue_wait`` percentiles (``p50``/``p95``/``p99``, seconds),
+            ``cpu`` and ``serialization`` totals (seconds), and ``idle_fraction`` per worker
+            (share of the run it spent not evaluating a task).
+        """
+        wall = max(self.finished - self.started, 1e-12)
+        busy = dict.fromkeys(self.workers(), 0.0)
+        for r in self.records:
+            busy[r.worker] += r.wall
+        return {
+            "tasks": len(self.records),
+            "wall": wall,
+            "throughput": len(self.records) / wall,
+            "latency": percentiles([r.wall for r in self.records]),
+            "queue_wait": percentiles([r.queue_wait for r in self.records]),
+            "cpu": sum(r.cpu for r in self.records),
+            "serialization": sum(r.serialization for r in self.records),
+            "idle_fraction": {worker: max(0.0, 1 - t / wall) for worker, t in busy.items()},
+        }
+
+    def chrome_trace(self) -> dict[str, typing.Any]:
+        """The records in Chrome trace-event format: one row per worker, one slice per task."""
+        events: list[dict[str, typing.Any]] = [
+            {"name": "thread_name", "ph": "M", "pid": os.getpid(), "tid": worker, "args": {"name": f"worker {worker}"}}
+            for worker in self.workers()
+        ]
+        for r in self.records:
+            events.append(
+                {
+                    "name": f"task {r.task}",
+                    "ph": "X",
+                    "pid": os.getpid(),
+                    "tid": r.worker,
+                    "ts": (r.started - self.started) * 1e6,
+                    "dur": r.wall * 1e6,
+                    "args": {"cpu": r.cpu, "queue_wait": r.queue_wait, "serialization": r.serialization},
+                }
+            )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def dump_chrome_trace(self, file_name: str) -> None:
+        """Write :meth:`chrome_trace` as JSON (load it in ``chrome://tracing`` or https://ui.perfetto.dev).
+
+        Args:
+            file_name: Output path.
+        """
+        with open(file_name, "w", encoding="utf-8") as f:
+            json.dump(self.chrome_trace(), f)
@@ -1,11 +1,19 @@
 # flake8: noqa: F401, F403
 
-from .base import *
-from .filtering import *
-from .fitting import *
-from .signal import *
-from .sp_audio import *
-from .sp_image import *
-from .stats import *
-
-__all__ = [s for s in dir() if not s.startswith("_")]
+import typing
+
+from ..pure_python.imports import lazy_import
+
+if typing.TYPE_CHECKING:
+    from .base import *
+    from .filtering import *
+    from .fitting import *
+    from .signal import *
+    from .sp_audio import *
+    from .sp_image import *
+    from .stats import *
+
+__getattr__, __dir__ = lazy_import(
+    __name__,
+    star_submodules=["base", "filtering", "fitting", "signal", "sp_audio", "sp_image", "stats"],
+)
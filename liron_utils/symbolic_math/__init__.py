@@ -1,5 +1,10 @@
 # flake8: noqa: F401, F403
 
-from .base import SymExpr
+import typing
 
-__all__ = [s for s in dir() if not s.startswith("_")]
+from ..pure_python.imports import lazy_import
+
+if typing.TYPE_CHECKING:
+    from .base import SymExpr
+
+__getattr__, __dir__ = lazy_import(__name__, attrs={"SymExpr": "base"})
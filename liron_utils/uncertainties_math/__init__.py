@@ -1,5 +1,10 @@
 # flake8: noqa: F401, F403
 
-from .base import *
+import typing
 
-__all__ = [s for s in dir() if not s.startswith("_")]
+from ..pure_python.imports import lazy_import
+
+if typing.TYPE_CHECKING:
+    from .base import *
+
+__getattr__, __dir__ = lazy_import(__name__, star_submodules=["base"])
@@ -0,0 +1,174 @@
+"""Import-time benchmark for every liron_utils subpackage.
+
+Each subpackage is star-imported in a fresh interpreter under ``python -X importtime``
+(subpackages load lazily, so a bare ``import`` would measure almost nothing).
+
+Usage:
+    python -m tests._import_time            # print the report
+    python -m tests._import_time --update   # also rewrite the stored baseline
+
+The baseline is machine-specific: regenerate it on the machine that runs
+``LIRON_UTILS_IMPORT_TIME=1 pytest tests/test_import_time.py``.
+"""
+
+import functools
+import json
+import pathlib
+import subprocess
+import sys
+import typing
+
+BASELINE_FILE = pathlib.Path(__file__).with_name("import_time_baseline.json")
+
+SUBPACKAGES = [
+    "liron_utils",
+    "liron_utils.files",
+    "liron_utils.graphics",
+    "liron_utils.graphics.mpl",
+    "liron_utils.graphics.plotly",
+    "liron_utils.machine_learning",
+    "liron_utils.manim_animations",
+    "liron_utils.pure_python",
+    "liron_utils.signal_processing",
+    "liron_utils.symbolic_math",
+    "liron_utils.time",
+    "liron_utils.uncertainties_math",
+    "liron_utils.web",
+]
+
+NUM_HEAVIEST = 3
+
+
+class ImportTimeProfile(typing.NamedTuple):
+    """Result of :func:`profile_imports` (all times in seconds).
+
+    Attributes:
+        total: Cumulative import time of everything ``code`` imported.
+        modules: Cumulative import time per imported module.
+        third_party: Cumulative time per third-party root package, counting only the
+            imports issued directly by first-party (or top-level) code, e.g. ``{"scipy": 0.4}``.
+    """
+
+    total: float
+    modules: dict[str, float]
+    third_party: dict[str, float]
+
+
+def _run_importtime(code: str) -> list[tuple[int, str, float]]:
+    """Run ``code`` in a fresh interpreter under ``-X importtime``.
+
+    Returns:
+        ``(depth, module, cumulative_seconds)`` per logged import, in log order
+        (children are logged before their parent).
+    """
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stderr
+
+    entries: list[tuple[int, str, float]] = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|", maxsplit=2)
+        if not cumulative.strip().isdigit():  # header line
+            continue
+        name = name[1:]  # strip the separator space; what remains is 2 spaces per nesting level
+        depth = (len(name) - len(name.lstrip(" "))) // 2
+        entries.append((depth, name.strip(), int(cumulative) * 1e-6))
+    return entries
+
+
+@functools.cache
+def _startup_modules() -> tuple[str, ...]:
+    """Modules the interpreter imports (in log order) before running any ``-c`` code."""
+    return tuple(name for _, name, _ in _run_importtime("pass"))
+
+
+def _code_imports(code: str) -> list[tuple[int, str, float]]:
+    """Like :func:`_run_importtime`, minus the interpreter-startup prefix of the log."""
+    entries = _run_importtime(code)
+    startup = _startup_modules()
+    n_startup = 0
+    while n_startup < min(len(entries), len(startup)) and entries[n_startup][1] == startup[n_startup]:
+        n_startup += 1
+    return entries[n_startup:]
+
+
+def profile_imports(code: str, first_party: str = "liron_utils") -> ImportTimeProfile:
+    """Measure what executing ``code`` costs in imports, in a fresh interpreter.
+
+    Lazily-loaded packages only pay on attribute access, so ``code`` should touch what
+    it wants measured (e.g. ``"from liron_utils.signal_processing import *"``).
+
+    Args:
+        code: Python source passed to ``python -c``.
+        first_party: Root package whose imports are attributed to third-party packages.
+
+    Returns:
+        The import-time profile of ``code``.
+
+    Example:
+        >>> profile = profile_imports("from liron_utils.signal_processing import *")
+        >>> sorted(profile.third_party.items(), key=lambda kv: -kv[1])[:3]
+        [('scipy', 0.41), ('sklearn', 0.35), ('matplotlib', 0.22)]
+    """
+
+    def is_third_party(name: str) -> bool:
+        root = name.split(".")[0]
+        return root != first_party and root not in sys.stdlib_module_names
+
+    modules: dict[str, float] = {}
+    direct: list[str] = []  # third-party modules imported by first-party code (or by `code` itself)
+    pending: dict[int, list[str]] = {}  # modules seen so far, awaiting their parent (logged one level up)
+    for depth, name, cumulative in _code_imports(code):
+        children = pending.pop(depth + 1, [])
+        if name.split(".")[0] == first_party:
+            direct += [child for child in children if is_third_party(child)]
+        pending.setdefault(depth, []).append(name)
+        modules[name] = cumulative
+    direct += [name for name in pending.get(0, []) if is_third_party(name)]
+
+    third_party: dict[str, float] = {}
+    for name in direct:
+        root = name.split(".")[0]
+        third_party[root] = third_party.get(root, 0.0) + modules[name]
+
+    total = sum(modules[name] for name in pending.get(0, []))
+    return ImportTimeProfile(total=total, modules=modules, third_party=third_party)
+
+
+def profile_subpackage(name: str, repeat: int = 1) -> ImportTimeProfile:
+    """Star-import ``name`` ``repeat`` times and keep the fastest run (least scheduler noise)."""
+    code = "import liron_utils" if name == "liron_utils" else f"from {name} import *"
+    return min((profile_imports(code) for _ in range(repeat)), key=lambda profile: profile.total)
+
+
+def load_baseline() -> dict[str, dict[str, float | dict[str, float]]]:
+    with open(BASELINE_FILE, encoding="utf-8") as f:
+        return json.load(f)  # type: ignore[no-any-return]
+
+
+def main(update: bool = False) -> None:
+    baseline: dict[str, dict[str, float | dict[str, float]]] = {}
+    print(f"{'subpackage':<32}{'total [ms]':>12}  heaviest third-party imports [ms]")
+    for name in SUBPACKAGES:
+        profile = profile_subpackage(name, repeat=3)
+        heaviest = sorted(profile.third_party.items(), key=lambda kv: -kv[1])[:NUM_HEAVIEST]
+        print(f"{name:<32}{1e3 * profile.total:>12.1f}  " + ", ".join(f"{k} {1e3 * v:.0f}" for k, v in heaviest))
+        baseline[name] = {
+            "total": round(profile.total, 4),
+            "third_party": {k: round(v, 4) for k, v in sorted(profile.third_party.items())},
+        }
+
+    if update:
+        with open(BASELINE_FILE, "w", encoding="utf-8") as f:
+            json.dump(baseline, f, indent=2)
+            f.write("\n")
+        print(f"Baseline written to {BASELINE_FILE}")
+
+
+if __name__ == "__main__":
+    main(update="--update" in sys.argv[1:])
@@ -0,0 +1,68 @@
+# import time
+# import tracemalloc
+#
+# import matplotlib
+# import numpy as np
+#
+# from liron_utils.graphics.mpl.plotting import Axes
+#
+# matplotlib.use("Agg")
+#
+#
+# def per_call(func, number=1000):
+#     """Best-of-3 microseconds per call of `func()`."""
+#     best = float("inf")
+#     for _ in range(3):
+#         t0 = time.perf_counter()
+#         for _ in range(number):
+#             func()
+#         best = min(best, (time.perf_counter() - t0) / number)
+#     return best * 1e6
+#
+#
+# if __name__ == "__main__":
+#     axes = Axes(shape=(4, 4))
+#     x = np.arange(100.0)
+#     titles = [str(i) for i in range(16)]
+#
+#     def plot():
+#         axes.plot(x, x)
+#         for ax in axes.axs.flat:
+#             ax.lines[-1].remove()
+#
+#     # dispatch only: the plotted function is a no-op
+#     print(f"split params: {per_call(lambda: axes._vectorize(title=titles)(lambda ax, title: None)()):,.1f} us")
+#     print(
+#         "broadcast + merge:",
+#         f"{per_call(lambda: axes._merge_kwargs('plot_kw', color='r')(axes._vectorize(x=x, y=x)(lambda ax, **kw: None))()):,.1f} us",
+#     )
+#     print(f"ax_title: {per_call(lambda: axes.ax_title(titles), 200):,.1f} us")
+#     print(f"plot: {per_call(plot, 200):,.1f} us")
+#
+#     for num_points in [1_000, 1_000_000]:  # axes[i, j] on a figure holding large lines
+#         big = Axes(shape=(2, 2))
+#         t = np.arange(float(num_points))
+#         big.plot(t, np.sin(t))
+#         tracemalloc.start()
+#         view_time = per_call(lambda: big[0, 1], 10)
+#         peak = tracemalloc.get_traced_memory()[1]
+#         tracemalloc.stop()
+#         print(f"axes[0, 1], {num_points:,} points per line: {view_time:,.1f} us, peak {peak / 2**20:,.3f} MiB")
+#
+#     """
+#     Results (4x4 grid, 1000 calls, 1 CPU, CPython 3.11):
+#     --------
+#     per call                     | before  | after   |
+#     dispatch, split params       | 534.7   | 25.3    | [us]
+#     dispatch, broadcast + merge  | 822.6   | 41.8    | [us]
+#     ax_title (16 titles)         | 2,318.3 | 1,334.4 | [us]
+#     plot (100 points)            | 9,276.7 | 8,552.9 | [us]
+#
+#     axes[0, 1] (2x2 grid)        | before (deepcopy) | after (view) |
+#     1,000 points per line        | 28.2 ms, 2.5 MiB  | 42 us, 1 KiB |
+#     1,000,000 points per line    | 152 ms, 185 MiB   | 82 us, 1 KiB |
+#
+#     Before, every call built a DataFrame from the parameters (dl_to_ld) even when they were
+#     broadcast, and np.repeat-ed the kwargs dict otherwise. The rest of `plot` is matplotlib.
+#     """
+#     pass
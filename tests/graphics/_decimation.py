@@ -0,0 +1,51 @@
+# import time
+#
+# import matplotlib
+# import numpy as np
+#
+# from liron_utils.graphics.mpl.plotting import Axes
+# from liron_utils.graphics.plotly import Figure
+#
+# matplotlib.use("Agg")
+#
+#
+# def bench(num_samples, decimate, fs=48_000):
+#     """Plot a noisy `num_samples`-long audio-like signal with matplotlib and plotly."""
+#     t = np.arange(num_samples) / fs
+#     y = np.sin(2 * np.pi * 440 * t) * np.exp(-t) + 0.05 * np.random.randn(num_samples)
+#
+#     axes = Axes(shape=(1, 1))
+#     t0 = time.perf_counter()
+#     axes.plot(t, y, decimate=decimate)
+#     axes.fig.canvas.draw()
+#     t1 = time.perf_counter()
+#     axes.axs[0, 0].set_xlim(t[num_samples // 2], t[num_samples // 2 + fs])  # zoom in on 1 second
+#     axes.fig.canvas.draw()
+#     t2 = time.perf_counter()
+#     print(f"mpl, decimate={decimate}: plot + draw {t1 - t0:.2f} s, zoom + draw {t2 - t1:.2f} s")
+#
+#     fig = Figure()
+#     t0 = time.perf_counter()
+#     fig.plot(t, y, decimate=decimate)
+#     html = fig.to_html(include_plotlyjs=False)
+#     print(f"plotly, decimate={decimate}: plot + to_html {time.perf_counter() - t0:.2f} s, {len(html) / 2**20:.1f} MiB")
+#
+#
+# if __name__ == "__main__":
+#     for num_samples in [10_000_000, 50_000_000]:
+#         for decimate in [False, True]:
+#             bench(num_samples, decimate)
+#
+#     """
+#     Results (1 CPU, 5 GB RAM, CPython 3.11):
+#     --------
+#     samples | backend | decimate=False                 | decimate=True               |
+#     10M     | mpl     | 1.99 s (zoom 0.23 s)           | 0.24 s (zoom 0.12 s)        |
+#     10M     | plotly  | 3.04 s, 235.7 MiB HTML         | 0.06 s, 0.1 MiB HTML        |
+#     50M     | mpl     | 7.53 s (zoom 0.22 s)           | 0.75 s (zoom 0.13 s)        |
+#     50M     | plotly  | killed (out of memory)         | 0.24 s, 0.1 MiB HTML        |
+#
+#     A 620 px wide axes draws at most 2,480 points whatever the length of the signal; zooming
+#     in re-decimates the visible range from the full data.
+#     """
+#     pass
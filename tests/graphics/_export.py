@@ -0,0 +1,61 @@
+# import os
+# import tempfile
+# import time
+#
+# import matplotlib
+# import numpy as np
+# import plotly.graph_objects as go
+#
+# from liron_utils.graphics import save_figs
+# from liron_utils.graphics.mpl import Axes
+#
+# matplotlib.use("Agg")
+#
+#
+# def make_figs(num_figs):
+#     """`num_figs` report-like figures: 2x2 subplots of 20k-point random walks each."""
+#     figs = []
+#     for _ in range(num_figs):
+#         axes = Axes(shape=(2, 2))
+#         for ax in axes.axs.flat:
+#             ax.plot(np.random.randn(20_000).cumsum())
+#         figs.append(axes)
+#     return figs
+#
+#
+# if __name__ == "__main__":
+#     num_figs = 12
+#     with tempfile.TemporaryDirectory() as dir_name:
+#         t0 = time.perf_counter()
+#         for i, axes in enumerate(make_figs(num_figs)):
+#             axes.save_fig(os.path.join(dir_name, f"seq {i}.png"))
+#         print(f"mpl, save_fig loop: {time.perf_counter() - t0:.2f} s")
+#
+#         for start_method in ["fork", "spawn"]:
+#             figs = make_figs(num_figs)  # fresh figures, so no variant reuses another's drawing caches
+#             t0 = time.perf_counter()
+#             results = save_figs(figs, [os.path.join(dir_name, f"{start_method} {i}.png") for i in range(num_figs)], start_method=start_method)
+#             print(f"mpl, save_figs ({start_method}): {time.perf_counter() - t0:.2f} s, per figure {sum(r.seconds for r in results) / num_figs:.2f} s")
+#
+#         plotly_figs = [go.Figure(go.Scatter(y=np.random.randn(100_000).cumsum())) for _ in range(num_figs)]
+#         t0 = time.perf_counter()
+#         for i, fig in enumerate(plotly_figs):
+#             fig.write_html(os.path.join(dir_name, f"seq {i}.html"))
+#         print(f"plotly, write_html loop: {time.perf_counter() - t0:.2f} s")
+#         t0 = time.perf_counter()
+#         save_figs(plotly_figs, [os.path.join(dir_name, f"batch {i}.html") for i in range(num_figs)])
+#         print(f"plotly, save_figs: {time.perf_counter() - t0:.2f} s")
+#
+#     """
+#     Results (1 CPU, CPython 3.11), 12 figures:
+#     --------
+#     backend | loop   | save_figs (fork) | save_figs (spawn) |
+#     mpl     | 9.45 s | 8.27 s           | 11.22 s           |
+#     plotly  | 0.50 s | 0.53 s           |                   |
+#
+#     With a single CPU the pool can only match the loop; the gain is expected to scale with
+#     the number of cores (up to the number of figures). Forked workers inherit the figures, so
+#     they skip the pickling round trip that spawned workers pay (~0.2 s per figure here, plus
+#     worker start-up). Plotly static images (kaleido) were not measured: no Chrome in this sandbox.
+#     """
+#     pass
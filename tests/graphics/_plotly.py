@@ -0,0 +1,41 @@
+# import os
+# import tempfile
+# import time
+#
+# import numpy as np
+#
+# from liron_utils.graphics.plotly import Figure
+#
+#
+# if __name__ == "__main__":
+#     n = 1_000_000
+#     t = np.linspace(0, 1, n)
+#     y = np.sin(2 * np.pi * 5 * t) + 0.1 * np.random.randn(n)
+#     cases = {
+#         "plot, ndarray": lambda fig: fig.plot(t, y),
+#         "plot, lists": lambda fig: fig.plot(t.tolist(), y.tolist()),
+#         "plot_errorbar, ndarray": lambda fig: fig.plot_errorbar(t, y, yerr=np.full(n, 0.1)),
+#     }
+#     with tempfile.TemporaryDirectory() as tmp_dir:
+#         for name, make in cases.items():
+#             fig = Figure()
+#             make(fig)
+#             file_name = os.path.join(tmp_dir, "fig.html")
+#             t0 = time.perf_counter()
+#             fig.save(file_name, include_plotlyjs="cdn")
+#             dt = time.perf_counter() - t0
+#             print(f"{name}: {fig.data[0].type}, save() {dt:.2f} s, {os.path.getsize(file_name) / 2**20:.1f} MiB")
+#
+#     """
+#     Results (1M points, 1 CPU, plotly 7.1):
+#     --------
+#     1M points              | before                      | after                          |
+#     plot, ndarray          | scatter, 0.33 s, 25.8 MiB   | scattergl, 0.36 s, 25.8 MiB    |
+#     plot, lists            | scatter, 1.80 s, 37.1 MiB   | scattergl, 0.30 s, 25.8 MiB    |
+#     plot_errorbar, ndarray | scatter, 0.49 s, 37.6 MiB   | scattergl, 0.48 s, 37.6 MiB    |
+#
+#     plotly >= 6 already writes numeric ndarrays as base64 typed arrays; lists were written as
+#     JSON numbers. The main gain is in the browser: an SVG `scatter` with 1M points is unusable,
+#     while `scattergl` pans and zooms smoothly. PNG export was not measured (no Chrome for kaleido).
+#     """
+#     pass
@@ -0,0 +1,79 @@
+import typing
+
+import matplotlib
+import numpy as np
+
+from liron_utils.graphics.common.decimation import can_decimate, m4_indices
+from liron_utils.graphics.mpl.plotting import Axes
+from liron_utils.graphics.plotly import Figure
+
+matplotlib.use("Agg")
+
+_Array1D = np.ndarray[tuple[int], np.dtype[typing.Any]]
+
+
+def _signal(n: int) -> tuple[_Array1D, _Array1D]:
+    rng = np.random.default_rng(0)
+    t = np.arange(n) / 1000
+    return typing.cast(_Array1D, t), typing.cast(_Array1D, np.sin(t) + rng.normal(size=n))
+
+
+def test_m4_indices_keeps_extremes() -> None:
+    t, y = _signal(100_003)
+    idx = m4_indices(t, y, num_pixels=500)
+    assert len(idx) <= 4 * 500 + 4 and np.all(np.diff(idx) > 0)
+    assert idx[0] == 0 and idx[-1] == len(t) - 1
+    assert y[idx].max() == y.max() and y[idx].min() == y.min()
+    for start in range(0, len(t) - 201, 201):  # every bin (201 samples) keeps its own extremes
+        assert y[start : start + 201].max() in y[idx]
+
+    assert np.array_equal(m4_indices(t[:1000], y[:1000], num_pixels=500), np.arange(1000))  # nothing to drop
+    idx = m4_indices(t, y, num_pixels=500, x_range=(60.0, 50.0))
+    assert t[idx[0]] < 50 <= t[idx[1]] and t[idx[-2]] <= 60 < t[idx[-1]]  # one sample beyond each edge
+
+
+def test_can_decimate() -> None:
+    t, y = _signal(10)
+    assert can_decimate(t, y)
+    assert not can_decimate(t[::-1], y)  # not sorted
+    assert not can_decimate(t, np.stack([y, y], axis=1))
+    assert not can_decimate(list(t), y)
+
+
+def test_mpl_plot_decimate_follows_xlim() -> None:
+    t, y = _signal(1_000_000)
+    axes = Axes(shape=(1, 1))
+    ax = axes.axs[0, 0]
+    line = axes.plot(t, y, decimate=True)[0, 0][0]
+    width = int(ax.get_window_extent().width)
+    assert len(line.get_xdata()) <= 4 * width + 4
+    assert ax.dataLim.y0 == y.min() and ax.dataLim.y1 == y.max()
+
+    ax.set_xlim(100, 100.5)  # zoom in: the samples come back
+    np.testing.assert_array_equal(line.get_xdata()[1:-1], t[(t >= 100) & (t <= 100.5)])
+    ax.set_xlim(0, t[-1])
+    assert len(line.get_xdata()) <= 4 * width + 4
+
+    container = axes.plot_errorbar(t, y, yerr=np.full(len(t), 0.1), decimate=True)[0, 0]
+    assert len(container[0].get_xdata()) <= 4 * width + 4
+
+
+def test_plotly_plot_decimate() -> None:
+    t, y = _signal(1_000_000)
+    fig = Figure(shape=(1, 2))
+    fig.plot(t, y, decimate=True, col=2)
+    fig.plot(t, y, decimate=250)
+    fig.plot(t[:100], y[:100], decimate=True)
+    assert len(fig.data[0].x) <= 4 * 800 / 2
+    assert len(fig.data[1].x) <= 4 * 250 + 4 and max(fig.data[1].y) == y.max()
+    assert len(fig.data[2].x) == 100
+
+
+def test_mpl_plot_decimate_savefig_dpi() -> None:
+    t, y = _signal(1_000_000)
+    axes = Axes(shape=(1, 1))
+    ax = axes.axs[0, 0]
+    width = int(ax.get_window_extent().width)
+    with matplotlib.rc_context({"savefig.dpi": 4 * ax.figure.dpi}):  # saved at 4x the screen resolution
+        line = axes.plot(t, y, decimate=True)[0, 0][0]
+    assert 4 * width < len(line.get_xdata()) <= 16 * width + 4
@@ -0,0 +1,57 @@
+import pathlib
+from collections.abc import Generator
+
+import matplotlib.pyplot as plt
+import numpy as np
+import plotly.graph_objects as go
+import pytest
+from matplotlib.figure import Figure
+
+from liron_utils.graphics import save_figs
+from liron_utils.graphics.mpl import Axes
+
+
+@pytest.fixture(name="mpl_figs")
+def fixture_mpl_figs() -> Generator[list[Figure], None, None]:
+    figs = []
+    for i in range(3):
+        fig, ax = plt.subplots()
+        ax.plot(np.arange(10) ** i)
+        figs.append(fig)
+    yield figs
+    for fig in figs:
+        plt.close(fig)
+
+
+@pytest.mark.parametrize("start_method", ["fork", "spawn"])
+def test_save_figs_mpl(tmp_path: pathlib.Path, mpl_figs: list[Figure], start_method: str) -> None:
+    file_names = [str(tmp_path / f"{i}.png") for i in range(len(mpl_figs))]
+    results = save_figs(mpl_figs, file_names, start_method=start_method, dpi=50)
+    assert [r.file_name for r in results] == file_names
+    for r in results:
+        assert r.ok and r.seconds is not None and r.seconds > 0
+        assert pathlib.Path(r.file_name).read_bytes().startswith(b"\x89PNG")
+
+
+def test_save_figs_mixed(tmp_path: pathlib.Path) -> None:
+    axes = Axes()
+    axes.plot(np.arange(5))
+    plotly_fig = go.Figure(go.Scatter(y=[1, 3, 2]))
+    results = save_figs(
+        [axes, plotly_fig, axes.fig],
+        [str(tmp_path / "a.svg"), str(tmp_path / "b"), str(tmp_path / "c.unknown")],
+    )
+    plt.close(axes.fig)
+
+    assert results[0].ok and "<svg" in pathlib.Path(results[0].file_name).read_text(encoding="utf-8")
+    assert results[1].ok and results[1].file_name == str(tmp_path / "b.html")
+    assert "plotly" in pathlib.Path(results[1].file_name).read_text(encoding="utf-8")
+    assert not results[2].ok and results[2].seconds is None and isinstance(results[2].error, ValueError)
+
+
+def test_save_figs_save_kw_reaches_worker(tmp_path: pathlib.Path, mpl_figs: list[Figure]) -> None:
+    # `metadata` goes to savefig; `cost` is also a parallel_map parameter, but must reach savefig as well
+    results = save_figs(mpl_figs[:1], [str(tmp_path / "a.png")], metadata={"Title": "a"})
+    assert results[0].ok
+    results = save_figs(mpl_figs[:1], [str(tmp_path / "b.png")], cost=1.0)
+    assert not results[0].ok and "cost" in str(results[0].error)
@@ -6,9 +6,8 @@ import liron_utils.graphics
 def test_graphics_root_is_matplotlib_free() -> None:
     """graphics/__init__ and graphics/common must not reference matplotlib.
 
-    A runtime sys.modules check is impossible here: importing liron_utils.graphics
-    executes liron_utils/__init__, which imports signal_processing -> fitting ->
-    graphics.mpl -> matplotlib. So assert at the source level instead.
+    The runtime sys.modules check lives in tests/test_lazy_imports.py; this guards the
+    sources themselves, so a stray top-level import can't sneak in behind a lazy path.
     """
     root = pathlib.Path(liron_utils.graphics.__file__).parent
     sources = [root / "__init__.py", *(root / "common").glob("*.py")]
@@ -0,0 +1,65 @@
+# pylint: disable=protected-access
+
+import typing
+
+import matplotlib
+import numpy as np
+
+from liron_utils.graphics.mpl.plotting import Axes
+
+matplotlib.use("Agg")
+
+
+def _record(ax: typing.Any, **kw: typing.Any) -> tuple[typing.Any, dict[str, typing.Any]]:
+    return ax, kw
+
+
+def _call(axes: Axes, **vec_params: typing.Any) -> typing.Any:
+    """Run ``_record`` through the plotting-method dispatch: merged ``plot_kw`` defaults, then vectorized."""
+    return axes._merge_kwargs("plot_kw", color="r")(axes._vectorize(**vec_params)(_record))()
+
+
+def test_vectorize_splits_per_axis_params() -> None:
+    axes = Axes(shape=(2, 3))
+    out = _call(axes, title=[str(i) for i in range(6)], lw=2)
+    assert out.shape == (2, 3)
+    for i in range(2):
+        for j in range(3):
+            ax, kw = out[i, j]
+            assert ax is axes.axs[i, j]
+            assert kw == {"title": str(j * 2 + i), "lw": 2, "color": "r"}  # column-major
+
+
+def test_vectorize_broadcasts() -> None:
+    axes = Axes(shape=(2, 2))
+    x = np.arange(10.0)
+    out = _call(axes, x=x, title=["a", "b"])  # lengths differ from the number of axes
+    for _, kw in out.flat:
+        assert kw["x"] is x and kw["title"] == ["a", "b"]
+    ax, kw = _call(axes, ax=axes.axs[1, 0], x=x)
+    assert ax is axes.axs[1, 0] and kw["x"] is x
+
+
+def test_vectorize_skips_empty_cells() -> None:
+    axes = Axes(shape=(2, 2), grid_layout=[[0, (0, 2)]])  # the top row is one span axis
+    out = _call(axes, title=list("abcd"))
+    assert out[0, 0][1]["title"] == "a" and out[0, 1] is None
+    assert [out[1, j][1]["title"] for j in range(2)] == ["b", "d"]
+
+
+def test_plot_and_set_props() -> None:
+    axes = Axes(shape=(1, 2))
+    lines = axes.plot(np.arange(5.0), color="r")
+    assert [line[0].axes for line in lines.flat] == list(axes.axs.flat)
+    assert all(line[0].get_color() == "r" for line in lines.flat)
+    axes.set_props(ax_title=["left", "right"], show_fig=False)
+    assert [ax.get_title() for ax in axes.axs.flat] == ["left", "right"]
+
+
+def test_getitem_is_a_view() -> None:
+    axes = Axes(shape=(2, 2))
+    view = axes[0, 1]
+    assert view.fig is axes.fig and view.axs.shape == (1, 1) and view.axs[0, 0] is axes.axs[0, 1]
+    view.plot(np.arange(5.0))  # draws on the original figure
+    assert len(axes.axs[0, 1].lines) == 1 and all(len(axes.axs[i, 0].lines) == 0 for i in range(2))
+    assert axes[:, 0].axs.shape == (1, 2)
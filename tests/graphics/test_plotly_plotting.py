@@ -55,6 +55,27 @@ def test_draw_xy_lines() -> None:
     assert len(fig.layout.shapes) == 2
 
 
+def test_plot_switches_to_webgl() -> None:
+    fig = Figure(webgl_threshold=100)
+    fig.plot(_arr(list(range(99))))
+    fig.plot(_arr(list(range(100))))
+    fig.plot_errorbar(_arr(list(range(100))), yerr=None)
+    fig.plot_filled_error(_arr(list(range(100))), y_low=_arr([0] * 100), y_high=_arr([1] * 100))
+    assert [trace.type for trace in fig.data] == ["scatter"] + ["scattergl"] * 4
+    fig = Figure(webgl_threshold=None)
+    fig.plot(_arr(list(range(1000))))
+    assert fig.data[0].type == "scatter"
+
+
+def test_plot_writes_typed_arrays() -> None:
+    fig = Figure()
+    fig.plot([0.0, 0.5, 1.0], [1, 2, 3])  # type: ignore[arg-type]  # lists too
+    fig.plot_errorbar(_arr([1, 2, 3]), _arr([2, 4, 6]), yerr=[0.1, 0.2, 0.3])  # type: ignore[arg-type]
+    data = fig.to_plotly_json()["data"]
+    assert data[0]["x"]["dtype"] == "f8" and "bdata" in data[0]["x"] and "bdata" in data[0]["y"]
+    assert "bdata" in fig.to_dict()["data"][1]["error_y"]["array"]
+
+
 def test_plot_errorbar() -> None:
     fig = Figure()
     fig.plot_errorbar(_arr([1, 2, 3]), _arr([2, 4, 6]), yerr=_arr([0.1, 0.2, 0.3]))
@@ -0,0 +1,106 @@
+# import threading
+# import time
+# import timeit
+#
+# import numpy as np
+# import pandas as pd
+#
+# from liron_utils.pure_python import NamedQueue, dl_to_ld, ld_to_dl
+#
+#
+# def throughput(num_threads, num_items, batch_size=1):
+#     """Items/sec through a NamedQueue with `num_threads` producers and as many consumers."""
+#     q = NamedQueue()
+#     per_producer = num_items // num_threads
+#     done = threading.Event()
+#
+#     def produce(p):
+#         items = [(f"{p}-{i}", i) for i in range(per_producer)]
+#         if batch_size == 1:
+#             for name, item in items:
+#                 q.enqueue(name, item)
+#         else:
+#             for start in range(0, per_producer, batch_size):
+#                 q.enqueue_many(items[start : start + batch_size])
+#
+#     def consume():
+#         while not (done.is_set() and len(q) == 0):
+#             q.dequeue_many(batch_size, timeout=0.01)  # wait for items rather than spin
+#
+#     producers = [threading.Thread(target=produce, args=(p,)) for p in range(num_threads)]
+#     consumers = [threading.Thread(target=consume) for _ in range(num_threads)]
+#     t0 = time.perf_counter()
+#     for t in producers + consumers:
+#         t.start()
+#     for t in producers:
+#         t.join()
+#     done.set()
+#     for t in consumers:
+#         t.join()
+#     return per_producer * num_threads / (time.perf_counter() - t0)
+#
+#
+# def per_call(func, *args):
+#     """Best-of-3 seconds per call of `func(*args)`."""
+#     timer = timeit.Timer(lambda: func(*args))
+#     number = timer.autorange()[0]
+#     return min(timer.repeat(3, number)) / number
+#
+#
+# def pd_dl_to_ld(dl):
+#     """The former DataFrame-based dl_to_ld."""
+#     try:
+#         return pd.DataFrame(dl).to_dict(orient="records")
+#     except ValueError:
+#         return None
+#
+#
+# def pd_ld_to_dl(ld):
+#     """The former DataFrame-based ld_to_dl."""
+#     return pd.DataFrame(ld).to_dict(orient="list")
+#
+#
+# if __name__ == "__main__":
+#     for num_threads in [1, 8, 32]:
+#         for batch_size in [1, 64]:
+#             print(f"{num_threads} x {num_threads} threads, batch {batch_size}: {throughput(num_threads, 100_000, batch_size):,.0f} items/s")
+#
+#     dls = {
+#         "4x4 grid kwargs": {"color": list("rgbk") * 4, "lw": 2, "label": [str(i) for i in range(16)]},
+#         "scalars only": {"color": "r", "lw": 2},
+#         "1k rows, 3 arrays": {k: np.random.rand(1_000) for k in "abc"},
+#         "100k rows, 3 arrays": {k: np.random.rand(100_000) for k in "abc"},
+#     }
+#     for name, dl in dls.items():
+#         print(f"dl_to_ld {name}: {per_call(pd_dl_to_ld, dl) * 1e6:,.1f} -> {per_call(dl_to_ld, dl) * 1e6:,.1f} us")
+#     print(f"dl_to_ld 100k rows, eager: {per_call(dl_to_ld, dls['100k rows, 3 arrays'], False) * 1e6:,.1f} us")
+#     for n in [16, 1_000, 100_000]:
+#         ld = [{"a": i, "b": float(i), "c": str(i)} for i in range(n)]
+#         print(f"ld_to_dl {n} rows: {per_call(pd_ld_to_dl, ld) * 1e6:,.1f} -> {per_call(ld_to_dl, ld) * 1e6:,.1f} us")
+#
+#     """
+#     Results (1 CPU, CPython 3.11):
+#     --------
+#     producers x consumers   | batch 1 | batch 64 |
+#     1 x 1                   | 216,824 | 716,928  | [items/s]
+#     8 x 8                   | 209,476 | 632,729  | [items/s]
+#     32 x 32                 | 180,038 | 412,468  | [items/s]
+#
+#     Consumers spinning on dequeue() of an empty queue (timeout=0) at times starve the producers
+#     down to a few thousand items/s. Sharding the lock over 8 sub-queues (hashing names) gave
+#     no gain (~290k vs ~300k items/s at 8 x 8) while losing the global FIFO order: under the
+#     GIL the threads serialize anyway, and what costs is the number of lock round trips.
+#
+#     DataFrame -> pure Python   | pandas  | new    |
+#     dl_to_ld 4x4 grid kwargs   | 905.3   | 24.8   | [us]
+#     dl_to_ld scalars only      | 70.9    | 2.2    | [us]
+#     dl_to_ld 1k rows, 3 arrays | 1,973.9 | 821.7  | [us]
+#     dl_to_ld 100k rows, lazy   | 199,150 | 5.1    | [us] (reading every row of the view: ~120 ms)
+#     dl_to_ld 100k rows, eager  | 199,150 | 104,600| [us]
+#     ld_to_dl 16 rows           | 764.4   | 8.8    | [us]
+#     ld_to_dl 1k rows           | 3,108.0 | 429.4  | [us]
+#     ld_to_dl 100k rows         | 196,412 | 43,700 | [us]
+#
+#     The DataFrame path also costs the pandas import (~0.5 s cold) on first use.
+#     """
+#     pass
@@ -1,5 +1,6 @@
 # import time
 #
+# import numpy as np
 # from tqdm import tqdm
 #
 # from liron_utils.pure_python import parallel
@@ -10,21 +11,25 @@
 #     return i
 #
 #
+# def row_sum(i, mat):
+#     return mat[i].sum()
+#
+#
 # def no_parallel(func, iterable, **kwargs) -> list:
 #     """Run a function on an iterable without parallelization."""
 #     return [func(i, **kwargs) for i in tqdm(iterable)]
 #
 #
 # if __name__ == "__main__":
-#     for par_func in [parallel.parallel_map, parallel.parallel_threading]:
+#     for par_func in [parallel.parallel_map, parallel.parallel_imap, parallel.parallel_threading]:
 #         t0 = time.time()
-#         out = par_func(
+#         out = list(par_func(
 #             func=foo,
 #             iterable=range(500),
 #             x=1,
 #             y=2,
 #             tqdm_kw=dict(desc=par_func.__name__, postfix=lambda i: dict(iter=i)),
-#         )
+#         ))
 #         print(out[:5])
 #         print(f"{par_func.__name__} time: {time.time() - t0:.3f} sec")
 #         time.sleep(0.1)
@@ -36,4 +41,19 @@
 #     parallel_map                        | 4.0   | 10.2  | 72.7  | [sec]
 #     parallel_threading (10 threads)     | 1.1   | 11.1  | 111.2 | [sec]
 #     """
+#
+#     # ndarray kwargs: shared memory vs. pickling the array into every task
+#     mat = np.random.rand(64, 250_000)  # 128 MB
+#     for min_nbytes in [parallel.SHARED_MEMORY_MIN_NBYTES, np.inf]:
+#         parallel.SHARED_MEMORY_MIN_NBYTES = min_nbytes
+#         t0 = time.time()
+#         parallel.parallel_map(row_sum, range(len(mat)), mat=mat)
+#         print(f"SHARED_MEMORY_MIN_NBYTES={min_nbytes}: {time.time() - t0:.3f} sec")
+#
+#     """
+#     Results (1 CPU, 64 x 1 MB rows):
+#     --------
+#     shared memory   | 0.7  | [sec]
+#     pickled         | 89.9 | [sec]
+#     """
 #     pass
@@ -0,0 +1,53 @@
+# import contextlib
+# import io
+# import time
+#
+# from liron_utils.pure_python import EnhancedTextProgressBar, TextProgressBar, tqdm_
+#
+#
+# def overhead(n, **kwargs):
+#     """Per-item cost of tqdm_ over a bare loop [ns]."""
+#     t0 = time.perf_counter()
+#     for _ in range(n):
+#         pass
+#     base = time.perf_counter() - t0
+#     t0 = time.perf_counter()
+#     for _ in tqdm_(range(n), file=io.StringIO(), **kwargs):
+#         pass
+#     return (time.perf_counter() - t0 - base) / n * 1e9
+#
+#
+# if __name__ == "__main__":
+#     for label, kwargs in [
+#         ("no desc", {}),
+#         ("constant desc", {"desc": "x"}),
+#         ("callable desc+postfix", {"desc": lambda i: f"d{i}", "postfix": lambda i: {"i": i}}),
+#     ]:
+#         print(f"{label:25s} {overhead(2_000_000, **kwargs):9.0f} ns/it")
+#
+#     """
+#     Results (1 CPU):
+#     --------
+#                                 | per-item bar updates | rate-limited |
+#     no desc                     | 70442                | 101          | [ns/it]
+#     constant desc               | 75555                | 65           | [ns/it]
+#     callable desc+postfix       | 88673                | 93           | [ns/it]
+#     """
+#
+#     for bar_cls in [TextProgressBar, EnhancedTextProgressBar]:
+#         with contextlib.redirect_stdout(io.StringIO()):
+#             t0 = time.perf_counter()
+#             pbar = bar_cls(2_000_000)
+#             for _ in range(2_000_000):
+#                 pbar.update()
+#             pbar.finished()
+#         print(f"{bar_cls.__name__:25s} {(time.perf_counter() - t0) / 2_000_000 * 1e9:9.0f} ns/it")
+#
+#     """
+#     Results (1 CPU):
+#     --------
+#                                 | render per update/chunk | rate-limited |
+#     TextProgressBar             | 294                     | 149          | [ns/it]
+#     EnhancedTextProgressBar     | 9785                    | 134          | [ns/it]
+#     """
+#     pass
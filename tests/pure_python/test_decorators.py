@@ -0,0 +1,116 @@
+import os
+import pathlib
+import re
+import typing
+from collections.abc import Callable
+
+import numpy as np
+import pytest
+
+from liron_utils.pure_python import disk_cache, hash_args, memoize, parallel_map
+
+
+def _pid(it: int) -> tuple[int, int]:
+    return it, os.getpid()
+
+
+# Replaced by a disk-cached _pid per test; forked workers inherit it
+_cached_pid: Callable[[int], tuple[int, int]] = _pid
+
+
+def _call_cached_pid(it: int) -> tuple[int, int]:
+    return _cached_pid(it)
+
+
+def test_hash_args() -> None:
+    def f(x: typing.Any, scale: float = 1.0) -> None:  # pylint: disable=unused-argument
+        pass
+
+    a = np.arange(1000.0)
+    assert hash_args(f, a) == hash_args(f, a.copy(), scale=1.0)  # by value, defaults filled in
+    assert hash_args(f, a) != hash_args(f, a.astype(np.float32))
+    assert hash_args(f, a) != hash_args(f, a.reshape(10, 100))
+    assert hash_args(f, a[::2]) == hash_args(f, np.ascontiguousarray(a[::2]))
+    assert hash_args(f, np.zeros(3, dtype=[("a", "f8")])) != hash_args(f, np.zeros(3, dtype=[("b", "f8")]))
+    assert hash_args(f, [1, "2"]) != hash_args(f, [1, 2]) != hash_args(f, (1, 2))
+
+
+def test_memoize() -> None:
+    calls = []
+
+    @memoize(maxsize=2)
+    def square(x: np.ndarray) -> np.ndarray:
+        calls.append(x)
+        return np.asarray(x**2)
+
+    np.testing.assert_array_equal(square(np.arange(3)), [0, 1, 4])
+    square(np.arange(3))
+    assert len(calls) == 1
+    square(np.arange(4))
+    square(np.arange(5))  # evicts np.arange(3)
+    square(np.arange(3))
+    assert len(calls) == 4
+
+    square.cache_clear()  # type: ignore[attr-defined]
+    square(np.arange(5))
+    assert len(calls) == 5
+
+
+def test_disk_cache(tmp_path: pathlib.Path) -> None:
+    calls = []
+
+    def fit(x: np.ndarray, order: int = 1) -> np.ndarray:
+        calls.append(order)
+        return np.polyfit(np.arange(len(x)), x, order)
+
+    x = np.linspace(0, 1, 50) ** 2
+    first = disk_cache(cache_dir=str(tmp_path))(fit)
+    np.testing.assert_allclose(first(x, order=2), [1 / 49**2, 0, 0], atol=1e-9)
+    # A fresh wrapper (as in another process or session) is served from disk
+    second = disk_cache(cache_dir=str(tmp_path))(fit)
+    np.testing.assert_array_equal(second(x, 2), first(x, order=2))
+    assert calls == [2]
+
+
+def test_disk_cache_evicts_lru(tmp_path: pathlib.Path) -> None:
+    def _ones(n: int) -> np.ndarray:  # pylint: disable=unused-argument
+        return np.ones(1000)
+
+    ones = disk_cache(_ones, cache_dir=str(tmp_path), max_bytes=3 * 8000 + 1000, maxsize=0)
+    for n in range(3):
+        ones(n)
+    ones(0)  # now the most recently used
+    ones(3)  # evicts 1
+    (directory,) = tmp_path.iterdir()
+    assert {p.stem for p in directory.glob("*.pkl")} == {hash_args(_ones, n) for n in (0, 2, 3)}
+
+
+def test_disk_cache_local_function(tmp_path: pathlib.Path) -> None:
+    @disk_cache(cache_dir=str(tmp_path))
+    def double(x: int) -> int:
+        return 2 * x
+
+    assert double(3) == 6
+    (directory,) = tmp_path.iterdir()
+    assert re.fullmatch(r"[\w.-]+", directory.name) and "_locals_.double-" in directory.name  # no '<'/'>'
+
+
+def test_disk_cache_new_constant(tmp_path: pathlib.Path) -> None:
+    def define(source: str) -> Callable[[int], int]:
+        namespace: dict[str, typing.Any] = {"__name__": __name__}
+        exec(source, namespace)  # pylint: disable=exec-used
+        return typing.cast(Callable[[int], int], disk_cache(namespace["scale"], cache_dir=str(tmp_path)))
+
+    # Same name and bytecode; only a constant differs, so the old results must not be served
+    assert define("def scale(x):\n    return x * 2")(1) == 2
+    assert define("def scale(x):\n    return x * 3")(1) == 3
+    assert define("def scale(x):\n    return [y * 3 for y in [x]][0]")(1) == 3
+    assert define("def scale(x):\n    return [y * 4 for y in [x]][0]")(1) == 4  # nested code object
+    assert len(list(tmp_path.iterdir())) == 4
+
+
+def test_disk_cache_across_processes(tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setitem(globals(), "_cached_pid", disk_cache(_pid, cache_dir=str(tmp_path), maxsize=0))
+    first = parallel_map(_call_cached_pid, range(8), num_processes=1, tqdm_kw={"disable": True})
+    again = parallel_map(_call_cached_pid, range(8), num_processes=1, tqdm_kw={"disable": True})
+    assert again == first  # the second pool's worker found the first pool's results on disk
@@ -0,0 +1,176 @@
+import threading
+import time
+import typing
+
+import numpy as np
+import pytest
+
+from liron_utils.pure_python import (
+    CacheStats,
+    NamedCache,
+    NamedQueue,
+    RecordsView,
+    dl_to_ld,
+    ld_to_dl,
+)
+
+
+def test_named_queue() -> None:
+    q: NamedQueue[int] = NamedQueue(max_size=3)
+    q.enqueue_many([("a", 1), ("b", 2), ("c", 3)])
+    q.enqueue("a", 10)  # moves "a" to the back
+    q.enqueue("d", 4)  # evicts the oldest ("b")
+    q.update("c", 30)  # in place
+    q.update("e", 5)  # inserted (used to deadlock)
+    assert q.items() == [("a", 10), ("d", 4), ("e", 5)]
+    assert q.dequeue_many(2) == [("a", 10), ("d", 4)]
+    assert q.dequeue_many() == [("e", 5)] and q.dequeue() is None and q.dequeue_many(5) == []
+
+
+def test_named_queue_snapshot_iteration() -> None:
+    q: NamedQueue[int] = NamedQueue()
+    q.enqueue_many((str(i), i) for i in range(10))
+    for name, _ in q:  # removing while iterating works on a snapshot
+        q.remove(name)
+    assert len(q) == 0
+
+
+def test_named_queue_threads() -> None:
+    q: NamedQueue[int] = NamedQueue()
+    num_producers, per_producer = 4, 5000
+    received: list[list[tuple[str, int]]] = [[] for _ in range(num_producers)]
+    done = threading.Event()
+
+    def produce(p: int) -> None:
+        for start in range(0, per_producer, 100):
+            q.enqueue_many((f"{p}-{i}", i) for i in range(start, start + 100))
+
+    def consume(c: int) -> None:
+        while not (done.is_set() and len(q) == 0):
+            received[c] += q.dequeue_many(64, timeout=0.01)
+
+    producers = [threading.Thread(target=produce, args=(p,)) for p in range(num_producers)]
+    consumers = [threading.Thread(target=consume, args=(c,)) for c in range(num_producers)]
+    for t in producers + consumers:
+        t.start()
+    for t in producers:
+        t.join()
+    done.set()
+    for t in consumers:
+        t.join()
+
+    names = [name for batch in received for name, _ in batch]
+    assert sorted(names) == sorted(f"{p}-{i}" for p in range(num_producers) for i in range(per_producer))
+    for batch in received:  # each producer's items come out in the order they went in
+        for p in range(num_producers):
+            mine = [i for name, i in batch if name.startswith(f"{p}-")]
+            assert mine == sorted(mine)
+
+
+def test_named_queue_dequeue_many_waits() -> None:
+    q: NamedQueue[int] = NamedQueue()
+    timer = threading.Timer(0.05, q.enqueue, args=("a", 1))
+    timer.start()
+    assert q.dequeue_many(timeout=5) == [("a", 1)]
+    assert q.dequeue_many(timeout=0.01) == []
+    timer.join()
+
+
+def test_named_cache_lru() -> None:
+    evicted: list[tuple[str, int, str]] = []
+    cache: NamedCache[int] = NamedCache(max_size=2, on_evict=lambda *args: evicted.append(args))
+    cache.enqueue_many([("a", 1), ("b", 2)])
+    assert cache["a"] == 1  # "a" becomes the most recently used
+    cache.enqueue("c", 3)  # evicts "b", not "a"
+    assert cache.keys() == ["a", "c"] and evicted == [("b", 2, "size")]
+    assert cache.get("b") is None and cache.get("b", -1) == -1
+    with pytest.raises(KeyError):
+        _ = cache["b"]
+    cache.enqueue("a", 10)  # a replacement is not an eviction
+    assert cache.stats() == CacheStats(hits=1, misses=3, evictions=1, size=2, weight=cache.weight)
+
+
+def test_named_cache_ttl() -> None:
+    evicted: list[tuple[str, int, str]] = []
+    cache: NamedCache[int] = NamedCache(ttl=0.05, on_evict=lambda *args: evicted.append(args))
+    cache.enqueue("a", 1)
+    cache.enqueue("b", 2, ttl=10)
+    cache.enqueue("c", 3)
+    assert "a" in cache and cache["a"] == 1
+    time.sleep(0.06)
+    assert "a" not in cache and cache.get("a") is None  # expired on lookup
+    assert cache.expire() == 1  # "c"
+    assert cache.keys() == ["b"] and evicted == [("a", 1, "expired"), ("c", 3, "expired")]
+
+
+def test_named_cache_ttl_reads() -> None:
+    evicted: list[str] = []
+    cache: NamedCache[int] = NamedCache(ttl=0.05, on_evict=lambda name, *_: evicted.append(name))
+    cache.enqueue_many([("a", 1), ("b", 2)])
+    cache.enqueue("c", 3, ttl=10)
+    time.sleep(0.06)
+    assert len(cache) == 1 and evicted == ["a", "b"]  # expired entries are neither counted nor returned
+    assert cache.items() == [("c", 3)] and list(cache) == [("c", 3)]
+    cache.enqueue("d", 4)
+    time.sleep(0.06)
+    assert cache.dequeue_many() == [("c", 3)] and cache.dequeue() is None and evicted == ["a", "b", "d"]
+
+
+def test_named_cache_weight_containers() -> None:
+    array = np.zeros(100)  # 800 bytes
+    cache: NamedCache[typing.Any] = NamedCache(max_weight=2000)
+    cache.enqueue("a", (array, np.zeros(50)))
+    assert 1200 < cache.weight < 1300  # the arrays' data, plus the tuple itself
+    cache.enqueue("b", {"x": [array, array]})  # the same array is counted once
+    assert cache.keys() == ["b"] and 800 < cache.weight < 1200
+
+
+def test_named_cache_weight() -> None:
+    array = np.zeros(100)  # 800 bytes
+    evicted: list[str] = []
+    cache: NamedCache[np.ndarray] = NamedCache(max_weight=2000, on_evict=lambda name, *_: evicted.append(name))
+    cache.enqueue_many([("a", array), ("b", array)])
+    assert cache.weight == 1600
+    cache.get("a")
+    cache.enqueue("c", array)  # 2400 > 2000: evicts the least recently used ("b")
+    assert cache.keys() == ["a", "c"] and evicted == ["b"] and cache.weight == 1600
+    cache.update("a", np.zeros(50))
+    assert cache.weight == 1200
+    cache.enqueue("d", np.zeros(1000))  # heavier than the bound on its own: evicts everything, itself included
+    assert len(cache) == 0 and cache.weight == 0 and evicted == ["b", "a", "c", "d"]
+    assert cache.dequeue() is None
+
+
+def test_named_cache_callback_reenters() -> None:
+    seen: list[tuple[str, list[str]]] = []
+    cache: NamedCache[int] = NamedCache(max_size=1, on_evict=lambda name, *_: seen.append((name, cache.keys())))
+    cache.enqueue("a", 1)
+    cache.enqueue("b", 2)  # the callback runs after the lock is released, so it may use the cache
+    assert seen == [("a", ["b"])]
+
+
+def test_dl_to_ld() -> None:
+    dl = {"x": np.array([1.0, 2.0]), "label": ("a", "b"), "color": "k", "lw": 2}
+    expected = [{"x": 1.0, "label": "a", "color": "k", "lw": 2}, {"x": 2.0, "label": "b", "color": "k", "lw": 2}]
+    assert dl_to_ld(dl) == expected and type(expected[0]["x"]) is float  # pylint: disable=unidiomatic-typecheck
+    view = dl_to_ld(dl, lazy=True)
+    assert isinstance(view, RecordsView) and len(view) == 2
+    assert list(view) == expected and view[-1] == expected[1] and view[1:] == expected[1:]
+    assert type(view[0]["x"]) is float  # pylint: disable=unidiomatic-typecheck
+    with pytest.raises(IndexError):
+        _ = view[2]
+
+    assert dl_to_ld({}) == []
+    assert dl_to_ld({"color": "k", "lw": 2}) is None  # scalars only
+    assert dl_to_ld({"a": [1, 2], "b": [1]}) is None  # different lengths
+    assert dl_to_ld({"a": np.zeros((2, 2))}) is None  # not 1-dimensional
+    assert isinstance(dl_to_ld({"a": np.arange(100_000)}), RecordsView)
+
+
+def test_ld_to_dl() -> None:
+    assert ld_to_dl([{"a": 1, "b": 2}, {"b": 3, "a": 4}]) == {"a": [1, 4], "b": [2, 3]}
+    dl = ld_to_dl(iter([{"a": 1}, {"b": 2}]))  # missing keys are filled with nan
+    assert list(dl) == ["a", "b"] and dl["a"][0] == 1 and np.isnan(dl["a"][1]) and np.isnan(dl["b"][0])
+    assert ld_to_dl([]) == {}
+    columns = {"x": np.arange(5), "label": list("abcde")}
+    assert ld_to_dl(dl_to_ld(columns, lazy=True) or []) == {"x": list(range(5)), "label": list("abcde")}
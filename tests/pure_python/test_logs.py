@@ -0,0 +1,118 @@
+import json
+import logging
+import pathlib
+import time
+from unittest import mock
+
+import pytest
+
+from liron_utils.pure_python import JsonLinesHandler, Logger, SpanStats
+
+
+class _Model:
+    def fit(self, logger: Logger) -> None:
+        for epoch in range(3):
+            logger.info("epoch %d", epoch)
+        try:
+            raise ValueError("diverged")
+        except ValueError:
+            logger.log("failed", level=logging.ERROR, exc_info=True)
+
+
+@pytest.mark.parametrize("asynchronous", [False, True])
+def test_logger(tmp_path: pathlib.Path, asynchronous: bool) -> None:
+    file_name = str(tmp_path / f"run_{asynchronous}")
+    with Logger(file_name, asynchronous=asynchronous) as logger:
+        logger.debug("filtered out")
+        _Model().fit(logger)
+
+    text = pathlib.Path(file_name + ".log").read_text(encoding="utf-8")
+    lines = [line for line in text.splitlines() if " >> " in line]
+    assert [line.split(" >> ")[1] for line in lines[1:-1]] == ["epoch 0", "epoch 1", "epoch 2", "failed"]
+    assert all("_Model.fit" in line and "test_logs.py" in line for line in lines[1:-1])
+    assert "ValueError: diverged" in text and "filtered out" not in text
+
+
+def test_json_lines_handler(tmp_path: pathlib.Path) -> None:
+    json_file_name = str(tmp_path / "run.jsonl")
+    with Logger(str(tmp_path / "run"), json_file_name=json_file_name, json_kw={"batch_size": 4}) as logger:
+        t0 = logger.info("start")
+        logger.info("done in {} sec", time_log=t0, extra={"epoch": 3})
+        assert not pathlib.Path(json_file_name).exists()  # nothing written before a batch is full
+        _Model().fit(logger)
+
+    records = [json.loads(line) for line in pathlib.Path(json_file_name).read_text(encoding="utf-8").splitlines()]
+    assert [r["message"] for r in records[1:-1]] == ["start", mock.ANY, "epoch 0", "epoch 1", "epoch 2", "failed"]
+    assert records[2]["epoch"] == 3 and records[2]["elapsed"] >= 0
+    assert records[3]["level"] == "INFO" and records[3]["class_func"] == "_Model.fit"
+    assert records[3]["file"] == __file__ and isinstance(records[3]["line"], int)
+    assert "ValueError: diverged" in records[-2]["exception"]
+
+
+def test_json_lines_handler_no_file_level(tmp_path: pathlib.Path) -> None:
+    json_file_name = str(tmp_path / "run.jsonl")
+    with Logger(str(tmp_path / "run"), min_level_file=None, json_file_name=json_file_name) as logger:
+        logger.debug("details")
+    records = [json.loads(line) for line in pathlib.Path(json_file_name).read_text(encoding="utf-8").splitlines()]
+    assert "details" in [r["message"] for r in records]
+    assert not pathlib.Path(tmp_path / "run.log").read_text(encoding="utf-8")  # no plain-file output
+
+
+def test_json_lines_handler_rotation(tmp_path: pathlib.Path) -> None:
+    handler = JsonLinesHandler(str(tmp_path / "run.jsonl"), batch_size=2, max_bytes=1000, backup_count=2)
+    logger = logging.getLogger("test_json_lines_handler_rotation")
+    logger.propagate = False
+    logger.addHandler(handler)
+    for i in range(100):
+        logger.warning("message %d", i)
+    logger.removeHandler(handler)
+    handler.close()
+
+    files = sorted(tmp_path.iterdir())
+    assert [f.name for f in files] == ["run.jsonl", "run.jsonl.1", "run.jsonl.2"]
+    line_size = len(files[0].read_text(encoding="utf-8").splitlines()[-1]) + 1
+    assert all(f.stat().st_size < 1000 + 2 * line_size for f in files)  # rotated before the batch that crossed 1000
+    assert json.loads(files[0].read_text(encoding="utf-8").splitlines()[-1])["message"] == "message 99"
+
+
+@pytest.mark.parametrize("profiler", ["sampling", "cprofile"])
+def test_logger_spans(tmp_path: pathlib.Path, profiler: str) -> None:
+    file_name = str(tmp_path / "run")
+    with Logger(file_name) as logger:
+
+        @logger.timed
+        def step() -> None:
+            time.sleep(0.001)
+
+        with logger.span("fit"):
+            for _ in range(3):
+                with logger.span("epoch", profile_threshold=0.05, profiler=profiler):
+                    step()
+            time.sleep(0.1)
+        with logger.span("slow", profile_threshold=0.01, profiler=profiler):
+            time.sleep(0.1)
+    spans = list(logger.spans)[:-1]  # w/o "slow"
+
+    assert [r.path for r in spans] == ["fit/epoch/step", "fit/epoch"] * 3 + ["fit"]
+    assert [r.parent for r in spans[:2]] == ["fit/epoch", "fit"] and spans[-1].parent is None
+    fit = spans[-1]
+    assert fit.duration >= 0.1 and fit.self_time == pytest.approx(fit.duration - sum(r.duration for r in spans[1:-1:2]))
+    assert logger.span_stats["fit"].self_time == fit.self_time
+
+    report = logger.span_report().splitlines()
+    assert [line.split()[:2] for line in report[1:]] == [["fit", "1"], ["epoch", "3"], ["step", "3"], ["slow", "1"]]
+    text = pathlib.Path(file_name + ".log").read_text(encoding="utf-8")
+    assert "Spans:" in text and "Span 'slow' took" in text
+    assert "Span 'fit/epoch' took" not in text  # no epoch crossed the profiling threshold
+
+
+def test_logger_spans_bounded(tmp_path: pathlib.Path) -> None:
+    with Logger(str(tmp_path / "run"), max_spans=10) as logger:
+        for _ in range(3 * SpanStats.SAMPLE_SIZE):
+            with logger.span("step"):
+                pass
+    assert len(logger.spans) == 10
+    stats = logger.span_stats["step"]
+    assert stats.count == 3 * SpanStats.SAMPLE_SIZE and len(stats.sample) == SpanStats.SAMPLE_SIZE
+    assert sum(stats.decades.values()) == stats.count and stats.max == max(stats.max, *stats.sample)
+    assert logger.span_report().splitlines()[1].split()[:2] == ["step", str(stats.count)]
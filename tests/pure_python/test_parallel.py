@@ -0,0 +1,360 @@
+import asyncio
+import collections
+import functools
+import io
+import itertools
+import json
+import os
+import pathlib
+import time
+import typing
+
+import numpy as np
+import pytest
+
+from liron_utils.pure_python import (
+    ParallelAbortedError,
+    TaskError,
+    get_pool,
+    make_pool,
+    parallel,
+    parallel_async,
+    parallel_async_iter,
+    parallel_imap,
+    parallel_map,
+    parallel_threading,
+    report_progress,
+)
+
+
+def _power(it: int, base: int = 1) -> int:
+    return int(base**it)
+
+
+def _fail_on_three(it: int) -> int:
+    if it == 3:
+        raise ValueError("three")
+    return it
+
+
+def _scale_row(it: int, mat: np.ndarray) -> np.ndarray:
+    assert not mat.flags.writeable  # workers get read-only views of the shared block
+    return np.asarray(mat[it] * it)
+
+
+def _shared_blocks() -> set[str]:
+    return {name for name in os.listdir("/dev/shm") if name.startswith("psm_")} if os.path.isdir("/dev/shm") else set()
+
+
+def _now(_it: int) -> float:
+    return time.monotonic()
+
+
+def _report_halfway(it: int) -> int:
+    report_progress(1, 2)
+    time.sleep(0.3)
+    return it
+
+
+def _tqdm_off() -> dict[str, typing.Any]:
+    return {"disable": True}
+
+
+def test_parallel_map() -> None:
+    assert parallel_map(_power, range(10), num_processes=2, base=2, tqdm_kw=_tqdm_off()) == [2**i for i in range(10)]
+
+
+@pytest.mark.parametrize("start_method", ["fork", "forkserver", "spawn"])
+def test_parallel_map_start_method(start_method: str) -> None:
+    out = parallel_map(_power, range(5), num_processes=1, start_method=start_method, base=2, tqdm_kw=_tqdm_off())
+    assert out == [2**i for i in range(5)]
+
+
+def test_shared_pool_is_reused() -> None:
+    pool = get_pool(1)
+    assert get_pool(1) is pool
+    for base in (2, 3):  # the pool must survive being used by a call
+        assert parallel_map(_power, range(5), pool=pool, base=base, tqdm_kw=_tqdm_off()) == [base**i for i in range(5)]
+        assert list(parallel_imap(_power, range(5), pool=pool, base=base, tqdm_kw=_tqdm_off())) == [
+            base**i for i in range(5)
+        ]
+
+
+def test_make_pool_context_manager() -> None:
+    with make_pool(1, start_method="fork") as pool:
+        assert parallel_map(_power, range(3), pool=pool, base=2, tqdm_kw=_tqdm_off()) == [1, 2, 4]
+
+
+@pytest.mark.parametrize("start_method", ["fork", "spawn"])
+def test_parallel_map_shared_memory(monkeypatch: pytest.MonkeyPatch, start_method: str) -> None:
+    monkeypatch.setattr(parallel, "SHARED_MEMORY_MIN_NBYTES", 64)
+    mat = np.arange(40 * 100, dtype=np.float64).reshape(40, 100)
+    before = _shared_blocks()
+    out = parallel_map(_scale_row, range(40), num_processes=1, start_method=start_method, mat=mat, tqdm_kw=_tqdm_off())
+    rows = [typing.cast(np.ndarray, row) for row in out]
+    np.testing.assert_array_equal(np.stack(rows), mat * np.arange(40)[:, None])
+    assert all(row.flags.writeable and row.flags.owndata for row in rows)
+    assert _shared_blocks() == before  # kwargs and result blocks were all unlinked
+
+
+def _row_or_fail(it: int) -> np.ndarray:
+    if it == 0:
+        raise ValueError("zero")
+    time.sleep(0.05)
+    return np.full(100, it, dtype=np.float64)
+
+
+def test_parallel_map_shared_memory_abort_with_pool(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(parallel, "SHARED_MEMORY_MIN_NBYTES", 64)
+    before = _shared_blocks()
+    with make_pool(1, start_method="fork") as pool:
+        with pytest.warns(UserWarning), pytest.raises(ParallelAbortedError):
+            parallel_map(_row_or_fail, range(4), pool=pool, fail_fast=True, tqdm_kw=_tqdm_off())
+        pool.apply(_power, (0,))  # the pool outlives the call: wait for the tasks still queued in it
+    assert _shared_blocks() == before  # results produced after the abort were freed too
+
+
+def _shift_records(it: int, records: np.ndarray) -> np.ndarray:
+    out = records.copy()
+    out["t"] += it
+    return out
+
+
+@pytest.mark.parametrize("start_method", ["fork", "spawn"])
+def test_parallel_map_shared_memory_structured(monkeypatch: pytest.MonkeyPatch, start_method: str) -> None:
+    monkeypatch.setattr(parallel, "SHARED_MEMORY_MIN_NBYTES", 64)
+    records = np.zeros(100, dtype=[("t", np.float64), ("channel", np.int32), ("flag", "?")])
+    records["t"] = np.arange(100)
+    out = parallel_map(
+        _shift_records, range(3), num_processes=1, start_method=start_method, records=records, tqdm_kw=_tqdm_off()
+    )
+    for it, shifted in enumerate(out):
+        assert shifted is not None and shifted.dtype == records.dtype  # field names and types survive, both ways
+        np.testing.assert_array_equal(shifted["t"], records["t"] + it)
+
+
+@pytest.mark.parametrize("parallel_func", [parallel_map, parallel_threading])
+def test_parallel_errors_are_collected(parallel_func: typing.Callable[..., typing.Any]) -> None:
+    with pytest.warns(UserWarning, match="Exception at index 3"):
+        out = parallel_func(_fail_on_three, range(6), tqdm_kw=_tqdm_off())
+    assert out == [0, 1, 2, None, 4, 5]
+    assert not out.ok and list(out.errors) == [3]
+    assert isinstance(out.errors[3].exception, ValueError)
+    assert "_fail_on_three" in out.errors[3].traceback  # worker-side frames are kept
+    assert out.durations[3] is None and all(d is not None and d >= 0 for i, d in enumerate(out.durations) if i != 3)
+    with pytest.raises(ValueError, match="three"):
+        out.raise_first()
+
+
+@pytest.mark.parametrize("parallel_func", [parallel_map, parallel_threading])
+def test_parallel_fail_fast(parallel_func: typing.Callable[..., typing.Any]) -> None:
+    with pytest.warns(UserWarning), pytest.raises(ParallelAbortedError) as exc_info:
+        parallel_func(_fail_on_three, range(6), fail_fast=True, tqdm_kw=_tqdm_off())
+    assert isinstance(exc_info.value.__cause__, ValueError)
+    assert list(exc_info.value.result.errors) == [3]
+
+    with pytest.warns(UserWarning):  # a single failure is within the budget
+        assert parallel_func(_fail_on_three, range(6), max_failures=1, tqdm_kw=_tqdm_off()).errors.keys() == {3}
+
+
+@pytest.mark.parametrize("parallel_func", [parallel_map, parallel_threading])
+def test_parallel_telemetry(parallel_func: typing.Callable[..., typing.Any], tmp_path: pathlib.Path) -> None:
+    out = parallel_func(_power, range(20), base=2, telemetry=True, tqdm_kw=_tqdm_off())
+    assert out == [2**i for i in range(20)]
+    assert sorted(r.task for r in out.telemetry.records) == list(range(20))
+    assert all(r.submitted <= r.started <= r.finished and r.cpu >= 0 for r in out.telemetry.records)
+
+    summary = out.telemetry.summary()
+    assert summary["tasks"] == 20 and summary["throughput"] > 0
+    assert summary["latency"]["p50"] <= summary["latency"]["p95"] <= summary["latency"]["p99"]
+    assert set(summary["idle_fraction"]) == set(out.telemetry.workers())
+    assert all(0 <= f <= 1 for f in summary["idle_fraction"].values())
+
+    out.telemetry.dump_chrome_trace(str(tmp_path / "trace.json"))
+    events = json.loads((tmp_path / "trace.json").read_text(encoding="utf-8"))["traceEvents"]
+    assert sum(e["ph"] == "X" for e in events) == 20
+
+
+def test_parallel_map_longest_first() -> None:
+    # A single worker runs tasks in submission order, which is what `cost` controls
+    cost = [1.0, 5.0, None, 3.0]
+    out = parallel_map(_now, range(4), num_processes=1, cost=cost, tqdm_kw=_tqdm_off())
+    assert sorted(range(4), key=lambda i: typing.cast(float, out[i])) == [2, 1, 3, 0]
+
+    out = parallel_map(_now, range(4), num_processes=1, cost=lambda it: it, tqdm_kw=_tqdm_off())
+    assert sorted(range(4), key=lambda i: typing.cast(float, out[i])) == [3, 2, 1, 0]
+
+
+def test_chunk_sizer_shrinks_at_tail() -> None:
+    sizer = parallel._ChunkSizer(None, total=1000, num_processes=4)  # pylint: disable=protected-access
+    sizer.size = sizer.max_size
+    sizes = []
+    while sizer.consumed < 1000:
+        sizes.append(sizer.claim())
+    assert sizes[0] == 63 and sizes[-1] == 1
+    assert sizes == sorted(sizes, reverse=True)
+
+
+def test_parallel_threading() -> None:
+    assert parallel_threading(_power, range(10), num_threads=4, base=3, tqdm_kw=_tqdm_off()) == [
+        3**i for i in range(10)
+    ]
+
+
+def test_parallel_imap_ordered() -> None:
+    out = list(parallel_imap(_power, range(1000), num_processes=2, base=1, tqdm_kw=_tqdm_off()))
+    assert out == [1] * 1000
+
+
+def test_parallel_imap_consumes_generator_lazily() -> None:
+    consumed = itertools.count()
+    source = (next(consumed) for _ in itertools.count())  # endless
+    out = parallel_imap(_power, source, num_processes=2, chunksize=4, max_in_flight=3, tqdm_kw=_tqdm_off())
+    assert list(itertools.islice(out, 10)) == [1] * 10
+    out.close()
+    assert next(consumed) <= 10 + 4 * 3  # at most max_in_flight chunks were read ahead
+
+
+def test_parallel_imap_unordered() -> None:
+    out = parallel_imap(_power, range(200), num_processes=2, ordered=False, base=2, tqdm_kw=_tqdm_off())
+    assert sorted(out) == [2**i for i in range(200)]
+
+
+def test_parallel_imap_raises() -> None:
+    with pytest.raises(ValueError, match="three"):
+        list(parallel_imap(_fail_on_three, range(10), num_processes=2, tqdm_kw=_tqdm_off()))
+
+
+def test_parallel_imap_empty() -> None:
+    assert not list(parallel_imap(_power, [], tqdm_kw=_tqdm_off()))
+
+
+async def _sleep_power(it: int, base: int = 1, delay: float = 0.0) -> int:
+    await asyncio.sleep(delay * (5 - it % 5))  # later items finish first
+    return int(base**it)
+
+
+async def _afail_on_three(it: int) -> int:
+    return _fail_on_three(it)
+
+
+def test_parallel_async_ordered() -> None:
+    out = asyncio.run(parallel_async(_sleep_power, range(10), base=2, delay=0.01, tqdm_kw=_tqdm_off()))
+    assert out == [2**i for i in range(10)]
+
+
+def test_parallel_async_iter() -> None:
+    async def collect() -> list[tuple[int, typing.Any]]:
+        pairs = parallel_async_iter(_sleep_power, range(5), base=2, delay=0.01, tqdm_kw=_tqdm_off())
+        return [pair async for pair in pairs]
+
+    assert asyncio.run(collect()) == [(4, 16), (3, 8), (2, 4), (1, 2), (0, 1)]  # completion order, with input indices
+
+    async def collect_failures() -> list[tuple[int, typing.Any]]:
+        return [pair async for pair in parallel_async_iter(_afail_on_three, range(5), tqdm_kw=_tqdm_off())]
+
+    out = dict(asyncio.run(collect_failures()))
+    assert {i: v for i, v in out.items() if i != 3} == {0: 0, 1: 1, 2: 2, 4: 4}
+    assert isinstance(out[3], TaskError) and isinstance(out[3].exception, ValueError)
+
+
+def test_parallel_async_concurrency_bound() -> None:
+    in_flight = max_in_flight = 0
+
+    async def track(it: int) -> int:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.001)
+        in_flight -= 1
+        return it
+
+    out = asyncio.run(parallel_async(track, (i for i in range(100)), concurrency=7, tqdm_kw=_tqdm_off()))
+    assert out == list(range(100))
+    assert max_in_flight == 7
+
+
+def test_parallel_async_failures() -> None:
+    with pytest.warns(UserWarning, match="index 3"):
+        out = asyncio.run(parallel_async(_afail_on_three, range(5), tqdm_kw=_tqdm_off()))
+    assert out == [0, 1, 2, None, 4]
+    assert list(out.errors) == [3] and isinstance(out.errors[3].exception, ValueError)
+    assert out.durations[3] is None and all(d is not None and d >= 0 for i, d in enumerate(out.durations) if i != 3)
+
+    with pytest.warns(UserWarning, match="index 1"):
+        out = asyncio.run(parallel_async(_sleep_power, [4, 0], delay=0.1, timeout=0.3, tqdm_kw=_tqdm_off()))
+    assert out == [1, None] and isinstance(out.errors[1].exception, TimeoutError)
+
+    for iterable in (range(6), (i for i in range(6))):  # sized, and consumed lazily
+        with pytest.warns(UserWarning, match="index 3"), pytest.raises(ParallelAbortedError) as exc_info:
+            asyncio.run(parallel_async(_afail_on_three, iterable, concurrency=1, fail_fast=True, tqdm_kw=_tqdm_off()))
+        assert exc_info.value.result == [0, 1, 2, None, None, None]  # aligned with the input; 4 and 5 never ran
+
+
+def test_parallel_async_retries() -> None:
+    attempts: collections.Counter[int] = collections.Counter()
+
+    async def flaky(it: int) -> int:
+        attempts[it] += 1
+        if attempts[it] < 3:
+            raise ConnectionError("flaky")
+        return it
+
+    assert asyncio.run(parallel_async(flaky, range(4), retries=2, retry_delay=0.001, tqdm_kw=_tqdm_off())) == [
+        0,
+        1,
+        2,
+        3,
+    ]
+    assert set(attempts.values()) == {3}
+
+
+def test_parallel_map_checkpoint(tmp_path: pathlib.Path) -> None:
+    checkpoint = str(tmp_path / "ckpt")
+    with pytest.warns(UserWarning):
+        first = parallel_map(_fail_on_three, range(6), num_processes=1, checkpoint=checkpoint, tqdm_kw=_tqdm_off())
+    assert first == [0, 1, 2, None, 4, 5]
+
+    # Simulate a crash in the middle of writing a record: the torn tail is dropped on resume
+    with open(tmp_path / "ckpt" / "results.bin", "ab") as f:
+        f.write(b"\x07\x00\x00")
+    # Only index 3 (previously failed) is re-run; the rest, timings included, come from the checkpoint
+    with pytest.warns(UserWarning, match="index 3"):
+        resumed = parallel_map(
+            _fail_on_three, range(6), num_processes=1, checkpoint=checkpoint, resume=True, tqdm_kw=_tqdm_off()
+        )
+    assert resumed == [0, 1, 2, None, 4, 5] and list(resumed.errors) == [3]
+    assert resumed.durations == first.durations
+
+    with pytest.raises(FileExistsError, match="resume=True"):
+        parallel_map(_fail_on_three, range(6), checkpoint=checkpoint, tqdm_kw=_tqdm_off())
+    with pytest.raises(ValueError, match="another run"):
+        parallel_map(_power, range(6), checkpoint=checkpoint, resume=True, tqdm_kw=_tqdm_off())
+    with pytest.raises(ValueError, match="another run"):  # same function and length, other inputs
+        parallel_map(_fail_on_three, range(1, 7), checkpoint=checkpoint, resume=True, tqdm_kw=_tqdm_off())
+
+
+def test_parallel_map_checkpoint_inputs(tmp_path: pathlib.Path) -> None:
+    checkpoint = str(tmp_path / "ckpt")
+    square = functools.partial(_power, base=2)
+    assert parallel_map(square, range(4), num_processes=1, checkpoint=checkpoint, tqdm_kw=_tqdm_off()) == [1, 2, 4, 8]
+    resumed = parallel_map(square, range(4), num_processes=1, checkpoint=checkpoint, resume=True, tqdm_kw=_tqdm_off())
+    assert resumed == [1, 2, 4, 8]
+    with pytest.raises(ValueError, match="another run"):  # partial arguments count as inputs
+        parallel_map(
+            functools.partial(_power, base=3), range(4), checkpoint=checkpoint, resume=True, tqdm_kw=_tqdm_off()
+        )
+    with pytest.raises(ValueError, match="another run"):  # and so do kwargs
+        parallel_map(_power, range(4), checkpoint=checkpoint, resume=True, tqdm_kw=_tqdm_off(), base=2)
+
+
+def test_parallel_map_task_progress() -> None:
+    assert _report_halfway(0) == 0  # a no-op outside of parallel_map
+
+    blocks = _shared_blocks()
+    out = io.StringIO()
+    result = parallel_map(_report_halfway, range(2), num_processes=1, task_progress=True, tqdm_kw={"file": out})
+    assert result == [0, 1]
+    assert "0.5/2" in out.getvalue() and "1.5/2" in out.getvalue()  # the running task counted as half done
+    assert "2/2" in out.getvalue().rsplit("\r", maxsplit=1)[-1]
+    assert _shared_blocks() == blocks
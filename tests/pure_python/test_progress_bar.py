@@ -0,0 +1,70 @@
+import io
+
+import pytest
+
+from liron_utils.pure_python import (
+    BaseProgressBar,
+    EnhancedTextProgressBar,
+    TextProgressBar,
+    tqdm_,
+)
+
+
+def _rendered(out: io.StringIO) -> str:
+    return out.getvalue().rsplit("\r", maxsplit=1)[-1]
+
+
+def test_tqdm_counts() -> None:
+    out = io.StringIO()
+    assert list(tqdm_(range(100_000), file=out, desc="work")) == list(range(100_000))
+    assert "100000/100000" in _rendered(out) and "work" in _rendered(out)
+
+    out = io.StringIO()
+    for i in tqdm_(iter(range(100)), file=out):  # no len(): counted up to the item in progress
+        if i == 41:
+            break
+    assert "41it" in _rendered(out)
+
+
+def test_tqdm_callable_desc_is_rate_limited() -> None:
+    calls: list[int] = []
+
+    def desc(i: int) -> str:
+        calls.append(i)
+        return f"item {i}"
+
+    out = io.StringIO()
+    assert sum(tqdm_(range(100_000), file=out, desc=desc, postfix=lambda i: {"i": i})) == sum(range(100_000))
+    assert 1 <= len(calls) < 1000
+    assert calls == sorted(calls)
+    assert f"item {calls[-1]}" in _rendered(out) and f"i={calls[-1]}" in _rendered(out)
+
+
+def test_tqdm_disable() -> None:
+    out = io.StringIO()
+    assert list(tqdm_(range(10), file=out, disable=True, desc=lambda i: str(1 / 0))) == list(range(10))
+    assert out.getvalue() == ""
+
+
+@pytest.mark.parametrize("bar_cls", [TextProgressBar, EnhancedTextProgressBar])
+def test_text_progress_bar_is_rate_limited(bar_cls: type[BaseProgressBar], capsys: pytest.CaptureFixture[str]) -> None:
+    pbar = bar_cls(100_000)
+    for _ in range(100_000):
+        pbar.update()
+    out = capsys.readouterr().out
+    assert len(out.replace("\r", "\n").splitlines()) < 20
+    assert "100" in out.replace("\r", "\n").splitlines()[-1]  # the last step is always rendered
+
+    pbar = bar_cls(10)
+    pbar.update(4)
+    pbar.update(6)
+    assert "100" in capsys.readouterr().out.replace("\r", "\n").splitlines()[-1]
+
+
+def test_time_remaining_est() -> None:
+    pbar = BaseProgressBar(1000)
+    pbar.n, pbar.rate = 500, 10.0
+    assert pbar.time_remaining_est(50) == "00:00:00:50"
+    pbar.rate = 0.001
+    assert pbar.time_remaining_est(50) == "05:18:53:20"
+    assert pbar.time_remaining_est(100) == "00:00:00:00"
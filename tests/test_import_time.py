@@ -0,0 +1,37 @@
+import os
+
+import pytest
+
+from tests._import_time import SUBPACKAGES, load_baseline, profile_subpackage
+
+# The baseline holds wall-clock times measured on one machine, so the guard is opt-in:
+#   LIRON_UTILS_IMPORT_TIME=1 pytest tests/test_import_time.py
+pytestmark = pytest.mark.skipif(
+    not os.environ.get("LIRON_UTILS_IMPORT_TIME"), reason="import-time guard is opt-in (set LIRON_UTILS_IMPORT_TIME=1)"
+)
+
+# A subpackage fails when its import time exceeds max(FACTOR * baseline, baseline + SLACK_SEC),
+# or when it starts pulling in a third-party package costing more than SLACK_SEC that the baseline doesn't list.
+REGRESSION_FACTOR = 2.0
+REGRESSION_SLACK_SEC = 0.2
+
+
+@pytest.mark.parametrize("name", SUBPACKAGES)
+def test_import_time_regression(name: str) -> None:
+    baseline = load_baseline()[name]
+    baseline_total = float(baseline["total"])  # type: ignore[arg-type]
+    baseline_third_party = baseline["third_party"]
+    assert isinstance(baseline_third_party, dict)
+    threshold = max(REGRESSION_FACTOR * baseline_total, baseline_total + REGRESSION_SLACK_SEC)
+
+    profile = profile_subpackage(name)
+    if profile.total > threshold:  # re-measure before failing; a single run is at the mercy of the scheduler
+        profile = profile_subpackage(name, repeat=3)
+
+    assert profile.total <= threshold, f"{name}: {profile.total:.3f}s > {threshold:.3f}s (baseline {baseline_total}s)"
+    new_third_party = {
+        root: cost
+        for root, cost in profile.third_party.items()
+        if root not in baseline_third_party and cost > REGRESSION_SLACK_SEC
+    }
+    assert not new_third_party, f"{name} now imports {new_third_party}"
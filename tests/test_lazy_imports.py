@@ -0,0 +1,71 @@
+import ast
+import re
+import subprocess
+import sys
+import typing
+
+import pytest
+
+import liron_utils
+
+# Cumulative `python -X importtime` cost of `import liron_utils` (eager loading used to take several seconds).
+COLD_START_BUDGET_SEC = 0.25
+
+HEAVY_MODULES = ("matplotlib", "scipy", "pandas", "sklearn", "sympy", "numba", "plotly", "uncertainties")
+
+
+def _run(code: str, *args: str) -> subprocess.CompletedProcess[str]:
+    return subprocess.run([sys.executable, *args, "-c", code], capture_output=True, text=True, check=True)
+
+
+def _loaded_heavy_modules(code: str) -> list[str]:
+    out = _run(f"import sys\n{code}\nprint(sorted(m for m in {HEAVY_MODULES!r} if m in sys.modules))")
+    return typing.cast(list[str], ast.literal_eval(out.stdout.strip().splitlines()[-1]))
+
+
+def test_import_is_lazy() -> None:
+    assert not _loaded_heavy_modules("import liron_utils")
+
+
+def test_pure_python_does_not_pull_scientific_stack() -> None:
+    assert not _loaded_heavy_modules("from liron_utils.pure_python import parallel_map")
+
+
+def test_graphics_root_does_not_import_backends() -> None:
+    assert not _loaded_heavy_modules("import liron_utils.graphics")
+
+
+def test_cold_start_budget() -> None:
+    err = _run("import liron_utils", "-X", "importtime").stderr
+    match = re.search(r"^import time:\s+\d+ \|\s+(\d+) \| liron_utils$", err, flags=re.MULTILINE)
+    assert match is not None, err
+    assert int(match.group(1)) * 1e-6 < COLD_START_BUDGET_SEC
+
+
+def test_attribute_access_imports_submodule() -> None:
+    assert liron_utils.signal_processing.movmean is liron_utils.signal_processing.filtering.movmean
+    assert "movmean" in dir(liron_utils.signal_processing)
+    assert "movmean" in liron_utils.signal_processing.__all__
+    assert "np" not in liron_utils.signal_processing.__all__  # imported names don't leak
+
+
+def test_star_submodule_attribute() -> None:
+    code = (
+        "import types, liron_utils\n"
+        "for sub in (liron_utils.pure_python.parallel, liron_utils.signal_processing.filtering):\n"
+        "    assert isinstance(sub, types.ModuleType), sub\n"
+        "assert liron_utils.pure_python.parallel_map is liron_utils.pure_python.parallel.parallel_map"
+    )
+    _run(code)  # a fresh interpreter, so no member of these submodules was touched before
+    assert "filtering" in dir(liron_utils.signal_processing)
+
+
+def test_unknown_attribute_raises() -> None:
+    with pytest.raises(AttributeError):
+        _ = liron_utils.pure_python.no_such_name
+    with pytest.raises(AttributeError):
+        _ = liron_utils.no_such_subpackage
+
+
+def test_version() -> None:
+    assert isinstance(liron_utils.__version__, str)